@@ -1,20 +1,625 @@
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, render_template, request, jsonify
+import heapq
+import json
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import numpy as np
 from copy import deepcopy
+import scipy.sparse as sp
+from scipy.linalg import cho_factor, cho_solve, lu_factor, lu_solve, qr
+from scipy.linalg.blas import dger
+from scipy.sparse.linalg import splu
+from scipy.optimize import linprog
 
 app = Flask(__name__)
 
+# Pool de processus de /solve/batch (voir get_executor)
+_executor = None
+
+# Sessions de résolution (/sessions) : durée de vie sans accès et mémoire totale des modèles
+SESSION_TTL = 1800
+SESSION_MEMORY_LIMIT = 256 * 1024 ** 2
+_sessions = OrderedDict()
+_sessions_lock = threading.Lock()
+
+
+class StandardFormMatrix:
+    """
+    Matrice de la forme standard [A | slacks | artificielles] sans matérialiser
+    les blocs identité.
+
+    Les colonnes d'écart et artificielles sont décrites par leur ligne (et leur
+    signe pour les écarts). A peut être dense (ndarray) ou creuse (CSC) : la
+    mémoire suit alors le nombre de coefficients non nuls de A.
+    """
+
+    def __init__(self, A, slack_rows, slack_signs, artificial_rows):
+        self.A = A.tocsc() if sp.issparse(A) else A
+        self.slack_rows = np.asarray(slack_rows, dtype=int)
+        self.slack_signs = np.asarray(slack_signs, dtype=float)
+        self.artificial_rows = np.asarray(artificial_rows, dtype=int)
+        self.n_structural = A.shape[1]
+        self.n_slack = len(self.slack_rows)
+        self.shape = (A.shape[0], self.n_structural + self.n_slack + len(self.artificial_rows))
+
+    @property
+    def is_sparse(self):
+        return sp.issparse(self.A)
+
+    def _logical(self, j):
+        """Ligne et coefficient de la colonne d'écart ou artificielle j"""
+        k = j - self.n_structural
+        if k < self.n_slack:
+            return self.slack_rows[k], self.slack_signs[k]
+        return self.artificial_rows[k - self.n_slack], 1.0
+
+    def column(self, j):
+        """Colonne j en vecteur dense de taille m"""
+        if j < self.n_structural:
+            if self.is_sparse:
+                return self.A[:, j].toarray().ravel()
+            return self.A[:, j].astype(float)
+        col = np.zeros(self.shape[0])
+        row, value = self._logical(j)
+        col[row] = value
+        return col
+
+    def columns(self, idx):
+        """Sous-matrice A_std[:, idx] (creuse CSC si A est creuse)"""
+        idx = np.asarray(idx, dtype=int)
+        structural = idx < self.n_structural
+        logical = [self._logical(j) for j in idx[~structural]]
+        if self.is_sparse:
+            rows = [r for r, _ in logical]
+            values = [v for _, v in logical]
+            L = sp.csc_matrix((values, (rows, np.where(~structural)[0])), shape=(self.shape[0], len(idx)))
+            S = self.A[:, idx[structural]].tocoo()
+            S = sp.csc_matrix((S.data, (S.row, np.where(structural)[0][S.col])), shape=L.shape)
+            return (L + S).tocsc()
+        B = np.zeros((self.shape[0], len(idx)))
+        B[:, structural] = self.A[:, idx[structural]]
+        for k, (row, value) in zip(np.where(~structural)[0], logical):
+            B[row, k] = value
+        return B
+
+    def rmatvec(self, y, idx=None):
+        """Produit A_std^T y, ou seulement A_std[:, idx]^T y"""
+        if idx is not None:
+            idx = np.asarray(idx, dtype=int)
+            structural = idx < self.n_structural
+            result = np.empty(len(idx))
+            result[structural] = self.A[:, idx[structural]].T @ y
+            logical = idx[~structural] - self.n_structural
+            rows = np.concatenate([self.slack_rows, self.artificial_rows])[logical]
+            values = np.concatenate([self.slack_signs, np.ones(len(self.artificial_rows))])[logical]
+            result[~structural] = values * y[rows]
+            return result
+        return np.concatenate([
+            self.A.T @ y,
+            self.slack_signs * y[self.slack_rows],
+            y[self.artificial_rows],
+        ])
+
+    def squared_norms(self):
+        """||a_j||² de chaque colonne (1 pour les colonnes d'écart et artificielles)"""
+        if self.is_sparse:
+            structural = np.asarray(self.A.multiply(self.A).sum(axis=0)).ravel()
+        else:
+            structural = np.sum(self.A ** 2, axis=0)
+        return np.concatenate([structural, np.ones(self.shape[1] - self.n_structural)])
+
+    def toarray(self):
+        return self.columns(np.arange(self.shape[1])).toarray() if self.is_sparse \
+            else self.columns(np.arange(self.shape[1]))
+
+
+class BasisFactorization:
+    """
+    Factorisation LU de la matrice de base B pour le simplexe révisé.
+
+    Les changements de base sont ajoutés comme matrices eta (forme produit
+    de l'inverse) : B_k^-1 = E_k ... E_1 B_0^-1. Après `refactor_frequency`
+    mises à jour, la base est refactorisée pour limiter l'erreur numérique.
+    """
+
+    def __init__(self, A, basis, refactor_frequency=50):
+        self.A = A
+        self.refactor_frequency = refactor_frequency
+        self.refactor(basis)
+
+    def refactor(self, basis):
+        """Recalculer la factorisation LU de B = A[:, basis]"""
+        B = self.A.columns(basis)
+        if sp.issparse(B):
+            self.lu = splu(B)
+        else:
+            self.lu = lu_factor(B)
+        self.etas = []
+
+    def _lu_solve(self, rhs, trans=0):
+        if isinstance(self.lu, tuple):
+            return lu_solve(self.lu, rhs, trans=trans)
+        return self.lu.solve(rhs, trans='T' if trans else 'N')
+
+    def needs_refactor(self):
+        return len(self.etas) >= self.refactor_frequency
+
+    def ftran(self, a):
+        """Résoudre B x = a"""
+        x = self._lu_solve(a)
+        for r, alpha in self.etas:
+            x_r = x[r] / alpha[r]
+            x -= x_r * alpha
+            x[r] = x_r
+        return x
+
+    def btran(self, c):
+        """Résoudre y^T B = c^T"""
+        y = np.array(c, dtype=float)
+        for r, alpha in reversed(self.etas):
+            # Seule la composante r change : y_r = eta^T y
+            y[r] = (y[r] - (alpha @ y - alpha[r] * y[r])) / alpha[r]
+        return self._lu_solve(y, trans=1)
+
+    def update(self, r, alpha):
+        """Ajouter la matrice eta du pivot (ligne r, colonne entrante B^-1 a_q = alpha)"""
+        self.etas.append((r, alpha.copy()))
+
+class Pricing:
+    """
+    Règle de Dantzig : la variable entrante a le coût réduit le plus négatif.
+    
+    Classe de base des règles de prix. Une instance sert une phase à la fois :
+    reset() au début, select() à chaque itération, update() avant chaque pivot.
+    Les moteurs passent des fonctions plutôt que des tableaux, pour que chaque
+    règle ne calcule que ce dont elle a besoin :
+    - price(columns=None)  : coûts réduits de toutes les colonnes ou d'un sous-ensemble
+    - reference_norms()    : 1 + ||B^-1 a_j||² pour chaque colonne
+    - pivot_row()          : ligne du pivot alpha_r = (B^-1 A)_r
+    - column_dots()        : (B^-1 a_j)·alpha_q pour chaque colonne
+    """
+    
+    def reset(self, n_cols, reference_norms=None):
+        pass
+    
+    def select(self, price, epsilon):
+        """Colonne entrante, ou None si aucun coût réduit n'est négatif (optimum)"""
+        reduced_costs = price()
+        j = int(np.argmin(reduced_costs))
+        return j if reduced_costs[j] < -epsilon else None
+    
+    def update(self, entering, leaving, pivot_row_index, alpha, pivot_row, column_dots):
+        pass
+
+
+class DevexPricing(Pricing):
+    """
+    Devex (Forrest-Goldfarb) : maximise d_j² / w_j avec des poids de référence
+    w_j qui approchent la norme des arêtes, mis à jour à partir de la ligne du pivot.
+    """
+    
+    def reset(self, n_cols, reference_norms=None):
+        self.weights = np.ones(n_cols)
+    
+    def select(self, price, epsilon):
+        reduced_costs = price()
+        candidates = reduced_costs < -epsilon
+        if not candidates.any():
+            return None
+        scores = np.where(candidates, reduced_costs ** 2 / self.weights, -1.0)
+        return int(np.argmax(scores))
+    
+    def update(self, entering, leaving, pivot_row_index, alpha, pivot_row, column_dots):
+        alpha_rq = alpha[pivot_row_index]
+        ratio = pivot_row() / alpha_rq
+        w_q = self.weights[entering]
+        self.weights = np.maximum(self.weights, ratio ** 2 * w_q)
+        self.weights[leaving] = max(w_q / alpha_rq ** 2, 1.0)
+
+
+class SteepestEdgePricing(DevexPricing):
+    """
+    Plus forte pente : maximise d_j² / γ_j avec γ_j = 1 + ||B^-1 a_j||², mis à jour
+    exactement à chaque pivot (Goldfarb-Reid) :
+    γ_j = γ_j - 2 (α_rj/α_rq) (B^-1 a_j)·α_q + (α_rj/α_rq)² γ_q
+    """
+    
+    def reset(self, n_cols, reference_norms=None):
+        # Sans normes exactes (base de départ quelconque), la base courante sert de référence
+        self.weights = np.ones(n_cols) if reference_norms is None else reference_norms()
+    
+    def update(self, entering, leaving, pivot_row_index, alpha, pivot_row, column_dots):
+        alpha_rq = alpha[pivot_row_index]
+        ratio = pivot_row() / alpha_rq
+        gamma_q = 1.0 + alpha @ alpha
+        self.weights = np.maximum(self.weights - 2 * ratio * column_dots() + ratio ** 2 * gamma_q,
+                                  1.0 + ratio ** 2)
+        self.weights[leaving] = max(gamma_q / alpha_rq ** 2, 1.0)
+
+
+class PartialPricing(Pricing):
+    """
+    Prix partiel : les colonnes sont découpées en `segments` blocs parcourus
+    en tourniquet ; on prend le coût réduit le plus négatif du premier bloc qui
+    en contient un, sans calculer les coûts réduits des autres blocs.
+    """
+    
+    def __init__(self, segments=8):
+        self.segments = segments
+    
+    def reset(self, n_cols, reference_norms=None):
+        self.n_cols = n_cols
+        self.size = max(-(-n_cols // self.segments), 1)
+        self.start = 0
+    
+    def select(self, price, epsilon):
+        for _ in range(-(-self.n_cols // self.size)):
+            columns = np.arange(self.start, min(self.start + self.size, self.n_cols))
+            reduced_costs = price(columns)
+            j = int(np.argmin(reduced_costs))
+            if reduced_costs[j] < -epsilon:
+                return int(columns[j])
+            self.start = columns[-1] + 1 if columns[-1] + 1 < self.n_cols else 0
+        return None
+
+
+PRICING_RULES = {
+    'dantzig': Pricing,
+    'devex': DevexPricing,
+    'steepest_edge': SteepestEdgePricing,
+    'partial': PartialPricing,
+}
+
+
+def _magnitude_range(A, axis):
+    """Plus grand et plus petit |a_ij| non nul par ligne (axis=1) ou par colonne (axis=0), 0 si vide"""
+    magnitude = abs(A)
+    if sp.issparse(magnitude):
+        magnitude = sp.csr_matrix(magnitude)
+        magnitude.eliminate_zeros()
+        inverse = magnitude.copy()
+        inverse.data = 1.0 / inverse.data
+        largest = magnitude.max(axis=axis).toarray().ravel()
+        inverse_largest = inverse.max(axis=axis).toarray().ravel()
+    else:
+        largest = magnitude.max(axis=axis)
+        inverse = np.divide(1.0, magnitude, out=np.zeros_like(magnitude), where=magnitude > 0)
+        inverse_largest = inverse.max(axis=axis)
+    smallest = np.divide(1.0, inverse_largest, out=np.zeros_like(inverse_largest), where=inverse_largest > 0)
+    return largest, smallest
+
+
+class Presolve:
+    """
+    Réductions du problème (minimiser c·x, x >= 0) avant convert_to_standard_form,
+    et postsolve qui ramène la solution réduite aux variables d'origine.
+    
+    Réductions (chacune désactivable et comptée) :
+    - empty_rows        : lignes sans coefficient (vérifiées puis retirées)
+    - singleton_rows    : lignes à un seul coefficient, transformées en bornes
+    - fixed_variables   : variables de borne inférieure = borne supérieure
+    - duplicate_rows    : lignes proportionnelles, fusionnées
+    - dominated_columns : colonnes qu'il ne sert à rien d'augmenter (fixées à
+                          leur borne) ou qu'on peut augmenter sans fin (non borné)
+    
+    Les bornes inférieures sont éliminées par translation (x = l + x'). Les
+    bornes supérieures restantes redeviennent une seule contrainte x' <= u.
+    """
+    
+    REDUCTIONS = ('empty_rows', 'singleton_rows', 'fixed_variables', 'duplicate_rows', 'dominated_columns')
+    
+    def __init__(self, c, A, b, signs, reductions=None):
+        self.enabled = {name: True for name in self.REDUCTIONS}
+        for name, enabled in (reductions or {}).items():
+            if name not in self.enabled:
+                raise ValueError(f'Réduction inconnue: {name}')
+            self.enabled[name] = bool(enabled)
+        self.counts = dict.fromkeys(self.REDUCTIONS, 0)
+        
+        self.sparse_input = sp.issparse(A)
+        self.c = np.array(c, dtype=float)
+        self.A = sp.csr_matrix(A, dtype=float)
+        self.b = np.array(b, dtype=float)
+        self.signs = np.array(signs, dtype=object)
+        m, n = self.A.shape
+        self.row_active = np.ones(m, dtype=bool)
+        self.col_active = np.ones(n, dtype=bool)
+        self.upper = np.full(n, np.inf)
+        self.shift = np.zeros(n)  # x = shift + x' (bornes inférieures et variables fixées)
+        self.offset = 0.0         # c·shift
+        self.status = None        # 'infeasible' ou 'unbounded' si détecté
+        self.unbounded_column = False
+        self.epsilon = 1e-9
+    
+    def run(self):
+        """Appliquer les réductions jusqu'à stabilité ; retourne (c, A, b, signs) réduits"""
+        for _ in range(20):
+            changed = False
+            for name in self.REDUCTIONS:
+                if self.enabled[name] and self.status is None:
+                    changed |= getattr(self, f'_{name}')()
+            if not changed or self.status is not None:
+                break
+        return self._reduced_problem()
+    
+    def _active(self):
+        """Sous-matrice des lignes et colonnes actives (CSR)"""
+        return self.A[self.row_active][:, self.col_active]
+    
+    def _fix(self, j, value):
+        """Fixer x'_j = value et retirer la colonne"""
+        if value != 0:
+            self.b -= self.A[:, j].toarray().ravel() * value
+            self.offset += self.c[j] * value
+            self.shift[j] += value
+        self.col_active[j] = False
+    
+    def _infeasible(self):
+        self.status = 'infeasible'
+        return True
+    
+    def _violated_empty_row(self, i):
+        """Ligne sans coefficient actif (0 sign b_i) non satisfaite"""
+        sign, rhs = self.signs[i], self.b[i]
+        return ((sign == '<=' and rhs < -self.epsilon) or (sign == '>=' and rhs > self.epsilon)
+                or (sign == '=' and abs(rhs) > self.epsilon))
+    
+    def _empty_rows(self):
+        rows = np.where(self.row_active)[0]
+        nnz = (self._active() != 0).sum(axis=1).A.ravel()
+        changed = False
+        for i in rows[nnz == 0]:
+            if self._violated_empty_row(i):
+                return self._infeasible()
+            self.row_active[i] = False
+            self.counts['empty_rows'] += 1
+            changed = True
+        return changed
+    
+    def _singleton_rows(self):
+        rows = np.where(self.row_active)[0]
+        cols = np.where(self.col_active)[0]
+        active = self._active()
+        nnz = (active != 0).sum(axis=1).A.ravel()
+        changed = False
+        for k in np.where(nnz == 1)[0]:
+            i = rows[k]
+            row = active[k].toarray().ravel()
+            pos = int(np.flatnonzero(row)[0])
+            j, a = cols[pos], row[pos]
+            if not self.col_active[j]:
+                continue  # Colonne fixée plus tôt dans ce passage
+            bound = self.b[i] / a
+            sign = self.signs[i]
+            if a < 0 and sign != '=':
+                sign = '>=' if sign == '<=' else '<='
+            self.row_active[i] = False
+            self.counts['singleton_rows'] += 1
+            changed = True
+            if sign == '<=':
+                if bound < -self.epsilon:
+                    return self._infeasible()
+                self.upper[j] = min(self.upper[j], max(bound, 0.0))
+            elif sign == '>=':
+                if bound > self.epsilon:
+                    if bound > self.upper[j] + self.epsilon:
+                        return self._infeasible()
+                    self.upper[j] -= bound
+                    self._fix(j, bound)
+                    self.col_active[j] = True  # Translation seulement, la colonne reste
+            else:
+                if bound < -self.epsilon or bound > self.upper[j] + self.epsilon:
+                    return self._infeasible()
+                self._fix(j, max(bound, 0.0))
+                self.counts['fixed_variables'] += 1
+        return changed
+    
+    def _fixed_variables(self):
+        changed = False
+        for j in np.where(self.col_active & (self.upper <= self.epsilon))[0]:
+            if self.upper[j] < -self.epsilon:
+                return self._infeasible()
+            self._fix(j, 0.0)
+            self.counts['fixed_variables'] += 1
+            changed = True
+        return changed
+    
+    def _duplicate_rows(self):
+        rows = np.where(self.row_active)[0]
+        active = self._active()
+        groups = {}
+        scales = {}
+        for k, i in enumerate(rows):
+            row = active[k]
+            if row.nnz == 0:
+                continue
+            order = np.argsort(row.indices)
+            indices, data = row.indices[order], row.data[order]
+            scales[i] = 1.0 / data[0]
+            key = (tuple(indices), tuple(np.round(data * scales[i], 10)))
+            groups.setdefault(key, []).append(i)
+        
+        changed = False
+        row_scale = np.ones(self.A.shape[0])
+        for group in groups.values():
+            if len(group) < 2:
+                continue
+            lo, hi = -np.inf, np.inf
+            for i in group:
+                rhs, sign = self.b[i] * scales[i], self.signs[i]
+                if scales[i] < 0 and sign != '=':
+                    sign = '>=' if sign == '<=' else '<='
+                if sign in ('>=', '='):
+                    lo = max(lo, rhs)
+                if sign in ('<=', '='):
+                    hi = min(hi, rhs)
+            if lo > hi + self.epsilon * max(1.0, abs(hi)):
+                return self._infeasible()
+            
+            # Une ligne (=, <= ou >=) ou deux (lo <= ligne <= hi) remplacent le groupe
+            if np.isfinite(lo) and np.isfinite(hi) and hi - lo <= self.epsilon * max(1.0, abs(hi)):
+                kept = [(group[0], '=', hi)]
+            else:
+                kept = [(i, sign, rhs) for i, sign, rhs in zip(group, ('>=', '<='), (lo, hi)) if np.isfinite(rhs)]
+            if len(kept) == len(group):
+                continue
+            for i in group:
+                self.row_active[i] = False
+            for i, sign, rhs in kept:
+                self.row_active[i] = True
+                row_scale[i] = scales[i]
+                self.b[i] = rhs
+                self.signs[i] = sign
+            self.counts['duplicate_rows'] += len(group) - len(kept)
+            changed = True
+        if changed:
+            self.A = (sp.diags(row_scale) @ self.A).tocsr()
+        return changed
+    
+    def _dominated_columns(self):
+        active_rows = np.where(self.row_active)[0]
+        active = self.A[active_rows].tocsc()
+        signs = self.signs[active_rows]
+        le, ge, eq = signs == '<=', signs == '>=', signs == '='
+        positive, negative = active > 0, active < 0
+        
+        def count(mask, rows):
+            return np.asarray(mask[rows].sum(axis=0)).ravel()
+        
+        # Augmenter x_j aide la faisabilité (helps) ou la gêne (hurts) dans au moins une ligne
+        any_eq = count(positive, eq) + count(negative, eq)
+        helps = count(negative, le) + count(positive, ge) + any_eq
+        hurts = count(positive, le) + count(negative, ge) + any_eq
+        
+        changed = False
+        for j in np.where(self.col_active)[0]:
+            if self.c[j] >= 0 and helps[j] == 0:
+                self._fix(j, 0.0)
+            elif self.c[j] < 0 and hurts[j] == 0:
+                if np.isfinite(self.upper[j]):
+                    self._fix(j, self.upper[j])
+                else:
+                    # x_j peut augmenter sans fin : non borné si le reste est réalisable.
+                    # Les lignes que x_j aide sont toujours satisfaites (x_j assez grand) :
+                    # elles sont retirées, la réalisabilité du reste ne dépend pas de x_j
+                    self.unbounded_column = True
+                    self.row_active[active_rows[active[:, j].toarray().ravel() != 0]] = False
+                    self._fix(j, 0.0)
+            else:
+                continue
+            self.counts['dominated_columns'] += 1
+            changed = True
+        return changed
+    
+    def _reduced_problem(self):
+        self.rows = np.where(self.row_active)[0]
+        cols = np.where(self.col_active)[0]
+        bounded = cols[np.isfinite(self.upper[cols])]
+        A = self._active()
+        signs = list(self.signs[self.row_active])
+        b = self.b[self.row_active]
+        if bounded.size:
+            bound_rows = sp.csr_matrix((np.ones(bounded.size), (np.arange(bounded.size), np.searchsorted(cols, bounded))),
+                                       shape=(bounded.size, cols.size))
+            A = sp.vstack([A, bound_rows]).tocsr()
+            b = np.concatenate([b, self.upper[bounded]])
+            signs += ['<='] * bounded.size
+        self.n_rows, self.n_cols = A.shape
+        if not self.sparse_input:
+            A = A.toarray()
+        return self.c[cols], A, b, signs
+    
+    def trivial_result(self):
+        """
+        Résultat obtenu sans simplexe : non réalisable, non borné, ou problème
+        entièrement résolu par le presolve. None si le simplexe est nécessaire.
+        """
+        if self.status == 'infeasible':
+            return self.postsolve({'success': False, 'message': 'Aucune solution réalisable trouvée (presolve)'})
+        if self.n_rows and self.n_cols:
+            return None
+        if self.n_cols and np.any(self.c[self.col_active] < 0):
+            return self.postsolve({'success': False, 'message': 'Le problème est non borné'})
+        # Plus aucune colonne : chaque ligne restante se lit 0 sign b_i
+        if self.n_rows and any(self._violated_empty_row(i) for i in np.where(self.row_active)[0]):
+            return self.postsolve({'success': False, 'message': 'Aucune solution réalisable trouvée (presolve)'})
+        return self.postsolve({
+            'success': True,
+            'solution': [0.0] * self.n_cols,
+            'optimal_value': 0.0,
+            'iterations': 0,
+            'method': 'Presolve',
+            'message': 'Solution optimale trouvée'
+        })
+    
+    def reduce_basis(self, basis):
+        """Base du problème d'origine (voir SimplexSolver.export_basis) -> base du problème réduit"""
+        variables = (list(basis.get('variables', [])) + ['at_lower'] * len(self.c))[:len(self.c)]
+        constraints = (list(basis.get('constraints', [])) + ['basic'] * len(self.b))[:len(self.b)]
+        variables, constraints = np.array(variables, dtype=object), np.array(constraints, dtype=object)
+        # Les lignes de bornes supérieures ajoutées à la fin prennent le statut par défaut
+        return {'variables': list(variables[self.col_active]), 'constraints': list(constraints[self.rows])}
+    
+    def postsolve(self, result):
+        """Ramener le résultat du problème réduit aux variables d'origine"""
+        result = dict(result)
+        result['presolve'] = dict(self.counts, rows=int(self.n_rows), columns=int(self.n_cols))
+        if 'basis' in result:
+            # Variables retirées hors base, lignes retirées lâches
+            variables = np.full(len(self.c), 'at_lower', dtype=object)
+            variables[self.col_active] = result['basis']['variables']
+            constraints = np.full(len(self.b), 'basic', dtype=object)
+            constraints[self.rows] = result['basis']['constraints'][:len(self.rows)]
+            result['basis'] = {'variables': list(variables), 'constraints': list(constraints)}
+        if not result.get('success'):
+            return result
+        if self.unbounded_column:
+            return {'success': False, 'message': 'Le problème est non borné', 'presolve': result['presolve']}
+        x = self.shift.copy()
+        x[self.col_active] += np.asarray(result['solution'], dtype=float)
+        result['solution'] = x.tolist()
+        result['optimal_value'] = float(result['optimal_value'] + self.offset)
+        return result
+
+
 class SimplexSolver:
     """Classe pour résoudre les problèmes de programmation linéaire avec le simplexe"""
     
-    def __init__(self, c, A, b, signs, method='big_m', is_maximization=True):
+    # Modes d'historique des itérations :
+    # - 'off'    : rien n'est conservé
+    # - 'pivots' : journal des pivots (phase, entrante, ligne sortante, valeur de Z)
+    # - 'full'   : journal des pivots + copie du tableau à chaque itération
+    HISTORY_MODES = ('off', 'pivots', 'full')
+    
+    # Mise à l'échelle de A avant la forme standard (voir _scale)
+    SCALING_METHODS = (None, 'equilibrate', 'geometric')
+    
+    def __init__(self, c, A, b, signs, method='big_m', is_maximization=True, history='full',
+                 crossover=True, scaling=None, pricing='dantzig', harris=True, perturbation=False,
+                 bland_after=50, basis=None, crash=True):
+        if history not in self.HISTORY_MODES:
+            raise ValueError(f'Mode d\'historique invalide: {history}')
+        if not isinstance(pricing, Pricing) and pricing not in PRICING_RULES:
+            raise ValueError(f'Règle de prix invalide: {pricing}')
+        if scaling not in self.SCALING_METHODS:
+            raise ValueError(f'Mise à l\'échelle invalide: {scaling}')
         self.c_original = np.array(c, dtype=float)
         self.is_maximization_original = is_maximization
         # IMPORTANT: Always work with original c values (positive coefficients)
         # Do NOT negate for maximization. The solver will handle both minimization and maximization
         # by checking is_maximization and adjusting the final result accordingly.
         self.c = self.c_original.copy()
-        self.A = np.array(A, dtype=float)
+        # Les matrices creuses (CSR/CSC/COO) restent creuses : stockées en CSC
+        if sp.issparse(A):
+            self.A = sp.csc_matrix(A, dtype=float)
+        else:
+            self.A = np.array(A, dtype=float)
         self.b = np.array(b, dtype=float)
         self.signs = signs
         self.method = method
@@ -23,10 +628,70 @@ class SimplexSolver:
         self.n_constraints = len(b)
         self.iterations = []
         self.artificial_vars = []
+        self.artificial_rows = np.array([], dtype=int)
         self.slack_vars = []
+        self.slack_rows = np.array([], dtype=int)
+        # Base de départ sans artificielle (voir _crash) : {ligne: colonne}
+        self.crash = crash
+        self.crash_basis = {}
+        # Variable de base de chaque ligne du tableau, mise à jour à chaque pivot
+        self.basis = np.array([], dtype=int)
+        self.history = history
         self.tableau_history = []
+        self.pivot_history = []
+        # Tableau initial de chaque phase : avec pivot_history il suffit à
+        # reconstruire n'importe quelle itération (voir rebuild_tableau)
+        self.initial_tableaux = {}
+        # Point intérieur : passer à une solution de base (sommet) à la fin
+        self.crossover = crossover
+        # Choix de la variable entrante (nom de PRICING_RULES ou instance de Pricing)
+        self.pricing = pricing if isinstance(pricing, Pricing) else PRICING_RULES[pricing]()
+        # Dégénérescence : test du rapport de Harris, perturbation du second membre
+        # (tableau), règle de Bland après `bland_after` pivots sans amélioration
+        self.harris = harris
+        self.perturbation = perturbation
+        self.bland_after = bland_after
+        self.pivot_count = 0
+        self.degenerate_pivots = 0
+        self.bland_pivots = 0
+        # Démarrage à chaud : base exportée par export_basis (voir solve_warm_start)
+        self.warm_basis = basis
+        # Facteurs d'échelle : le solveur travaille sur diag(R)·A·diag(C), x = C·x'
+        self.scaling = scaling
+        self.row_scale = np.ones(self.n_constraints)
+        self.col_scale = np.ones(self.n_vars)
+        if scaling:
+            self._scale()
+        
+    def _scale(self, passes=4):
+        """
+        Mise à l'échelle des lignes et des colonnes de A (b et c suivent) :
+        - 'equilibrate' : plus grand |a_ij| de chaque ligne puis de chaque colonne ramené à 1
+        - 'geometric'   : chaque ligne puis chaque colonne divisée par sqrt(min|a_ij| · max|a_ij|),
+                          répété quelques passes
         
-    def convert_to_standard_form(self):
+        Les facteurs sont arrondis à des puissances de 2 : la mise à l'échelle et
+        son inverse sont exactes en virgule flottante. Les inégalités gardent leur
+        sens (facteurs positifs) et c·x = (C·c)·x' ne change pas.
+        """
+        A = self.A
+        for _ in range(passes if self.scaling == 'geometric' else 1):
+            for axis in (1, 0):
+                largest, smallest = _magnitude_range(A, axis)
+                reference = np.sqrt(largest * smallest) if self.scaling == 'geometric' else largest
+                # Lignes ou colonnes vides : facteur 1
+                factor = np.exp2(-np.round(np.log2(np.where(reference > 0, reference, 1.0))))
+                if axis == 1:
+                    A = sp.diags(factor) @ A if sp.issparse(A) else A * factor[:, None]
+                    self.row_scale *= factor
+                else:
+                    A = A @ sp.diags(factor) if sp.issparse(A) else A * factor
+                    self.col_scale *= factor
+        self.A = sp.csc_matrix(A) if sp.issparse(A) else A
+        self.b = self.b * self.row_scale
+        self.c = self.c * self.col_scale
+    
+    def convert_to_standard_form(self, crash=False):
         """
         Convertir le problème à la forme standard.
         
@@ -34,70 +699,119 @@ class SimplexSolver:
         - Pour <=: ajouter slack positive s >= 0
         - Pour >=: ajouter slack négative -s et variable artificielle a
         - Pour =: ajouter variable artificielle a
+        
+        Avec `crash`, les lignes >= et = qui ont une variable de base dans
+        self.crash_basis n'ont pas de variable artificielle (voir _crash).
+        
+        A_std = [A | slacks | artificielles] est assemblée par blocs dans un
+        tableau préalloué : x1 + x2 <= 4 devient x1 + x2 + s1 = 4,
+        x1 + x2 >= 4 devient x1 + x2 - s1 + a1 = 4 et x1 + x2 = 3 devient x1 + x2 + a1 = 3.
         """
-        n_slack = sum(1 for sign in self.signs if sign in ['<=', '>='])
-        n_artificial = sum(1 for sign in self.signs if sign in ['>=', '='])
+        slack_rows, slack_signs, artificial_rows = self._logical_layout(crash)
+        n_slack = len(slack_rows)
         
-        A_std = []
-        self.slack_vars = []
-        self.artificial_vars = []
-        slack_count = 0
-        artificial_count = 0
+        A_std = np.zeros((self.n_constraints, self.n_vars + n_slack + len(artificial_rows)), dtype=float)
+        A_std[:, :self.n_vars] = self.A.toarray() if sp.issparse(self.A) else self.A
+        # Colonnes d'identité signée : +1 pour <=, -1 pour >=
+        A_std[slack_rows, self.slack_vars] = slack_signs
+        A_std[artificial_rows, self.artificial_vars] = 1
         
-        for i, sign in enumerate(self.signs):
-            row = list(self.A[i])
-            
-            if sign == '<=':
-                # x1 + x2 <= 4 devient x1 + x2 + s1 = 4
-                for j in range(n_slack):
-                    if j == slack_count:
-                        row.append(1)
-                    else:
-                        row.append(0)
-                slack_count += 1
-                for j in range(n_artificial):
-                    row.append(0)
-                self.slack_vars.append(self.n_vars + slack_count - 1)
-                
-            elif sign == '>=':
-                # x1 + x2 >= 4 devient x1 + x2 - s1 + a1 = 4
-                # Slack s1 est négative initalement (s1 = 0 => x1 + x2 = 4, mais on veut >= 4)
-                # Donc on ajoute une variable artificielle a1 pour la base initiale
-                for j in range(n_slack):
-                    if j == slack_count:
-                        row.append(-1)
-                    else:
-                        row.append(0)
-                slack_count += 1
-                self.slack_vars.append(self.n_vars + slack_count - 1)
-                
-                # Ajouter variable artificielle
-                for j in range(n_artificial):
-                    if j == artificial_count:
-                        row.append(1)
-                    else:
-                        row.append(0)
-                artificial_count += 1
-                self.artificial_vars.append(self.n_vars + n_slack + artificial_count - 1)
-                
-            elif sign == '=':
-                # x1 + x2 = 3 reste x1 + x2 = 3
-                # Pas de slack, seulement variable artificielle
-                for j in range(n_slack):
-                    row.append(0)
-                    
-                for j in range(n_artificial):
-                    if j == artificial_count:
-                        row.append(1)
-                    else:
-                        row.append(0)
-                artificial_count += 1
-                self.artificial_vars.append(self.n_vars + n_slack + artificial_count - 1)
-            
-            A_std.append(row)
+        return A_std, self.b.copy()
+    
+    def _logical_layout(self, crash=False):
+        """
+        Lignes des variables d'écart et artificielles, calculées par masques sur
+        les signes. Met à jour self.slack_vars, self.crash_basis et
+        self.artificial_vars (indices des colonnes dans la forme standard).
+        """
+        signs = np.asarray(self.signs, dtype=object)
+        slack_rows = np.where((signs == '<=') | (signs == '>='))[0]
+        self.slack_rows = slack_rows
+        slack_signs = np.where(signs[slack_rows] == '<=', 1.0, -1.0)
+        n_slack = len(slack_rows)
+        first_artificial = self.n_vars + n_slack
+        self.slack_vars = np.arange(self.n_vars, first_artificial).tolist()
+        
+        self.crash_basis = self._crash() if crash else {}
+        artificial_rows = np.where((signs == '>=') | (signs == '='))[0]
+        artificial_rows = artificial_rows[~np.isin(artificial_rows, list(self.crash_basis))]
+        self.artificial_vars = np.arange(first_artificial, first_artificial + len(artificial_rows)).tolist()
+        self.artificial_rows = artificial_rows
+        
+        return slack_rows, slack_signs, artificial_rows
+    
+    def implicit_standard_form(self, crash=False):
+        """
+        Forme standard sans blocs identité matérialisés (voir StandardFormMatrix).
+        Mêmes indices slack_vars / artificial_vars que convert_to_standard_form.
+        """
+        slack_rows, slack_signs, artificial_rows = self._logical_layout(crash)
+        return StandardFormMatrix(self.A, slack_rows, slack_signs, artificial_rows), self.b.copy()
+    
+    def _crash(self):
+        """
+        Base de départ réalisable qui remplace des variables artificielles
+        (procédure de « crash »). Pour une ligne >= ou = :
+        - une colonne structurelle dont le seul coefficient hors des lignes <=
+          est dans cette ligne, positif (x_j = b_i / a_ij >= 0), et qui laisse
+          les écarts des lignes <= positifs : la base reste triangulaire par
+          blocs (ces colonnes et les écarts des lignes <=)
+        - à défaut, pour une ligne >= avec b_i = 0, sa variable d'écart (valeur 0)
         
-        return np.array(A_std, dtype=float), self.b.copy()
+        Retourne {ligne: colonne de la forme standard} ; les autres lignes >= et
+        = gardent leur variable artificielle.
+        """
+        signs = np.asarray(self.signs, dtype=object)
+        blocking = np.where(signs != '<=')[0]
+        if not blocking.size:
+            return {}
+        less = signs == '<='
+        A = self.A.tocsc() if sp.issparse(self.A) else self.A
+        
+        # Colonnes avec un seul coefficient dans les lignes >= et =
+        block = A[blocking]
+        if sp.issparse(block):
+            block = sp.csc_matrix(block)
+            block.eliminate_zeros()
+            counts = np.diff(block.indptr)
+            candidates = np.where(counts == 1)[0]
+            rows = blocking[block.indices[block.indptr[candidates]]]
+            pivots = block.data[block.indptr[candidates]]
+        else:
+            nonzero = block != 0
+            candidates = np.where(nonzero.sum(axis=0) == 1)[0]
+            rows = blocking[np.argmax(nonzero[:, candidates], axis=0)]
+            pivots = A[rows, candidates]
+        values = self.b[rows] / np.where(pivots > 0, pivots, 1.0)
+        keep = (pivots > 0) & (values >= 0)
+        candidates, rows, pivots, values = candidates[keep], rows[keep], pivots[keep], values[keep]
+        
+        # Plus grands pivots d'abord ; les écarts des lignes <= doivent rester >= 0
+        slack_of = dict(zip(self.slack_rows.tolist(), self.slack_vars))
+        crash = {}
+        residual = self.b.copy()
+        for k in np.argsort(-pivots, kind='stable'):
+            row = int(rows[k])
+            if row in crash:
+                continue
+            column = A[:, candidates[k]]
+            column = column.toarray().ravel() if sp.issparse(column) else column
+            shifted = residual[less] - column[less] * values[k]
+            if shifted.min(initial=0.0) < 0:
+                continue
+            residual[less] = shifted
+            crash[row] = int(candidates[k])
+        
+        for row in blocking:
+            if row not in crash and signs[row] == '>=' and self.b[row] == 0:
+                crash[int(row)] = slack_of[int(row)]
+        return crash
     
+    def _crash_pivots(self, tableau):
+        """Mettre le tableau sous forme canonique pour les colonnes de self.crash_basis"""
+        for row, column in self.crash_basis.items():
+            self._pivot(tableau, row, column)
+
     def solve_big_m(self):
         """
         Big-M Method: Single phase approach with penalty on artificial variables.
@@ -106,7 +820,7 @@ class SimplexSolver:
         
         Where M is a very large penalty (avoids multiple phases)
         """
-        A_std, b_std = self.convert_to_standard_form()
+        A_std, b_std = self.convert_to_standard_form(self.crash)
         n_cols = A_std.shape[1]
         
         # Calculate M: must be larger than any coefficient in the problem
@@ -124,17 +838,12 @@ class SimplexSolver:
         c_bigm = np.array(c_bigm, dtype=float)
         
         tableau = self._create_tableau(A_std, b_std, c_bigm)
+        self.basis = self._initial_basis()
+        self._crash_pivots(tableau)
         
         # IMPORTANT: Normalize the objective row (canonical form)
-        # For each artificial variable that is basic, subtract its row from objective row
-        for artificial_idx in self.artificial_vars:
-            for row_idx in range(tableau.shape[0] - 1):
-                if abs(tableau[row_idx, artificial_idx] - 1.0) < 1e-10:
-                    # This artificial variable is basic
-                    # Subtract this row from objective row (weighted by M)
-                    tableau[-1, :-1] -= M * tableau[row_idx, :-1]
-                    tableau[-1, -1] -= M * tableau[row_idx, -1]
-                    break
+        # Each basic artificial variable has cost M: subtract M times its row from the objective row
+        self._canonicalize_objective(tableau)
         
         result, final_tableau = self._solve_tableau(deepcopy(tableau), "Big-M - Single Phase")
         
@@ -142,18 +851,14 @@ class SimplexSolver:
             solution = self._extract_solution(final_tableau)
             
             # Check if any artificial variables are non-zero (indicates infeasibility)
-            for art_idx in self.artificial_vars:
-                col = final_tableau[:-1, art_idx]
-                # Check if this variable is basic and non-zero
-                if np.count_nonzero(col) == 1:
-                    i = np.where(col != 0)[0][0]
-                    if abs(col[i] - 1.0) < 1e-10:
-                        value = final_tableau[i, -1]
-                        if value > 1e-6:
-                            return {
-                                'success': False,
-                                'message': f'Aucune solution réalisable trouvée (artificial var > 0: {value:.6f})'
-                            }
+            artificial_rows = np.where(np.isin(self.basis, self.artificial_vars))[0]
+            for i in artificial_rows:
+                value = final_tableau[i, -1]
+                if value > 1e-6:
+                    return {
+                        'success': False,
+                        'message': f'Aucune solution réalisable trouvée (artificial var > 0: {value:.6f})'
+                    }
             
             return {
                 'success': True,
@@ -167,8 +872,8 @@ class SimplexSolver:
         return result
     
     def solve_two_phase(self):
-        """Méthode à deux phases"""
-        A_std, b_std = self.convert_to_standard_form()
+        """Méthode à deux phases (phase 1 seulement pour les lignes sans base de départ, voir _crash)"""
+        A_std, b_std = self.convert_to_standard_form(self.crash)
         n_cols = A_std.shape[1]
         
         # Phase 1 : Minimiser la somme des variables artificielles
@@ -180,21 +885,17 @@ class SimplexSolver:
             c_phase1 = np.array(c_phase1, dtype=float)
             
             tableau = self._create_tableau(A_std, b_std, c_phase1)
+            self.basis = self._initial_basis()
+            self._crash_pivots(tableau)
             
             # IMPORTANT: Normalize the objective row so that basic variables have coefficient 0
-            # This is done by subtracting the constraint rows from the objective row
-            # BUT: Do NOT subtract the RHS (last column) to avoid changing the objective value
-            for artificial_idx in self.artificial_vars:
-                # Find the row where this artificial variable is basic (has coefficient 1)
-                for row_idx in range(tableau.shape[0] - 1):  # Exclude objective row
-                    if abs(tableau[row_idx, artificial_idx] - 1.0) < 1e-10:
-                        # This artificial variable is basic in row_idx
-                        # Subtract this row from the objective row, except for the RHS part
-                        tableau[-1, :-1] -= tableau[row_idx, :-1]
-                        tableau[-1, -1] -= tableau[row_idx, -1]  # Also subtract RHS to maintain canonical form
-                        break
+            # This is done by subtracting the rows of the basic artificial variables (RHS included)
+            self._canonicalize_objective(tableau)
             
-            result1, tableau_phase1 = self._solve_tableau(deepcopy(tableau), "Phase 1 - Minimiser variables artificielles")
+            result1, tableau_phase1 = self._solve_tableau(deepcopy(tableau), "Phase 1 - Minimiser variables artificielles",
+                                                            lower_bound=0)
+            if not result1.get('success'):
+                return result1
             
             # Vérifier si une solution de base réalisable existe
             optimal_value_phase1 = float(result1.get('optimal_value', 0))
@@ -205,30 +906,18 @@ class SimplexSolver:
                 }
             
             # Phase 2 : Résoudre le problème original
-            c_phase2 = np.concatenate([self.c, np.zeros(n_cols - self.n_vars)])
-            
-            # Utiliser le tableau final de la phase 1 comme base pour la phase 2
-            tableau_phase2 = deepcopy(tableau_phase1)
+            # Utiliser le tableau final de la phase 1 comme base pour la phase 2,
+            # sans les colonnes artificielles (elles ne peuvent plus entrer)
+            tableau_phase2 = self._phase1_to_phase2(tableau_phase1)
+            c_phase2 = np.concatenate([self.c, np.zeros(tableau_phase2.shape[1] - 1 - self.n_vars)])
             # Remplacer la ligne de la fonction objectif par celle de la phase 2
-            tableau_phase2[-1, :-1] = -c_phase2
+            tableau_phase2[-1, :-1] = c_phase2
             tableau_phase2[-1, -1] = 0
             
             # CRITICAL FIX: Adjust Phase 2 objective row to canonical form
             # For each variable that is basic in the Phase 1 solution, make its coefficient 0
-            for col_idx in range(n_cols):
-                # Check if this column is a basic variable
-                col = tableau_phase2[:-1, col_idx]
-                if np.count_nonzero(col) == 1:
-                    # Check if the non-zero element is exactly 1
-                    row_idx = np.where(col != 0)[0][0]
-                    if abs(col[row_idx] - 1.0) < 1e-10:
-                        # This is a basic variable
-                        coeff = tableau_phase2[-1, col_idx]
-                        if abs(coeff) > 1e-10:
-                            # Make its coefficient 0 in the objective row
-                            tableau_phase2[-1, :] -= coeff * tableau_phase2[row_idx, :]
+            self._canonicalize_objective(tableau_phase2)
             
-            # Adapter le tableau pour la phase 2 (éliminer les variables artificielles)
             result2, final_tableau = self._solve_tableau(tableau_phase2, "Phase 2 - Résoudre le problème original")
             
             if result2.get('success'):
@@ -247,6 +936,9 @@ class SimplexSolver:
             # Pas de variables artificielles, résoudre directement
             c_std = np.concatenate([self.c, np.zeros(A_std.shape[1] - self.n_vars)])
             tableau = self._create_tableau(A_std, b_std, c_std)
+            self.basis = self._initial_basis()
+            self._crash_pivots(tableau)
+            self._canonicalize_objective(tableau)
             result, final_tableau = self._solve_tableau(tableau, "Phase 1 - Unique")
             
             if result.get('success'):
@@ -262,150 +954,2046 @@ class SimplexSolver:
                 }
             return result
     
-    def _create_tableau(self, A, b, c):
-        """Créer le tableau du simplexe initial"""
-        m, n = A.shape
-        tableau = np.zeros((m + 1, n + 1), dtype=float)
-        tableau[:m, :n] = A
-        tableau[:m, n] = b
-        tableau[m, :n] = -c
-        tableau[m, n] = 0
+    def solve_dual_simplex(self):
+        """
+        Simplexe dual, sans variables artificielles ni phase 1.
+        
+        Chaque ligne devient une contrainte <= avec sa variable d'écart (voir
+        _dual_form). La base des écarts est duale réalisable dès que c >= 0 (cas
+        des problèmes de coûts avec des >=) ; le second membre négatif est ramené
+        à >= 0 par des pivots duaux. _solve_from_basis traite les autres cas.
+        """
+        A_std, b_rows = self._dual_form()
+        tableau = self._create_tableau(A_std, b_rows, np.concatenate([self.c, np.zeros(len(b_rows))]))
+        self.basis = np.array(self.slack_vars)
+        result = self._solve_from_basis(tableau, "Simplexe dual")
+        if result.get('success'):
+            result['method'] = 'Simplexe Dual'
+        return result
+    
+    def _dual_form(self):
+        """
+        Forme standard sans variables artificielles : a·x <= b garde son écart,
+        a·x >= b devient -a·x + s = -b, a·x = b devient les deux lignes
+        a·x + s1 = b et -a·x + s2 = -b. Retourne [A' | I] et b'.
+        self.slack_rows donne la ligne d'origine de chaque écart.
+        """
+        A = self.A.toarray() if sp.issparse(self.A) else self.A
+        signs = np.asarray(self.signs, dtype=object)
+        upper, lower = np.flatnonzero(signs != '>='), np.flatnonzero(signs != '<=')
+        rows = np.concatenate([upper, lower])
+        flip = np.concatenate([np.ones(len(upper)), -np.ones(len(lower))])
+        m = len(rows)
+        self.slack_vars = list(range(self.n_vars, self.n_vars + m))
+        self.slack_rows = rows
+        self.artificial_vars = []
+        self.artificial_rows = np.array([], dtype=int)
+        return np.hstack([A[rows] * flip[:, None], np.eye(m)]), self._dual_rows(self.b)
+    
+    def _dual_rows(self, values):
+        """Vecteur indexé par les contraintes (b ou une direction de b) dans les lignes de _dual_form"""
+        signs = np.asarray(self.signs, dtype=object)
+        return np.concatenate([values[signs != '>='], -values[signs != '<=']])
+    
+    def _append_rows(self, tableau, rows, rhs, signs=None):
+        """
+        Ajouter des contraintes sur les variables structurelles (lignes de `rows`,
+        n_vars coefficients) à un tableau canonique pour self.basis. Comme dans
+        _dual_form, une contrainte >= est multipliée par -1 et une égalité donne
+        deux lignes ; chaque ligne reçoit une variable d'écart de base (colonne
+        ajoutée avant le second membre). La ligne est exprimée dans la base
+        courante : son second membre est négatif si la solution viole la
+        contrainte, et le simplexe dual rétablit la réalisabilité sans toucher
+        aux coûts réduits. Retourne le nouveau tableau (self.basis est étendue).
+        """
+        tableau, self.basis = self._extend_tableau(tableau, self.basis, self.n_vars, rows, rhs, signs)
         return tableau
     
-    def _solve_tableau(self, tableau, phase_name):
-        """Résoudre le tableau du simplexe"""
-        iteration = 0
-        max_iterations = 1000
-        epsilon = 1e-8  # Increased from 1e-10 for numerical stability
+    @staticmethod
+    def _extend_tableau(tableau, basis, n_vars, rows, rhs, signs=None):
+        """
+        Cœur de _append_rows, sans état du solveur : retourne (tableau, base)
+        étendus pour la base `basis` et n_vars variables structurelles.
+        """
+        rows = np.atleast_2d(np.asarray(rows, dtype=float))
+        rhs = np.atleast_1d(np.asarray(rhs, dtype=float))
+        signs = np.asarray(signs if signs is not None else ['<='] * len(rows), dtype=object)
+        upper, lower = signs != '>=', signs != '<='
+        rows = np.vstack([rows[upper], -rows[lower]])
+        rhs = np.concatenate([rhs[upper], -rhs[lower]])
+        k = len(rows)
+        m, width = tableau.shape[0] - 1, tableau.shape[1] - 1
         
-        while iteration < max_iterations:
-            # Sauvegarder l'itération
-            self.tableau_history.append({
-                'iteration': iteration,
-                'phase': phase_name,
-                'tableau': tableau.copy()
-            })
-            self.iterations.append(iteration)
-            
-            # Vérifier l'optimalité (tous les coefficients de la ligne de Z >= 0)
-            # Pour la minimisation, la ligne est -c, et nous voulons que tous les coefficients soient >= 0
-            last_row = tableau[-1, :-1]
-            # IMPORTANT: Use a smaller threshold (like -epsilon instead of >= -epsilon)
-            # Check if minimum coefficient is close to zero or positive
-            min_coeff = np.min(last_row)
-            if min_coeff >= -epsilon:
-                # Solution optimale trouvée
-                solution = self._extract_solution(tableau)
-                optimal_value = -tableau[-1, -1]
-                
-                return {
-                    'success': True,
-                    'solution': solution,
-                    'optimal_value': optimal_value,
-                    'iterations': iteration,
-                    'message': 'Solution optimale trouvée'
-                }, tableau
-            
-            # ADDITIONAL CHECK: For degenerate problems (especially Phase 1),
-            # if the objective value is essentially 0, consider the solution optimal
-            # This handles cases where negative coefficients remain but the objective is already minimized
-            if abs(tableau[-1, -1]) < epsilon:
-                # Objective value is essentially 0
-                solution = self._extract_solution(tableau)
-                optimal_value = -tableau[-1, -1]
-                
-                return {
-                    'success': True,
-                    'solution': solution,
-                    'optimal_value': optimal_value,
-                    'iterations': iteration,
-                    'message': 'Solution optimale trouvée'
-                }, tableau
-                
-                return {
-                    'success': True,
-                    'solution': solution,
-                    'optimal_value': optimal_value,
-                    'iterations': iteration,
-                    'message': 'Solution optimale trouvée'
-                }, tableau
-            
-            # Choisir la colonne du pivot (le coefficient le plus négatif)
-            pivot_col = np.argmin(last_row)
-            
-            # Choisir la ligne du pivot avec le test du rapport minimum
-            col = tableau[:-1, pivot_col]
-            min_ratio = float('inf')
-            pivot_row = -1
-            
-            # IMPORTANT: Pour une variable entrant dans la base:
-            # - Si son coefficient dans une contrainte est POSITIF: ratio = RHS / coefficient >= 0
-            # - Si son coefficient est NEGATIF: on ne peut pas utiliser cette ligne (augmenter rendrait RHS negatif)
-            # Le test du rapport minimum DOIT utiliser seulement des coefficients avec le même signe que on veut
-            for i in range(len(col)):
-                if col[i] > epsilon:  # Coefficient positif
-                    ratio = tableau[i, -1] / col[i]
-                    if ratio >= -epsilon:  # Ratio >= 0 (or close to 0 for degeneracy)
-                        if ratio < min_ratio:
-                            min_ratio = ratio
-                            pivot_row = i
-            
-            # Vérifier si le problème est non borné
-            if pivot_row == -1:
-                # Aucun coefficient positif -> la variable peut augmenter indéfiniment
-                return {
-                    'success': False,
-                    'message': 'Le problème est non borné'
-                }, tableau
-            
-            # Effectuer le pivot (Gauss-Jordan)
-            pivot_value = tableau[pivot_row, pivot_col]
-            tableau[pivot_row, :] /= pivot_value
-            
-            for i in range(tableau.shape[0]):
-                if i != pivot_row:
-                    factor = tableau[i, pivot_col]
-                    tableau[i, :] -= factor * tableau[pivot_row, :]
-            
-            iteration += 1
+        extended = np.zeros((m + k + 1, width + k + 1))
+        extended[:m, :width] = tableau[:m, :width]
+        extended[:m, -1] = tableau[:m, -1]
+        extended[-1, :width] = tableau[-1, :width]
+        extended[-1, -1] = tableau[-1, -1]
+        block = np.zeros((k, width + k + 1))
+        block[:, :n_vars] = rows
+        block[:, width:width + k] = np.eye(k)
+        block[:, -1] = rhs
+        # Élimination des colonnes de base (colonnes unité des lignes existantes)
+        block -= block[:, basis] @ extended[:m]
+        extended[m:m + k] = block
+        return extended, np.concatenate([basis, width + np.arange(k)])
+    
+    def _append_columns(self, tableau, columns, costs):
+        """
+        Ajouter des variables structurelles (une ligne de `columns` par variable,
+        un coefficient par contrainte d'origine) à un tableau canonique de la
+        forme _dual_form, sans le reconstruire. Le bloc des colonnes d'écart vaut
+        B^-1 (et -y dans la ligne objectif) : la nouvelle colonne est B^-1 a' et
+        son coût réduit c - y·a'. Les variables, hors base, sont placées après les
+        variables existantes (colonnes d'écart et self.basis décalées) ; A, c et
+        n_vars suivent. Retourne le nouveau tableau.
+        """
+        columns = np.atleast_2d(np.asarray(columns, dtype=float))
+        costs = np.atleast_1d(np.asarray(costs, dtype=float))
+        k = len(columns)
+        scaled = (columns * self.row_scale).T
+        block = tableau[:, self.slack_vars] @ self._dual_rows(scaled)
+        block[-1] += costs
+        tableau = np.insert(tableau, [self.n_vars] * k, block, axis=1)
+        self.basis = np.where(self.basis >= self.n_vars, self.basis + k, self.basis)
+        self.slack_vars = [j + k for j in self.slack_vars]
+        self.A = sp.hstack([self.A, sp.csc_matrix(scaled)], format='csc') if sp.issparse(self.A) else np.hstack([self.A, scaled])
+        self.c = np.concatenate([self.c, costs])
+        self.c_original = np.concatenate([self.c_original, costs])
+        self.col_scale = np.concatenate([self.col_scale, np.ones(k)])
+        self.n_vars += k
+        return tableau
+    
+    def _dual_prices(self, tableau):
+        """
+        Prix duaux y des contraintes d'origine (données non mises à l'échelle)
+        lus dans la ligne objectif d'un tableau de la forme _dual_form : le coût
+        réduit d'une colonne a de coût c est c - y·a.
+        """
+        signs = np.asarray(self.signs, dtype=object)
+        flip = np.where(np.arange(len(self.slack_rows)) < np.count_nonzero(signs != '>='), 1.0, -1.0)
+        duals = np.zeros(self.n_constraints)
+        np.add.at(duals, self.slack_rows, -flip * tableau[-1, self.slack_vars])
+        return duals * self.row_scale
+    
+    def _remove_rows(self, tableau, rows):
+        """
+        Retirer d'un tableau canonique des lignes dont la variable de base est une
+        variable d'écart (contraintes lâches, par exemple ajoutées par _append_rows) :
+        la colonne de l'écart n'a qu'un coefficient, dans sa ligne, et un coût
+        réduit nul ; supprimer la ligne et la colonne laisse le reste du tableau
+        canonique pour la base restante. Retourne le nouveau tableau.
+        """
+        rows = np.asarray(rows, dtype=int)
+        columns = self.basis[rows]
+        tableau = np.delete(np.delete(tableau, rows, axis=0), columns, axis=1)
+        basis = np.delete(self.basis, rows)
+        self.basis = basis - np.searchsorted(np.sort(columns), basis)
+        return tableau
+    
+    def _solve_from_basis(self, tableau, phase_name):
+        """
+        Terminer à partir d'un tableau canonique pour self.basis (forme _dual_form) :
+        - base réalisable (second membre >= 0) : simplexe primal
+        - base duale réalisable (coûts réduits >= 0) : simplexe dual
+        - ni l'un ni l'autre : simplexe dual avec les coûts réduits négatifs
+          remplacés par 0, puis simplexe primal avec les vrais coûts
+        """
+        epsilon = 1e-8
+        shifted = tableau[:-1, -1].min() < -epsilon and tableau[-1, :-1].min() < -epsilon
+        if shifted:
+            np.maximum(tableau[-1, :-1], 0, out=tableau[-1, :-1])
+        # Tableau initial pris après le décalage des coûts : c'est lui que rejouent les pivots
+        if self.history != 'off':
+            self.initial_tableaux[phase_name] = tableau.copy()
+        if tableau[:-1, -1].min() < -epsilon:
+            status, _ = self._dual_simplex(tableau, phase_name, len(self.iterations), epsilon)
+            if status == 'infeasible':
+                return {'success': False, 'message': 'Aucune solution réalisable trouvée'}
+            if status == 'max_iterations':
+                return {'success': False, 'message': 'Nombre maximum d\'itérations (1000) atteint'}
+            if not shifted:
+                return self._basis_result(tableau)
+            # Base réalisable : retour aux vrais coûts
+            tableau[-1, :] = 0
+            tableau[-1, :self.n_vars] = self.c
+            self._canonicalize_objective(tableau)
+        result, tableau = self._solve_tableau(tableau, f"{phase_name} - Primal")
+        if not result.get('success'):
+            return result
+        return self._basis_result(tableau)
+    
+    def _basis_result(self, tableau):
+        return {
+            'success': True,
+            'solution': self._extract_solution(tableau).tolist(),
+            'optimal_value': float(-tableau[-1, -1]),
+            'iterations': len(self.iterations),
+            'method': 'Simplexe (démarrage à chaud)',
+            'message': 'Solution optimale trouvée'
+        }
+    
+    # Statuts d'une variable ou d'une contrainte dans une base exportée
+    BASIS_STATUSES = ('basic', 'at_lower')
+    
+    def export_basis(self):
+        """
+        Base finale sérialisable (JSON) : statut de chaque variable et de chaque
+        contrainte, 'basic' (dans la base) ou 'at_lower' (hors base, à 0). Le
+        statut d'une contrainte est celui de sa variable d'écart : 'basic' pour
+        une contrainte lâche, 'at_lower' pour une contrainte serrée (toujours le
+        cas d'une égalité).
+        """
+        basic = set(int(j) for j in self.basis)
+        variables = ['basic' if j in basic else 'at_lower' for j in range(self.n_vars)]
+        constraints = ['at_lower'] * self.n_constraints
+        for column, row in zip(self.slack_vars, self.slack_rows):
+            if column in basic and self.signs[row] != '=':
+                constraints[row] = 'basic'
+        return {'variables': variables, 'constraints': constraints}
+    
+    def sensitivity(self, epsilon=1e-9):
+        """
+        Analyse de sensibilité de la base finale (après solve), sans pivot.
+        
+        La base exportée (export_basis) est posée sur la forme [A | D], D
+        diagonale (+1 pour <= et =, -1 pour >=) ; une seule factorisation LU de
+        B donne le tableau final B^-1 [A | D], d'où :
+        - shadow_prices : y = B^-T c_B, variation de Z par unité de b_i
+        - reduced_costs : d_j = c_j - a_j·y
+        - rhs_ranges : intervalle de b_i où la base reste réalisable (B^-1 b >= 0)
+        - cost_ranges : intervalle de c_j où la base reste optimale (d >= 0)
+        
+        Valeurs du problème tel que résolu (minimisation de self.c, données d'origine
+        si la mise à l'échelle est active) ; None pour une borne infinie. Sur une base
+        dégénérée, les intervalles sont ceux de cette base (parfois réduits à un point).
+        Si la base complétée n'est pas duale réalisable (variable artificielle du Grand M
+        restée en base à 0), quelques pivots du simplexe dual démarré à chaud depuis
+        cette base donnent une base optimale, analysée à sa place.
+        """
+        return self._sensitivity(epsilon, repair=True)
+    
+    def _sensitivity(self, epsilon, repair):
+        A = self.A.toarray() if sp.issparse(self.A) else self.A
+        A = A / self.row_scale[:, None] / self.col_scale
+        b = self.b / self.row_scale
+        c = self.c / self.col_scale
+        m, n = A.shape
+        signs = np.asarray(self.signs, dtype=object)
+        logical = np.where(signs == '>=', -1.0, 1.0)
+        A_std = np.hstack([A, np.diag(logical)])
+        c_std = np.concatenate([c, np.zeros(m)])
+        
+        # Colonnes de base indépendantes, complétées par des colonnes logiques (voir solve_warm_start) :
+        # d'abord celles des lignes dont l'écart ou la variable artificielle est resté en base
+        # (égalités, variable artificielle à 0 du Grand M), absentes de la base exportée
+        statuses = self.export_basis()
+        candidates = np.concatenate([
+            np.flatnonzero(np.array(statuses['variables']) == 'basic'),
+            n + np.flatnonzero(np.array(statuses['constraints']) == 'basic'),
+        ]).astype(int)
+        logical_row = {int(j): int(i) for j, i in zip(self.slack_vars, self.slack_rows)}
+        logical_row.update({int(j): int(i) for j, i in zip(self.artificial_vars, self.artificial_rows)})
+        preferred = [n + logical_row[int(j)] for j in self.basis if int(j) in logical_row]
+        basis = np.array([], dtype=int)
+        if candidates.size:
+            _, R, piv = qr(A_std[:, candidates], pivoting=True)
+            diag = np.abs(np.diag(R))
+            rank = min(m, int(np.sum(diag > 1e-9 * diag[0])) if diag.size and diag[0] > 0 else 0)
+            basis = candidates[piv[:rank]]
+        for column in dict.fromkeys(preferred):
+            if basis.size < m and column not in basis and \
+                    np.linalg.matrix_rank(A_std[:, np.append(basis, column)]) > basis.size:
+                basis = np.append(basis, column)
+        if basis.size < m:
+            Q = qr(A_std[:, basis])[0] if basis.size else np.eye(m)
+            _, _, rows = qr(Q[:, basis.size:].T, pivoting=True)
+            basis = np.concatenate([basis, n + rows[:m - basis.size]])
+        basis = basis.astype(int)
+        
+        lu = lu_factor(A_std[:, basis])
+        tableau = lu_solve(lu, A_std)
+        x_B = lu_solve(lu, b)
+        y = lu_solve(lu, c_std[basis], trans=1)
+        d = c_std - A_std.T @ y
+        
+        # Base non duale réalisable (variable artificielle restée en base à 0 : sans le
+        # coût M, la complétion n'est pas optimale) : simplexe dual démarré à chaud
+        # depuis cette base sur les données d'origine, dont la base finale est optimale
+        movable = np.ones(n + m, dtype=bool)
+        movable[basis] = False
+        movable[n + np.flatnonzero(signs == '=')] = False
+        if repair and np.any(d[movable] < -1e-7 * (1 + np.abs(c).max(initial=0))):
+            solver = SimplexSolver(c, A, b, list(self.signs), 'dual_simplex', False, history='off', basis=statuses)
+            if solver.solve().get('success'):
+                return solver._sensitivity(epsilon, repair=False)
+        
+        def bound(value):
+            return float(value) if np.isfinite(value) else None
+        
+        def interval(center, alpha, values):
+            """[center + δmin, center + δmax] tel que values - δ·alpha reste >= 0"""
+            up = alpha > epsilon
+            down = alpha < -epsilon
+            high = np.min(values[up] / alpha[up]) if up.any() else np.inf
+            low = np.max(values[down] / alpha[down]) if down.any() else -np.inf
+            return [bound(center + min(low, 0.0)), bound(center + max(high, 0.0))]
+        
+        # b_i + δ : x_B + δ·B^-1 e_i >= 0, avec B^-1 e_i = D_ii · (colonne n + i du tableau)
+        rhs_ranges = [interval(b[i], -logical[i] * tableau[:, n + i], x_B) for i in range(m)]
+        
+        # Colonnes pouvant entrer : hors base, sans les colonnes des égalités (fixées à 0)
+        entering = np.ones(n + m, dtype=bool)
+        entering[basis] = False
+        entering[n + np.flatnonzero(signs == '=')] = False
+        row_of = {int(j): r for r, j in enumerate(basis)}
+        cost_ranges = []
+        for j in range(n):
+            if j in row_of:
+                cost_ranges.append(interval(c[j], tableau[row_of[j], entering], d[entering]))
+            else:
+                cost_ranges.append([bound(c[j] - max(d[j], 0.0)), None])
         
         return {
-            'success': False,
-            'message': f'Nombre maximum d\'itérations ({max_iterations}) atteint'
-        }, tableau
+            'shadow_prices': y.tolist(),
+            'reduced_costs': d[:n].tolist(),
+            'rhs_ranges': rhs_ranges,
+            'cost_ranges': cost_ranges,
+        }
     
-    def _extract_solution(self, tableau):
-        """Extraire la solution du tableau final"""
-        m, n = tableau.shape
-        m -= 1  # Enlever la ligne de la fonction objectif
-        solution = np.zeros(self.n_vars, dtype=float)
+    def solve_multi_rhs(self, rhs):
+        """
+        Résoudre le problème pour chaque colonne de `rhs` (m, k) en guise de b.
         
-        # Identifier les variables de base
-        for j in range(self.n_vars):
-            col = tableau[:m, j]
-            # Une variable de base a exactement un 1 et des 0 dans sa colonne
-            if np.count_nonzero(col) == 1:
-                i = np.where(col != 0)[0][0]
-                if abs(col[i] - 1.0) < 1e-10:
-                    solution[j] = tableau[i, -1]
+        La forme _dual_form est construite une fois. La première colonne est
+        résolue depuis la base des écarts ; pour les suivantes, la base optimale
+        précédente reste duale réalisable (les coûts réduits ne dépendent pas de
+        b) : le nouveau second membre vaut B^-1 b' (B^-1 est le bloc des colonnes
+        d'écart du tableau) et quelques pivots du simplexe dual suffisent. Après
+        un échec qui ne laisse pas de base duale réalisable (non borné, limite
+        d'itérations), la colonne suivante repart de la base des écarts.
         
-        return solution
-
-
-
-@app.route('/')
-def index():
-    return render_template('index.html')
-
-
-@app.route('/fonction')
-def fonction():
-    n_vars = request.args.get('variables', 1, type=int)
-    n_constraints = request.args.get('contraintes', 1, type=int)
-    method = request.args.get('method', 'big_m')
+        Retourne des tableaux NumPy : 'status' ('optimal', 'infeasible',
+        'unbounded' ou 'max_iterations'), 'success', 'optimal_value' et
+        'solution' (NaN en cas d'échec), 'pivots' par colonne.
+        """
+        rhs = np.asarray(rhs, dtype=float)
+        if rhs.ndim == 1:
+            rhs = rhs[:, None]
+        if rhs.ndim != 2 or rhs.shape[0] != self.n_constraints:
+            raise ValueError(f'Second membre: {self.n_constraints} lignes attendues')
+        k = rhs.shape[1]
+        A_std, _ = self._dual_form()
+        rows = self._dual_rows(rhs * self.row_scale[:, None])
+        slack = np.asarray(self.slack_vars)
+        cost = np.concatenate([self.c, np.zeros(len(slack))])
+        
+        status = np.empty(k, dtype=object)
+        values = np.full(k, np.nan)
+        solutions = np.full((k, self.n_vars), np.nan)
+        pivots = np.zeros(k, dtype=int)
+        tableau = None
+        for j in range(k):
+            start = self.pivot_count
+            if tableau is None:
+                tableau = self._create_tableau(A_std, rows[:, j], cost)
+                self.basis = slack.copy()
+                result = self._solve_from_basis(tableau, "Seconds membres")
+                status[j] = 'optimal' if result.get('success') else self._failure_status(result)
+                # Échec à froid : coûts éventuellement décalés, base non réutilisable
+                reusable = status[j] == 'optimal'
+            else:
+                tableau[:, -1] = tableau[:, slack] @ rows[:, j]
+                status[j], _ = self._dual_simplex(tableau, "Seconds membres", len(self.iterations))
+                # Non réalisable : les pivots duaux ont gardé une base duale réalisable
+                reusable = status[j] != 'max_iterations'
+            if status[j] == 'optimal':
+                values[j] = -tableau[-1, -1]
+                solutions[j] = self._extract_solution(tableau) * self.col_scale
+            if not reusable:
+                tableau = None
+            pivots[j] = self.pivot_count - start
+        return {
+            'status': status,
+            'success': status == 'optimal',
+            'optimal_value': values,
+            'solution': solutions,
+            'pivots': pivots,
+        }
     
-    return render_template('fonction.html',
-                         n_vars=n_vars,
+    @staticmethod
+    def _failure_status(result):
+        """Statut court d'un résultat en échec ('unbounded', 'infeasible', 'max_iterations')"""
+        message = result.get('message', '')
+        if 'non borné' in message:
+            return 'unbounded'
+        if 'réalisable' in message:
+            return 'infeasible'
+        return 'max_iterations'
+    
+    # Cible d'une analyse paramétrique : second membre ou coûts
+    PARAMETRIC_TARGETS = ('b', 'c')
+    
+    def parametric(self, direction, target='b', theta=(0.0, 1.0), max_pivots=1000):
+        """
+        Analyse paramétrique : optimum de b + θ·d (target='b') ou de c + θ·d
+        (target='c') pour θ parcourant `theta`, sans nouvelle résolution.
+        
+        Le problème est résolu une fois en θ = θmin (forme _dual_form), puis
+        l'axe est parcouru sur le tableau final :
+        - 'b' : la colonne B^-1 d' suit le tableau ; la base reste réalisable
+          tant que B^-1 (b' + θ d') >= 0. À la ligne qui s'annule, un pivot du
+          simplexe dual change de base (aucun candidat : non réalisable au-delà).
+        - 'c' : la ligne des coûts réduits de d suit le tableau ; la base reste
+          optimale tant que les coûts réduits de c + θ·d sont >= 0. La colonne qui
+          s'annule entre par un pivot primal (aucune ligne : non borné au-delà).
+        
+        Sur chaque segment, Z(θ) est linéaire : le résultat donne les segments
+        (intervalle de θ, Z aux extrémités, pente, base, solution aux extrémités),
+        les points de rupture et la fonction valeur (sommets [θ, Z]).
+        """
+        if target not in self.PARAMETRIC_TARGETS:
+            raise ValueError(f'Cible paramétrique invalide: {target}')
+        low, high = float(theta[0]), float(theta[1])
+        if high < low:
+            raise ValueError('Intervalle de θ vide')
+        size = self.n_constraints if target == 'b' else self.n_vars
+        direction = np.asarray(direction, dtype=float)
+        if direction.shape != (size,):
+            raise ValueError(f'Direction: {size} valeurs attendues')
+        epsilon = 1e-9
+        
+        # Problème en θmin (à l'échelle du solveur)
+        if target == 'b':
+            direction = direction * self.row_scale
+            self.b = self.b + low * direction
+        else:
+            direction = direction * self.col_scale
+            self.c = self.c + low * direction
+        A_std, b_rows = self._dual_form()
+        tableau = self._create_tableau(A_std, b_rows, np.concatenate([self.c, np.zeros(len(b_rows))]))
+        self.basis = np.array(self.slack_vars)
+        result = self._solve_from_basis(tableau, "Paramétrique")
+        if not result.get('success'):
+            result['message'] = f"{result['message']} (θ = {low})"
+            return result
+        initial_pivots = self.pivot_count
+        m = len(b_rows)
+        
+        # Direction dans le tableau : colonne avant le second membre ('b') ou
+        # ligne avant la ligne objectif ('c'), mise à jour par les mêmes pivots
+        if target == 'b':
+            column = np.append(self._dual_rows(direction), 0.0)
+            column[:-1] = lu_solve(lu_factor(A_std[:, self.basis]), column[:-1])
+            column[-1] = -np.concatenate([self.c, np.zeros(m)])[self.basis] @ column[:-1]
+            tableau = np.column_stack([tableau[:, :-1], column, tableau[:, -1]])
+        else:
+            row = np.concatenate([direction, np.zeros(m), [0.0]])
+            row -= row[self.basis] @ tableau[:-1]
+            tableau = np.vstack([tableau[:-1], row, tableau[-1:]])
+        tableau = np.ascontiguousarray(tableau)
+        
+        segments, stopped = [], None
+        current = low
+        while True:
+            if target == 'b':
+                rhs, slope = tableau[:-1, -1], tableau[:-1, -2]
+                blocking = slope < -epsilon
+                ratios = np.maximum(rhs[blocking], 0) / -slope[blocking]
+                variables = tableau[:-1, :-2]
+            else:
+                costs, slope = tableau[-1, :-1], tableau[m, :-1]
+                blocking = slope < -epsilon
+                ratios = np.maximum(costs[blocking], 0) / -slope[blocking]
+                variables = tableau[:m, :-1]
+            step = ratios.min() if ratios.size else np.inf
+            following = float(min(high, current + step))
+            
+            # Segment [current, following] : Z et x linéaires en θ
+            start = self._parametric_point(tableau, target, m)
+            if target == 'b':
+                tableau[:, -1] += (following - current) * tableau[:, -2]
+            else:
+                tableau[-1, :] += (following - current) * tableau[m, :]
+            # Segments de longueur nulle (rupture dégénérée) omis, sauf si θmin = θmax
+            if following > current or (not segments and following >= high):
+                end = self._parametric_point(tableau, target, m)
+                segments.append({
+                    'theta': [current, following],
+                    'value': [start['value'], end['value']],
+                    'slope': end['slope'],
+                    'basis': self.export_basis(),
+                    'solution': [start['solution'], end['solution']],
+                })
+            current = following
+            if current >= high:
+                break
+            if self.pivot_count - initial_pivots >= max_pivots:
+                stopped = 'max_pivots'
+                break
+            
+            # Point de rupture : changement de base
+            candidates = np.flatnonzero(blocking)
+            k = candidates[np.flatnonzero(ratios <= step + epsilon)]
+            if target == 'b':
+                pivot_row = int(k[np.argmin(slope[k])])
+                line = variables[pivot_row]
+                negative = np.flatnonzero(line < -epsilon)
+                if negative.size == 0:
+                    stopped = 'infeasible'
+                    break
+                ratios = np.maximum(tableau[-1, negative], 0) / -line[negative]
+                ties = np.flatnonzero(ratios <= ratios.min() + epsilon)
+                pivot_col = int(negative[ties[np.argmax(-line[negative[ties]])]])
+            else:
+                pivot_col = int(k[np.argmin(slope[k])])
+                pivot_row = self._leaving_row(variables[:, pivot_col], tableau[:m, -1], self.basis, epsilon)
+                if pivot_row == -1:
+                    stopped = 'unbounded'
+                    break
+            iteration = len(self.iterations)
+            self.iterations.append(iteration)
+            self._pivot(tableau, pivot_row, pivot_col)
+            self._record_pivot("Paramétrique - θ", iteration, pivot_col, pivot_row, -tableau[-1, -1],
+                               leaving=self.basis[pivot_row])
+            self.basis[pivot_row] = pivot_col
+        
+        vertices = [[segment['theta'][0], segment['value'][0]] for segment in segments]
+        vertices.append([segments[-1]['theta'][1], segments[-1]['value'][1]])
+        messages = {
+            None: 'Analyse paramétrique terminée',
+            'infeasible': f'Problème non réalisable au-delà de θ = {current}',
+            'unbounded': f'Problème non borné au-delà de θ = {current}',
+            'max_pivots': f'Nombre maximum de pivots ({max_pivots}) atteint en θ = {current}',
+        }
+        return {
+            'success': True,
+            'target': target,
+            'theta': [low, current],
+            'segments': segments,
+            'breakpoints': [segment['theta'][0] for segment in segments[1:]],
+            'value_function': vertices,
+            'stopped': stopped,
+            'initial_pivots': initial_pivots,
+            'iterations': len(self.iterations),
+            'method': 'Simplexe paramétrique',
+            'message': messages[stopped],
+        }
+    
+    def _parametric_point(self, tableau, target, m):
+        """Z, pente dZ/dθ et solution (échelle d'origine) au θ courant du tableau paramétrique"""
+        slope = -tableau[-1, -2] if target == 'b' else -tableau[m, -1]
+        solution = np.zeros(self.n_vars)
+        structural = self.basis < self.n_vars
+        solution[self.basis[structural]] = tableau[:m, -1][structural]
+        return {
+            'value': float(-tableau[-1, -1]),
+            'slope': float(slope) + 0.0,
+            'solution': (solution * self.col_scale).tolist(),
+        }
+    
+    def solve_warm_start(self):
+        """
+        Repartir de la base self.warm_basis (voir export_basis) au lieu de la
+        base des écarts et des variables artificielles.
+        
+        La base demandée (variables 'basic', écarts des contraintes 'basic',
+        un écart par égalité) est réduite à des colonnes indépendantes puis
+        complétée par des écarts (QR avec pivotage) si le modèle a changé de
+        taille ou si elle est singulière. Le tableau canonique de cette base
+        part ensuite en simplexe primal ou dual selon la réalisabilité qu'elle
+        conserve (_solve_from_basis). Les statuts manquants valent 'at_lower'
+        pour une variable et 'basic' pour une contrainte (nouvelle ligne lâche).
+        """
+        A_std, b_rows = self._dual_form()
+        m = len(b_rows)
+        variables = list(self.warm_basis.get('variables', []))[:self.n_vars]
+        constraints = list(self.warm_basis.get('constraints', []))[:self.n_constraints]
+        for status in variables + constraints:
+            if status not in self.BASIS_STATUSES:
+                raise ValueError(f'Statut de base invalide: {status}')
+        variables += ['at_lower'] * (self.n_vars - len(variables))
+        constraints += ['basic'] * (self.n_constraints - len(constraints))
+        
+        # Un écart par égalité : le premier des deux (a·x + s1 = b)
+        wanted_slack = np.array([constraints[row] == 'basic' for row in self.slack_rows])
+        first_equality = {}
+        for k, row in enumerate(self.slack_rows):
+            if self.signs[row] == '=':
+                first_equality.setdefault(row, k)
+        wanted_slack[list(first_equality.values())] = True
+        candidates = np.concatenate([
+            np.flatnonzero(np.array(variables) == 'basic'),
+            np.asarray(self.slack_vars)[wanted_slack],
+        ]).astype(int)
+        
+        chosen, rank, Q = np.array([], dtype=int), 0, np.eye(m)
+        if candidates.size:
+            Q, R, piv = qr(A_std[:, candidates], pivoting=True)
+            diag = np.abs(np.diag(R))
+            rank = int(np.sum(diag > 1e-9 * diag[0])) if diag.size and diag[0] > 0 else 0
+            chosen = candidates[piv[:rank]]
+        if rank < m:
+            _, _, rows = qr(Q[:, rank:].T, pivoting=True)
+            chosen = np.concatenate([chosen, np.asarray(self.slack_vars)[rows[:m - rank]]])
+        self.basis = chosen.astype(int)
+        
+        # Tableau canonique de la base : B^-1 [A' | b'] et coûts réduits
+        tableau = np.zeros((m + 1, A_std.shape[1] + 1))
+        tableau[:-1, :] = lu_solve(lu_factor(A_std[:, self.basis]), np.column_stack([A_std, b_rows]))
+        tableau[-1, :self.n_vars] = self.c
+        self._canonicalize_objective(tableau)
+        return self._solve_from_basis(tableau, "Démarrage à chaud")
+    
+    # method='auto' : au-delà de m·n coefficients, le problème part vers HiGHS
+    AUTO_HIGHS_SIZE = 20000
+    
+    def solve(self):
+        """Résoudre avec la méthode choisie (self.method), solution ramenée à l'échelle d'origine"""
+        result = self._solve_method()
+        if self.scaling and result.get('success'):
+            result['solution'] = (np.asarray(result['solution']) * self.col_scale).tolist()
+        # Base finale, réutilisable comme point de départ (moteurs du simplexe)
+        if result.get('success') and len(self.basis):
+            result['basis'] = self.export_basis()
+        # Pivots (dont pivots à pas nul et pivots faits avec la règle de Bland)
+        result['pivots'] = self.pivot_count
+        result['degenerate_pivots'] = self.degenerate_pivots
+        result['bland_pivots'] = self.bland_pivots
+        # Variables artificielles évitées par la base de départ (_crash)
+        result['artificials_avoided'] = len(self.crash_basis)
+        return result
+    
+    def _solve_method(self):
+        if self.warm_basis is not None and self.method not in ('highs', 'interior_point'):
+            return self.solve_warm_start()
+        if self.method == 'auto':
+            large = self.n_constraints * self.n_vars >= self.AUTO_HIGHS_SIZE
+            return self.solve_highs() if large else self.solve_two_phase()
+        solvers = {
+            'big_m': self.solve_big_m,
+            'two_phase': self.solve_two_phase,
+            'revised': self.solve_revised,
+            'interior_point': self.solve_interior_point,
+            'highs': self.solve_highs,
+            'dual_simplex': self.solve_dual_simplex,
+        }
+        return solvers.get(self.method, self.solve_two_phase)()
+
+    def solve_revised(self):
+        """
+        Simplexe révisé (deux phases) sur une base factorisée.
+
+        Au lieu de mettre à jour tout le tableau à chaque pivot, on ne garde que
+        la factorisation LU de la base (BasisFactorization) et on calcule
+        seulement la ligne des coûts réduits et la colonne entrante.
+        Si A est creuse, la base est factorisée avec splu et les colonnes
+        d'écart/artificielles restent implicites (StandardFormMatrix).
+        """
+        A_std, b_std = self.implicit_standard_form(self.crash)
+        n_cols = A_std.shape[1]
+        basis = self._initial_basis()
+        allowed = np.ones(n_cols, dtype=bool)
+
+        if self.artificial_vars:
+            # Phase 1 : Minimiser la somme des variables artificielles
+            c_phase1 = np.zeros(n_cols)
+            c_phase1[self.artificial_vars] = 1
+            result1, basis, factor = self._solve_revised(A_std, b_std, c_phase1, basis, allowed,
+                                                         "Phase 1 - Révisé")
+            if not result1.get('success'):
+                return result1
+
+            optimal_value_phase1 = float(result1.get('optimal_value', 0))
+            if optimal_value_phase1 > 1e-6:
+                return {
+                    'success': False,
+                    'message': f'Aucune solution réalisable trouvée. Somme des variables artificielles = {optimal_value_phase1:.6f}'
+                }
+
+            # Les variables artificielles ne peuvent plus entrer en phase 2
+            allowed[self.artificial_vars] = False
+            self._drive_out_artificials(A_std, basis, factor, allowed)
+
+        c_phase2 = np.concatenate([self.c, np.zeros(n_cols - self.n_vars)])
+        result, basis, factor = self._solve_revised(A_std, b_std, c_phase2, basis, allowed,
+                                                    "Phase 2 - Révisé")
+        self.basis = basis
+        if result.get('success'):
+            return {
+                'success': True,
+                'solution': result['solution'].tolist(),
+                'optimal_value': float(result.get('optimal_value', 0)),
+                'iterations': len(self.iterations),
+                'method': 'Simplexe Révisé',
+                'message': 'Solution optimale trouvée'
+            }
+        return result
+
+    def solve_highs(self):
+        """
+        Résoudre avec HiGHS (scipy.optimize.linprog) : <= va dans A_ub, >= dans
+        -A_ub et = dans A_eq. Sert de moteur rapide pour les gros problèmes et
+        de référence pour les méthodes du simplexe.
+        """
+        signs = np.asarray(self.signs, dtype=object)
+        A = self.A.tocsr() if sp.issparse(self.A) else self.A
+        le, ge, eq = signs == '<=', signs == '>=', signs == '='
+        
+        A_ub = b_ub = A_eq = b_eq = None
+        if le.any() or ge.any():
+            flip = np.where(ge, -1.0, 1.0)[le | ge]
+            A_ub = A[le | ge]
+            A_ub = sp.diags(flip) @ A_ub if sp.issparse(A_ub) else A_ub * flip[:, None]
+            b_ub = self.b[le | ge] * flip
+        if eq.any():
+            A_eq, b_eq = A[eq], self.b[eq]
+        
+        res = linprog(self.c, A_ub=A_ub, b_ub=b_ub, A_eq=A_eq, b_eq=b_eq,
+                      bounds=(0, None), method='highs')
+        self.iterations = list(range(int(getattr(res, 'nit', 0))))
+        
+        if res.status == 0:
+            return {
+                'success': True,
+                'solution': res.x.tolist(),
+                'optimal_value': float(res.fun),
+                'iterations': int(res.nit),
+                'method': 'HiGHS',
+                'message': 'Solution optimale trouvée'
+            }
+        if res.status == 2:
+            return {'success': False, 'message': 'Aucune solution réalisable trouvée'}
+        if res.status == 3:
+            return {'success': False, 'message': 'Le problème est non borné'}
+        if res.status == 1:
+            return {'success': False, 'message': f'Nombre maximum d\'itérations ({res.nit}) atteint'}
+        return {'success': False, 'message': f'Erreur: {res.message}'}
+    
+    def _initial_basis(self):
+        """Base initiale : slack pour <=, colonne de self.crash_basis ou variable artificielle pour >= et ="""
+        basis = []
+        slack_iter = iter(self.slack_vars)
+        artificial_iter = iter(self.artificial_vars)
+        for row, sign in enumerate(self.signs):
+            slack = next(slack_iter) if sign in ('<=', '>=') else None
+            if row in self.crash_basis:
+                basis.append(self.crash_basis[row])
+            elif sign == '<=':
+                basis.append(slack)
+            else:
+                basis.append(next(artificial_iter))
+        return np.array(basis, dtype=int)
+
+    def _solve_revised(self, A, b, c, basis, allowed, phase_name):
+        """Itérations du simplexe révisé à partir d'une base réalisable"""
+        m, n = A.shape
+        iteration = 0
+        # Le simplexe révisé vise les grands problèmes : la limite suit la taille
+        max_iterations = max(1000, 10 * (m + n))
+        epsilon = 1e-8
+
+        basis = basis.copy()
+        factor = BasisFactorization(A, basis)
+        x_B = factor.ftran(b)
+        # Base de variables d'écart et artificielles (±I) : B^-1 a_j a la norme de a_j
+        logical = np.all(basis >= self.n_vars)
+        self.pricing.reset(n, (lambda: 1.0 + A.squared_norms()) if logical else None)
+        stalled = 0
+
+        while iteration < max_iterations:
+            self.iterations.append(iteration)
+
+            # Ligne de prix : d = c - A^T y avec y^T B = c_B^T
+            y = factor.btran(c[basis])
+            frozen = ~allowed
+            frozen[basis] = True
+
+            def price(columns=None):
+                if columns is None:
+                    reduced_costs = c - A.rmatvec(y)
+                    reduced_costs[frozen] = 0
+                    return reduced_costs
+                reduced_costs = c[columns] - A.rmatvec(y, columns)
+                reduced_costs[frozen[columns]] = 0
+                return reduced_costs
+
+            bland = self.bland_after is not None and stalled >= self.bland_after
+            if bland:
+                eligible = np.flatnonzero(price() < -epsilon)
+                pivot_col = int(eligible[0]) if eligible.size else None
+            else:
+                pivot_col = self.pricing.select(price, epsilon)
+            if pivot_col is None:
+                x = np.zeros(n)
+                x[basis] = x_B
+                return {
+                    'success': True,
+                    'solution': x[:self.n_vars],
+                    'optimal_value': float(c[basis] @ x_B),
+                    'iterations': iteration,
+                    'message': 'Solution optimale trouvée'
+                }, basis, factor
+
+            # Colonne entrante : alpha = B^-1 a_q
+            alpha = factor.ftran(A.column(pivot_col))
+            positive = alpha > epsilon
+            if not positive.any():
+                return {
+                    'success': False,
+                    'message': 'Le problème est non borné'
+                }, basis, factor
+
+            pivot_row = self._leaving_row(alpha, x_B, basis, epsilon, bland)
+            step = max(x_B[pivot_row], 0) / alpha[pivot_row]
+            self.degenerate_pivots += int(step <= epsilon)
+            self.bland_pivots += int(bland)
+            # Pivot améliorant : le coût baisse de step · |d_q|
+            stalled = 0 if step * -price([pivot_col])[0] > epsilon else stalled + 1
+
+            leaving = basis[pivot_row]
+            e_r = np.zeros(m)
+            e_r[pivot_row] = 1
+            self.pricing.update(pivot_col, leaving, pivot_row, alpha,
+                                lambda: A.rmatvec(factor.btran(e_r)), lambda: A.rmatvec(factor.btran(alpha)))
+            self._revised_pivot(A, b, basis, factor, x_B, pivot_row, pivot_col, alpha)
+            self._record_pivot(phase_name, iteration, pivot_col, pivot_row, c[basis] @ x_B,
+                               leaving=leaving)
+            iteration += 1
+
+        return {
+            'success': False,
+            'message': f'Nombre maximum d\'itérations ({max_iterations}) atteint'
+        }, basis, factor
+
+    def _revised_pivot(self, A, b, basis, factor, x_B, pivot_row, pivot_col, alpha):
+        """Changer de base (en place) : pivot_col entre, basis[pivot_row] sort"""
+        # Pas jamais négatif (Harris peut choisir une ligne légèrement violée)
+        theta = max(x_B[pivot_row], 0) / alpha[pivot_row]
+        x_B -= theta * alpha
+        x_B[pivot_row] = theta
+        basis[pivot_row] = pivot_col
+        factor.update(pivot_row, alpha)
+        if factor.needs_refactor():
+            factor.refactor(basis)
+            x_B[:] = factor.ftran(b)
+
+    def _drive_out_artificials(self, A, basis, factor, allowed):
+        """
+        Sortir de la base les variables artificielles restées à zéro après la phase 1.
+        Si aucune colonne autorisée ne peut les remplacer, la ligne est redondante
+        et la variable artificielle reste nulle pendant la phase 2.
+        """
+        epsilon = 1e-8
+        artificial = set(self.artificial_vars)
+        for r in range(len(basis)):
+            if basis[r] not in artificial:
+                continue
+            e_r = np.zeros(len(basis))
+            e_r[r] = 1
+            row = A.rmatvec(factor.btran(e_r))
+            row[basis] = 0
+            row[~allowed] = 0
+            candidates = np.where(np.abs(row) > epsilon)[0]
+            if candidates.size == 0:
+                continue
+            pivot_col = int(candidates[np.argmax(np.abs(row[candidates]))])
+            alpha = factor.ftran(A.column(pivot_col))
+            basis[r] = pivot_col
+            factor.update(r, alpha)
+
+    def solve_interior_point(self):
+        """
+        Méthode du point intérieur primal-dual (prédicteur-correcteur de Mehrotra).
+        
+        Travaille sur la forme standard de convert_to_standard_form sans les
+        variables artificielles : min c·x, A_std x = b, x >= 0. Chaque itération
+        résout les équations normales (A D A^T) dy = r par Cholesky. Le nombre
+        d'itérations dépend peu de la taille du problème.
+        
+        Avec self.crossover, la solution intérieure est ramenée à un sommet
+        (solution de base) par quelques pivots du simplexe révisé. Si la méthode
+        diverge (problème non réalisable ou non borné), le simplexe révisé
+        tranche et donne le message habituel.
+        """
+        A_full, b = self.convert_to_standard_form()
+        n_cols = self.n_vars + len(self.slack_vars)
+        A = A_full[:, :n_cols]
+        c = np.concatenate([self.c, np.zeros(n_cols - self.n_vars)])
+        m = A.shape[0]
+        max_iterations = 200
+        tolerance = 1e-9
+        
+        # Point de départ de Mehrotra
+        AAT = self._cholesky(A @ A.T)
+        x = A.T @ cho_solve(AAT, b)
+        y = cho_solve(AAT, A @ c)
+        s = c - A.T @ y
+        x += max(-1.5 * x.min(), 0)
+        s += max(-1.5 * s.min(), 0)
+        xs = x @ s
+        x += 0.5 * xs / max(s.sum(), 1e-300)
+        s += 0.5 * xs / max(x.sum(), 1e-300)
+        if not np.all(x > 0) or not np.all(s > 0):
+            x = np.maximum(x, 1.0)
+            s = np.maximum(s, 1.0)
+        
+        converged = False
+        for iteration in range(max_iterations):
+            self.iterations.append(iteration)
+            r_b = A @ x - b
+            r_c = A.T @ y + s - c
+            mu = x @ s / n_cols
+            primal_obj, dual_obj = c @ x, b @ y
+            if (np.linalg.norm(r_b) <= tolerance * (1 + np.linalg.norm(b))
+                    and np.linalg.norm(r_c) <= tolerance * (1 + np.linalg.norm(c))
+                    and abs(primal_obj - dual_obj) <= tolerance * (1 + abs(primal_obj))):
+                converged = True
+                break
+            if max(np.abs(x).max(), np.abs(y).max() if m else 0) > 1e12 or s.min() < 1e-300:
+                break  # Divergence : non réalisable ou non borné
+            
+            d = x / s
+            if not np.all(np.isfinite(d)) or not np.isfinite(mu):
+                break
+            normal = self._cholesky((A * d) @ A.T)
+            
+            def newton_step(r_xs):
+                """Direction de Newton pour le membre de droite r_xs de S dx + X ds = r_xs"""
+                dy = cho_solve(normal, -r_b - A @ (r_xs / s + d * r_c))
+                ds = -r_c - A.T @ dy
+                dx = (r_xs - x * ds) / s
+                return dx, dy, ds
+            
+            # Prédicteur (direction affine)
+            dx_aff, dy_aff, ds_aff = newton_step(-x * s)
+            alpha_p = self._max_step(x, dx_aff)
+            alpha_d = self._max_step(s, ds_aff)
+            mu_aff = (x + alpha_p * dx_aff) @ (s + alpha_d * ds_aff) / n_cols
+            sigma = (mu_aff / mu) ** 3
+            
+            # Correcteur (centrage + terme du second ordre)
+            dx, dy, ds = newton_step(-x * s - dx_aff * ds_aff + sigma * mu)
+            alpha_p = min(1.0, 0.99 * self._max_step(x, dx, cap=np.inf))
+            alpha_d = min(1.0, 0.99 * self._max_step(s, ds, cap=np.inf))
+            x += alpha_p * dx
+            y += alpha_d * dy
+            s += alpha_d * ds
+        
+        if not converged:
+            self.iterations = []
+            return self.solve_revised()
+        
+        if self.crossover:
+            result = self._crossover(x)
+            if result is not None:
+                return result
+        
+        return {
+            'success': True,
+            'solution': x[:self.n_vars].tolist(),
+            'optimal_value': float(c @ x),
+            'iterations': len(self.iterations),
+            'method': 'Point Intérieur (Mehrotra)',
+            'message': 'Solution optimale trouvée'
+        }
+    
+    def _cholesky(self, M):
+        """Factorisation de Cholesky, régularisée si M est singulière (lignes redondantes)"""
+        regularization = 0.0
+        scale = max(np.abs(np.diag(M)).max(), 1.0) if M.size else 1.0
+        while True:
+            try:
+                return cho_factor(M + regularization * np.eye(M.shape[0]))
+            except np.linalg.LinAlgError:
+                regularization = max(regularization * 100, 1e-14 * scale)
+    
+    def _max_step(self, v, dv, cap=1.0):
+        """Plus grand pas alpha <= cap tel que v + alpha dv >= 0"""
+        negative = dv < 0
+        if not negative.any():
+            return cap
+        return min(cap, float(np.min(-v[negative] / dv[negative])))
+    
+    def _crossover(self, x):
+        """
+        Passer de la solution intérieure x à un sommet optimal.
+        
+        La base est choisie parmi les colonnes de plus grande valeur (QR avec
+        pivotage sur A·X), complétée par des colonnes d'écart/artificielles,
+        puis le simplexe révisé termine en quelques pivots. Retourne None si la
+        base obtenue n'est pas réalisable.
+        """
+        epsilon = 1e-8
+        A_std, b_std = self.implicit_standard_form()
+        m, n_cols = A_std.shape
+        n_real = len(x)
+        
+        candidates = np.where(x > epsilon * max(1.0, x.max()))[0]
+        chosen = np.array([], dtype=int)
+        if candidates.size:
+            W = A_std.columns(candidates)
+            W = (W.toarray() if sp.issparse(W) else W) * x[candidates]
+            Q, R, piv = qr(W, pivoting=True)
+            diag = np.abs(np.diag(R))
+            rank = int(np.sum(diag > 1e-9 * diag[0])) if diag.size else 0
+            chosen = candidates[piv[:rank]]
+        else:
+            Q, rank = np.eye(m), 0
+        
+        # Compléter avec les colonnes logiques des lignes les moins couvertes
+        logical = self._initial_basis()
+        if rank < m:
+            _, _, rows = qr(Q[:, rank:].T, pivoting=True)
+            basis = np.concatenate([chosen, logical[rows[:m - rank]]])
+        else:
+            basis = chosen
+        basis = basis.astype(int)
+        
+        factor = BasisFactorization(A_std, basis)
+        x_B = factor.ftran(b_std)
+        artificial = np.isin(basis, self.artificial_vars)
+        if x_B.min() < -1e-7 or (artificial.any() and x_B[artificial].max() > 1e-7):
+            return None
+        
+        allowed = np.ones(n_cols, dtype=bool)
+        allowed[self.artificial_vars] = False
+        self._drive_out_artificials(A_std, basis, factor, allowed)
+        c_full = np.concatenate([self.c, np.zeros(n_cols - self.n_vars)])
+        result, basis, factor = self._solve_revised(A_std, b_std, c_full, basis, allowed, "Crossover")
+        if not result.get('success'):
+            return None
+        self.basis = basis
+        return {
+            'success': True,
+            'solution': result['solution'].tolist(),
+            'optimal_value': float(result.get('optimal_value', 0)),
+            'iterations': len(self.iterations),
+            'method': 'Point Intérieur (Mehrotra) + crossover',
+            'message': 'Solution optimale trouvée'
+        }
+    
+    def _phase1_to_phase2(self, tableau):
+        """
+        Transition entre les deux phases : les variables artificielles encore
+        dans la base (à zéro) sont remplacées par une variable non artificielle
+        de leur ligne ; si la ligne n'en contient aucune, elle est redondante et
+        supprimée. Les colonnes artificielles (les dernières) sont ensuite
+        retirées : la phase 2 travaille sur un tableau strictement plus petit.
+        """
+        epsilon = 1e-8
+        n_kept = self.artificial_vars[0] if self.artificial_vars else tableau.shape[1] - 1
+        keep_rows = []
+        for r in range(len(self.basis)):
+            if self.basis[r] >= n_kept:
+                row = np.abs(tableau[r, :n_kept])
+                pivot_col = int(np.argmax(row))
+                if row[pivot_col] <= epsilon:
+                    continue  # Ligne redondante
+                self._pivot(tableau, r, pivot_col)
+                self.basis[r] = pivot_col
+            keep_rows.append(r)
+        
+        rows = keep_rows + [tableau.shape[0] - 1]
+        cols = list(range(n_kept)) + [tableau.shape[1] - 1]
+        self.basis = self.basis[keep_rows]
+        return np.ascontiguousarray(tableau[np.ix_(rows, cols)])
+    
+    def _create_tableau(self, A, b, c):
+        """
+        Créer le tableau du simplexe initial.
+        La dernière ligne contient les coûts réduits (c au départ) et -Z en
+        dernière colonne : l'optimum est atteint quand elle est >= 0.
+        """
+        m, n = A.shape
+        tableau = np.zeros((m + 1, n + 1), dtype=float)
+        tableau[:m, :n] = A
+        tableau[:m, n] = b
+        tableau[m, :n] = c
+        tableau[m, n] = 0
+        return tableau
+    
+    def _canonicalize_objective(self, tableau):
+        """
+        Mettre la ligne objectif sous forme canonique pour la base self.basis :
+        le coefficient de chaque variable de base devient 0. Les colonnes de base
+        étant des colonnes unité, toutes les lignes sont soustraites en une fois.
+        """
+        coeffs = tableau[-1, self.basis].copy()
+        tableau[-1, :] -= coeffs @ tableau[:-1, :]
+    
+    def _solve_tableau(self, tableau, phase_name, lower_bound=None):
+        """
+        Résoudre le tableau du simplexe. `lower_bound` : minimum connu de
+        l'objectif (0 pour la somme des variables artificielles de la phase 1).
+        """
+        iteration = 0
+        max_iterations = 1000
+        epsilon = 1e-8  # Increased from 1e-10 for numerical stability
+        
+        if self.history != 'off':
+            self.initial_tableaux[phase_name] = tableau.copy()
+        
+        # Le tableau contient B^-1 A : normes et produits des colonnes sont exacts
+        self.pricing.reset(tableau.shape[1] - 1, lambda: 1.0 + np.sum(tableau[:-1, :-1] ** 2, axis=0))
+        
+        # Perturbation : le test du rapport travaille sur un second membre légèrement
+        # relevé, mis à jour à chaque pivot comme une colonne du tableau ; le tableau
+        # lui-même reste exact et la base finale est nettoyée par le simplexe dual
+        shifted = None
+        if self.perturbation:
+            rhs = tableau[:-1, -1]
+            shifted = rhs + self.PERTURBATION * (1 + np.abs(rhs)) * np.random.default_rng(0).uniform(1, 2, len(rhs))
+        stalled = 0
+        
+        while iteration < max_iterations:
+            # Sauvegarder l'itération
+            if self.history == 'full':
+                self.tableau_history.append({
+                    'iteration': iteration,
+                    'phase': phase_name,
+                    'tableau': tableau.copy()
+                })
+            self.iterations.append(iteration)
+            
+            # Vérifier l'optimalité : la ligne de Z contient les coûts réduits
+            # (c au départ), optimal quand tous sont >= 0
+            last_row = tableau[-1, :-1]
+            # Choisir la colonne du pivot selon la règle de prix (None : aucun coefficient négatif),
+            # ou le plus petit indice éligible (Bland) après trop de pivots sans amélioration
+            bland = self.bland_after is not None and stalled >= self.bland_after
+            if bland:
+                eligible = np.flatnonzero(last_row < -epsilon)
+                pivot_col = int(eligible[0]) if eligible.size else None
+            else:
+                pivot_col = self.pricing.select(lambda columns=None: last_row if columns is None else last_row[columns],
+                                                epsilon)
+            if pivot_col is None and shifted is not None:
+                # Retirer la perturbation : la base est optimale pour le second membre
+                # perturbé, quelques pivots duaux la rendent réalisable pour le vrai
+                status, iteration = self._dual_simplex(tableau, phase_name, iteration, epsilon)
+                if status != 'optimal':
+                    return {
+                        'success': False,
+                        'message': 'Aucune solution réalisable trouvée'
+                    }, tableau
+            if pivot_col is None:
+                # Solution optimale trouvée
+                solution = self._extract_solution(tableau)
+                optimal_value = -tableau[-1, -1]
+                
+                return {
+                    'success': True,
+                    'solution': solution,
+                    'optimal_value': optimal_value,
+                    'iterations': iteration,
+                    'message': 'Solution optimale trouvée'
+                }, tableau
+            
+            # Objectif à son minimum connu (phase 1 : somme des artificielles nulle) :
+            # optimal même s'il reste des coûts réduits négatifs (pivots dégénérés).
+            # Ailleurs (Grand M, phase 2) Z = 0 ne dit rien de l'optimalité.
+            if lower_bound is not None and -tableau[-1, -1] <= lower_bound + epsilon and shifted is None:
+                return {
+                    'success': True,
+                    'solution': self._extract_solution(tableau),
+                    'optimal_value': -tableau[-1, -1],
+                    'iterations': iteration,
+                    'message': 'Solution optimale trouvée'
+                }, tableau
+            
+            # Choisir la ligne du pivot (Harris, ou plus petit rapport avec la règle de Bland)
+            rhs = tableau[:-1, -1] if shifted is None else shifted
+            pivot_row = self._leaving_row(tableau[:-1, pivot_col], rhs, self.basis, epsilon, bland)
+            
+            # Vérifier si le problème est non borné
+            if pivot_row == -1:
+                # Aucun coefficient positif -> la variable peut augmenter indéfiniment
+                return {
+                    'success': False,
+                    'message': 'Le problème est non borné'
+                }, tableau
+            
+            # Poids de la règle de prix, avant que le pivot ne modifie le tableau
+            alpha = tableau[:-1, pivot_col].copy()
+            self.pricing.update(pivot_col, self.basis[pivot_row], pivot_row, alpha,
+                                lambda: tableau[pivot_row, :-1], lambda: alpha @ tableau[:-1, :-1])
+            
+            if shifted is not None:
+                shifted[pivot_row] /= alpha[pivot_row]
+                shifted -= alpha * shifted[pivot_row] * (np.arange(len(alpha)) != pivot_row)
+            
+            # Effectuer le pivot (Gauss-Jordan)
+            objective = tableau[-1, -1]
+            self.degenerate_pivots += int(max(tableau[pivot_row, -1], 0) / alpha[pivot_row] <= epsilon)
+            self.bland_pivots += int(bland)
+            self._pivot(tableau, pivot_row, pivot_col)
+            self._record_pivot(phase_name, iteration, pivot_col, pivot_row, -tableau[-1, -1],
+                               leaving=self.basis[pivot_row])
+            self.basis[pivot_row] = pivot_col
+            # -Z augmente quand Z diminue : pivot améliorant
+            stalled = 0 if tableau[-1, -1] - objective > epsilon * (1 + abs(objective)) else stalled + 1
+            
+            iteration += 1
+        
+        return {
+            'success': False,
+            'message': f'Nombre maximum d\'itérations ({max_iterations}) atteint'
+        }, tableau
+    
+    def _dual_simplex(self, tableau, phase_name, iteration=0, epsilon=1e-8, max_iterations=1000):
+        """
+        Pivots du simplexe dual sur un tableau dont les coûts réduits sont >= 0
+        (base duale réalisable) : la ligne sortante a le second membre le plus
+        négatif, la colonne entrante minimise d_j / |a_rj| parmi a_rj < 0, donc
+        les coûts réduits restent >= 0. S'arrête quand la base est réalisable.
+        Retourne (statut, itération) avec statut 'optimal', 'infeasible' (une ligne
+        négative sans coefficient négatif) ou 'max_iterations'.
+        """
+        stop = iteration + max_iterations
+        while iteration < stop:
+            if self.history == 'full':
+                self.tableau_history.append({
+                    'iteration': iteration,
+                    'phase': phase_name,
+                    'tableau': tableau.copy()
+                })
+            status, pivot_row, pivot_col = self._dual_pivot(tableau, epsilon)
+            if status is not None:
+                return status, iteration
+            self.degenerate_pivots += int(max(tableau[-1, pivot_col], 0) <= -tableau[pivot_row, pivot_col] * epsilon)
+            self.iterations.append(iteration)
+            self._pivot(tableau, pivot_row, pivot_col)
+            self._record_pivot(phase_name, iteration, pivot_col, pivot_row, -tableau[-1, -1],
+                               leaving=self.basis[pivot_row])
+            self.basis[pivot_row] = pivot_col
+            iteration += 1
+        return 'max_iterations', iteration
+    
+    @staticmethod
+    def _dual_pivot(tableau, epsilon=1e-8):
+        """
+        Choix du pivot du simplexe dual (règles de _dual_simplex). Retourne
+        (statut, ligne, colonne) : statut 'optimal' ou 'infeasible' quand il n'y
+        a pas de pivot, None sinon.
+        """
+        rhs = tableau[:-1, -1]
+        pivot_row = int(np.argmin(rhs))
+        if rhs[pivot_row] >= -epsilon:
+            return 'optimal', None, None
+        row = tableau[pivot_row, :-1]
+        negative = np.flatnonzero(row < -epsilon)
+        if negative.size == 0:
+            return 'infeasible', None, None
+        ratios = np.maximum(tableau[-1, negative], 0) / -row[negative]
+        # Égalités départagées par le plus grand |a_rj| (pivot le plus stable)
+        ties = np.flatnonzero(ratios <= ratios.min() + epsilon)
+        return None, pivot_row, int(negative[ties[np.argmax(-row[negative[ties]])]])
+    
+    # Violation tolérée par le test de Harris et amplitude relative de la perturbation
+    HARRIS_TOLERANCE = 1e-9
+    PERTURBATION = 1e-7
+    
+    def _leaving_row(self, column, rhs, basis, epsilon, bland=False):
+        """
+        Ligne sortante pour la colonne entrante `column` (B^-1 a_q). -1 si aucun
+        coefficient n'est positif (non borné).
+        - Harris (self.harris) : 1re passe, pas maximal en tolérant une violation
+          HARRIS_TOLERANCE de chaque borne ; 2e passe, parmi les lignes dont le
+          rapport ne dépasse pas ce pas, le plus grand pivot (le plus stable).
+        - Bland : plus petit rapport, égalités départagées par le plus petit indice de base.
+        - Sinon : plus petit rapport.
+        """
+        positive = column > epsilon
+        if not positive.any():
+            return -1
+        rhs = np.maximum(rhs, 0)
+        ratios = np.full(column.shape, np.inf)
+        ratios[positive] = rhs[positive] / column[positive]
+        if bland:
+            ties = np.flatnonzero(ratios <= ratios.min() + epsilon)
+            return int(ties[np.argmin(np.asarray(basis)[ties])])
+        if not self.harris:
+            return int(np.argmin(ratios))
+        theta_max = np.min((rhs[positive] + self.HARRIS_TOLERANCE) / column[positive])
+        return int(np.argmax(np.where(positive & (ratios <= theta_max), column, 0)))
+    
+    def _record_pivot(self, phase_name, iteration, entering, leaving_row, objective, leaving):
+        """Compter le pivot et l'ajouter au journal (modes 'pivots' et 'full')"""
+        self.pivot_count += 1
+        if self.history == 'off':
+            return
+        self.pivot_history.append({
+            'phase': phase_name,
+            'iteration': iteration,
+            'entering': int(entering),
+            'leaving': int(leaving),
+            'leaving_row': int(leaving_row),
+            'objective': float(objective)
+        })
+    
+    def rebuild_tableau(self, phase_name, iteration):
+        """
+        Reconstruire le tableau de la phase `phase_name` au début de l'itération
+        `iteration`, en rejouant les pivots du journal sur le tableau initial.
+        """
+        if phase_name not in self.initial_tableaux:
+            raise ValueError(f'Aucun tableau initial pour la phase: {phase_name}')
+        tableau = self.initial_tableaux[phase_name].copy()
+        pivots = [p for p in self.pivot_history if p['phase'] == phase_name]
+        if iteration > len(pivots):
+            raise ValueError(f'Itération {iteration} absente de la phase: {phase_name}')
+        for p in pivots[:iteration]:
+            self._pivot(tableau, p['leaving_row'], p['entering'])
+        return tableau
+    
+    @staticmethod
+    def _pivot(tableau, pivot_row, pivot_col):
+        """
+        Pivot de Gauss-Jordan en place : la ligne du pivot est normalisée puis
+        une seule mise à jour de rang 1 (BLAS dger) élimine la colonne du pivot
+        dans toutes les autres lignes, sans tableau temporaire par ligne.
+        """
+        tableau[pivot_row, :] /= tableau[pivot_row, pivot_col]
+        pivot_line = tableau[pivot_row, :].copy()
+        factors = tableau[:, pivot_col].copy()
+        factors[pivot_row] = 0
+        if tableau.flags.c_contiguous:
+            # tableau.T est en ordre Fortran : dger écrit directement dans tableau
+            dger(-1.0, pivot_line, factors, a=tableau.T, overwrite_a=True)
+        else:
+            tableau -= np.outer(factors, pivot_line)
+
+    def _extract_solution(self, tableau):
+        """Extraire la solution du tableau final (variables de base lues dans self.basis)"""
+        solution = np.zeros(self.n_vars, dtype=float)
+        structural = self.basis < self.n_vars
+        solution[self.basis[structural]] = tableau[:-1, -1][structural]
+        return solution
+
+
+
+class BranchAndBound:
+    """
+    Programmation linéaire en nombres entiers (minimiser c·x) par séparation
+    et évaluation, avec le simplexe pour les relaxations.
+    
+    `integrality` donne le type de chaque variable : 'continuous', 'integer'
+    ou 'binary' (entière avec x <= 1). La relaxation de la racine est résolue
+    sur la forme _dual_form ; chaque nœud fils part du tableau final de son
+    père, auquel la contrainte de branchement (x_j <= ⌊v⌋ ou x_j >= ⌈v⌉) est
+    ajoutée comme ligne d'écart (SimplexSolver._append_rows) : quelques pivots
+    du simplexe dual suffisent, sans nouvelle résolution.
+    
+    Sélection des nœuds : 'best_bound' (plus petite borne d'abord) ou
+    'depth_first' (pile, trouve vite une solution entière). Un nœud dont la
+    borne ne fait pas mieux que la meilleure solution entière est élagué.
+    Avec `parallel`, les nœuds ouverts sont évalués par lots de `workers`
+    nœuds (par défaut os.cpu_count()) dans le pool de processus de /solve/batch.
+    """
+    
+    INTEGRALITY = ('continuous', 'integer', 'binary')
+    NODE_SELECTIONS = ('best_bound', 'depth_first')
+    # Tolérance d'intégralité d'une valeur de la relaxation
+    INTEGER_TOLERANCE = 1e-6
+    
+    def __init__(self, c, A, b, signs, integrality, node_selection='best_bound', gap=1e-6, max_nodes=10000,
+                 parallel=False, workers=None, **options):
+        integrality = list(integrality)
+        if len(integrality) != len(c):
+            raise ValueError(f'Intégralité: {len(c)} valeurs attendues')
+        for kind in integrality:
+            if kind not in self.INTEGRALITY:
+                raise ValueError(f'Type de variable invalide: {kind}')
+        if node_selection not in self.NODE_SELECTIONS:
+            raise ValueError(f'Sélection des nœuds invalide: {node_selection}')
+        self.c = np.array(c, dtype=float)
+        self.A = A
+        self.b = np.array(b, dtype=float)
+        self.signs = list(signs)
+        self.integer = np.flatnonzero(np.isin(integrality, ('integer', 'binary')))
+        self.binary = np.flatnonzero(np.array(integrality, dtype=object) == 'binary')
+        self.node_selection = node_selection
+        self.gap = gap
+        self.max_nodes = max_nodes
+        self.parallel = parallel
+        self.workers = workers
+        self.options = options
+    
+    def solve(self):
+        """Résoudre ; le résultat ajoute nodes, open_nodes, bound et gap au format de /solve"""
+        # x_j <= 1 des variables binaires : lignes supplémentaires de la racine
+        A, b, signs = self.A, self.b, self.signs
+        if self.binary.size:
+            bounds = np.zeros((self.binary.size, len(self.c)))
+            bounds[np.arange(self.binary.size), self.binary] = 1
+            A = sp.vstack([A, sp.csr_matrix(bounds)]) if sp.issparse(A) else np.vstack([np.asarray(A, dtype=float), bounds])
+            b = np.concatenate([b, np.ones(self.binary.size)])
+            signs = signs + ['<='] * self.binary.size
+        
+        root = SimplexSolver(self.c, A, b, signs, 'dual_simplex', False, history='off', **self.options)
+        A_std, b_rows = root._dual_form()
+        tableau = root._create_tableau(A_std, b_rows, np.concatenate([root.c, np.zeros(len(b_rows))]))
+        root.basis = np.array(root.slack_vars)
+        relaxation = root._solve_from_basis(tableau, "Relaxation")
+        pivots = root.pivot_count
+        if not relaxation.get('success'):
+            message = relaxation['message']
+            if 'non borné' in message:
+                message = 'La relaxation continue est non bornée'
+            return {'success': False, 'message': message, 'nodes': 1, 'pivots': pivots}
+        
+        # Les branchements portent sur x = C·x' (mise à l'échelle de la racine)
+        self.col_scale = root.col_scale
+        incumbent, incumbent_value = None, np.inf
+        # Nœud ouvert : (borne du père, numéro, tableau du père, base, branchement)
+        open_nodes = []
+        counter = 0
+        nodes = 1
+        node = self._child_state(-tableau[-1, -1], tableau, root.basis)
+        candidate = self._branching_variable(node['solution'])
+        if candidate is None:
+            incumbent, incumbent_value = node['solution'], node['value']
+        else:
+            for child in self._children(node, candidate):
+                counter += 1
+                self._push(open_nodes, (node['value'], counter, tableau, root.basis, child))
+        
+        while open_nodes and nodes < self.max_nodes:
+            if self._gap(incumbent_value, open_nodes) <= self.gap:
+                break
+            batch = []
+            # Dans un worker du pool (/solve/batch), les nœuds restent dans ce processus
+            parallel = self.parallel and not _in_pool_worker()
+            size = (self.workers or os.cpu_count() or 1) if parallel else 1
+            while open_nodes and len(batch) < size:
+                entry = self._pop(open_nodes)
+                if entry[0] < incumbent_value - self._tolerance(incumbent_value):
+                    batch.append(entry)
+            if not batch:
+                break
+            jobs = [(entry[2], entry[3], len(self.c), entry[4]) for entry in batch]
+            if parallel and len(jobs) > 1:
+                evaluated = list(get_executor().map(_branch_node, *zip(*jobs)))
+            else:
+                evaluated = [_branch_node(*job) for job in jobs]
+            
+            for entry, (status, child_tableau, child_basis, node_pivots) in zip(batch, evaluated):
+                nodes += 1
+                pivots += node_pivots
+                if status != 'optimal':
+                    continue
+                node = self._child_state(-child_tableau[-1, -1], child_tableau, child_basis)
+                if node['value'] >= incumbent_value - self._tolerance(incumbent_value):
+                    continue
+                candidate = self._branching_variable(node['solution'])
+                if candidate is None:
+                    incumbent, incumbent_value = node['solution'], node['value']
+                    continue
+                for child in self._children(node, candidate):
+                    counter += 1
+                    self._push(open_nodes, (node['value'], counter, child_tableau, child_basis, child))
+        
+        open_nodes = [entry for entry in open_nodes if entry[0] < incumbent_value - self._tolerance(incumbent_value)]
+        bound = min([incumbent_value] + [entry[0] for entry in open_nodes])
+        summary = {'nodes': nodes, 'open_nodes': len(open_nodes), 'pivots': pivots}
+        if incumbent is None:
+            message = 'Aucune solution entière trouvée' + (f' ({self.max_nodes} nœuds)' if open_nodes else '')
+            return dict(summary, success=False, message=message, bound=float(bound) if open_nodes else None)
+        solution = incumbent.copy()
+        solution[self.integer] = np.round(solution[self.integer])
+        gap = self._gap(incumbent_value, open_nodes)
+        return dict(summary, **{
+            'success': True,
+            'solution': solution.tolist(),
+            'optimal_value': float(incumbent_value),
+            'bound': float(bound),
+            'gap': float(gap),
+            'iterations': nodes,
+            'method': 'Branch and Bound',
+            'message': 'Solution optimale trouvée' if gap <= self.gap else f'Solution entière trouvée (écart {gap:.2%})',
+        })
+    
+    def _tolerance(self, value):
+        return 1e-9 * (1 + abs(value)) if np.isfinite(value) else 0.0
+    
+    def _gap(self, incumbent_value, open_nodes):
+        """Écart relatif entre la meilleure solution entière et la plus petite borne ouverte"""
+        if not np.isfinite(incumbent_value):
+            return np.inf
+        if not open_nodes:
+            return 0.0
+        bound = min(entry[0] for entry in open_nodes)
+        return max(0.0, incumbent_value - bound) / max(1.0, abs(incumbent_value))
+    
+    def _push(self, open_nodes, entry):
+        # best_bound : tas sur (borne, numéro) ; depth_first : pile
+        if self.node_selection == 'best_bound':
+            heapq.heappush(open_nodes, entry)
+        else:
+            open_nodes.append(entry)
+    
+    def _pop(self, open_nodes):
+        return heapq.heappop(open_nodes) if self.node_selection == 'best_bound' else open_nodes.pop()
+    
+    def _child_state(self, value, tableau, basis):
+        m = len(basis)
+        solution = np.zeros(len(self.c))
+        structural = basis < len(self.c)
+        solution[basis[structural]] = tableau[:m, -1][structural]
+        return {'value': float(value), 'solution': solution * self.col_scale}
+    
+    def _branching_variable(self, solution):
+        """Variable entière la plus fractionnaire, None si la solution est entière"""
+        values = solution[self.integer]
+        fractional = np.abs(values - np.round(values))
+        if not self.integer.size or fractional.max() <= self.INTEGER_TOLERANCE:
+            return None
+        return int(self.integer[np.argmax(fractional)])
+    
+    def _children(self, node, variable):
+        """
+        Contraintes de branchement x_j <= ⌊v⌋ et x_j >= ⌈v⌉ (échelle du solveur :
+        coefficient C_j). En profondeur, le fils le plus proche de v est empilé
+        en dernier, donc exploré d'abord.
+        """
+        value = node['solution'][variable]
+        down = (variable, self.col_scale[variable], np.floor(value), '<=')
+        up = (variable, self.col_scale[variable], np.ceil(value), '>=')
+        return [up, down] if value - np.floor(value) < 0.5 else [down, up]
+
+
+def _dual_reoptimize(tableau, basis, epsilon=1e-8, max_iterations=1000):
+    """
+    Simplexe dual en place sur un tableau et sa base (mêmes pivots que
+    SimplexSolver._dual_simplex, sans journal ni compteurs du solveur).
+    Retourne (statut, nombre de pivots).
+    """
+    for pivots in range(max_iterations):
+        status, pivot_row, pivot_col = SimplexSolver._dual_pivot(tableau, epsilon)
+        if status is not None:
+            return status, pivots
+        SimplexSolver._pivot(tableau, pivot_row, pivot_col)
+        basis[pivot_row] = pivot_col
+    return 'max_iterations', max_iterations
+
+
+def _branch_node(tableau, basis, n_vars, branch):
+    """
+    Évaluer un nœud : ajouter la contrainte de branchement au tableau final du
+    père et rétablir la réalisabilité par le simplexe dual. Fonction de module,
+    exécutable dans le pool de processus. Retourne (statut, tableau, base, pivots).
+    """
+    variable, scale, value, sign = branch
+    row = np.zeros(n_vars)
+    row[variable] = scale
+    tableau, basis = SimplexSolver._extend_tableau(tableau, np.asarray(basis), n_vars, row, [value], [sign])
+    status, pivots = _dual_reoptimize(tableau, basis)
+    return status, tableau, basis, pivots
+
+
+class ColumnGeneration:
+    """
+    Génération de colonnes (minimiser c·x) pour les modèles dont les colonnes
+    sont trop nombreuses pour être construites (découpe, rotations d'équipages).
+    
+    Le problème maître restreint (c, A, b, signs : colonnes de départ, qui
+    doivent le rendre réalisable) est résolu sur la forme _dual_form. À chaque
+    tour, `pricing_callback(duals)` reçoit les prix duaux y des contraintes et
+    renvoie des colonnes candidates, paires (coût, coefficients) ; celles de
+    coût réduit c - y·a < 0 sont ajoutées au tableau courant
+    (SimplexSolver._append_columns) et quelques pivots du simplexe primal
+    rétablissent l'optimalité, sans reconstruire ni résoudre à nouveau le
+    maître. La génération s'arrête quand aucune colonne proposée n'a de coût
+    réduit négatif (optimum du problème complet si le rappel est exact).
+    """
+    
+    def __init__(self, c, A, b, signs, pricing_callback, max_rounds=1000, epsilon=1e-9, **options):
+        self.c = np.array(c, dtype=float)
+        self.A = A
+        self.b = np.array(b, dtype=float)
+        self.signs = list(signs)
+        self.pricing_callback = pricing_callback
+        self.max_rounds = max_rounds
+        self.epsilon = epsilon
+        self.options = options
+    
+    def solve(self):
+        """
+        Résoudre ; le résultat ajoute rounds (appels du rappel), columns (colonnes
+        générées, dans l'ordre des variables après celles de départ), duals,
+        objective_values (valeur du maître à chaque tour) et pivots
+        """
+        solver = SimplexSolver(self.c, self.A, self.b, self.signs, 'dual_simplex', False, history='off', **self.options)
+        A_std, b_rows = solver._dual_form()
+        tableau = solver._create_tableau(A_std, b_rows, np.concatenate([solver.c, np.zeros(len(b_rows))]))
+        solver.basis = np.array(solver.slack_vars)
+        result = solver._solve_from_basis(tableau, "Problème maître")
+        if not result.get('success'):
+            return dict(result, rounds=0, columns=[], pivots=solver.pivot_count)
+        
+        columns, values = [], [float(-tableau[-1, -1])]
+        rounds, converged = 0, False
+        while rounds < self.max_rounds:
+            duals = solver._dual_prices(tableau)
+            rounds += 1
+            proposed = list(self.pricing_callback(duals.copy()))
+            if proposed:
+                costs = np.array([cost for cost, _ in proposed], dtype=float)
+                candidates = np.array([coefficients for _, coefficients in proposed], dtype=float).reshape(len(proposed), -1)
+                if candidates.shape[1] != solver.n_constraints:
+                    raise ValueError(f'Colonne générée: {solver.n_constraints} coefficients attendus')
+                improving = costs - candidates @ duals < -self.epsilon * (1 + np.abs(costs))
+                costs, candidates = costs[improving], candidates[improving]
+            if not proposed or not costs.size:
+                converged = True
+                break
+            tableau = solver._append_columns(tableau, candidates, costs)
+            columns.extend(candidates.tolist())
+            result, tableau = solver._solve_tableau(tableau, "Problème maître - Primal")
+            if not result.get('success'):
+                return dict(result, rounds=rounds, columns=columns, pivots=solver.pivot_count)
+            values.append(float(-tableau[-1, -1]))
+        
+        return {
+            'success': True,
+            'solution': (solver._extract_solution(tableau) * solver.col_scale).tolist(),
+            'optimal_value': values[-1],
+            'duals': solver._dual_prices(tableau).tolist(),
+            'columns': columns,
+            'rounds': rounds,
+            'objective_values': values,
+            'pivots': solver.pivot_count,
+            'iterations': solver.pivot_count,
+            'method': 'Génération de colonnes',
+            'message': 'Solution optimale trouvée' if converged
+                       else f'Nombre maximum de tours ({self.max_rounds}) atteint',
+        }
+
+
+def knapsack_pricing(widths, capacity):
+    """
+    Rappel de prix de la découpe : sac à dos entier sur les largeurs (entières)
+    des pièces, valeur de la pièce i = prix dual y_i. Le motif de valeur
+    maximale dont la largeur totale ne dépasse pas `capacity` est proposé
+    comme colonne de coût 1 (un rouleau) ; aucune colonne si sa valeur ne
+    dépasse pas 1 (coût réduit 1 - y·a >= 0).
+    """
+    widths = np.asarray(widths, dtype=int)
+    
+    def pricing(duals):
+        # Programmation dynamique sur la capacité : best[w] = meilleure valeur en largeur w
+        useful = np.flatnonzero((duals > 0) & (widths <= capacity))
+        best = np.zeros(capacity + 1)
+        choice = np.full(capacity + 1, -1)
+        for w in range(1, capacity + 1):
+            fits = useful[widths[useful] <= w]
+            best[w], choice[w] = best[w - 1], -1
+            if fits.size:
+                gains = best[w - widths[fits]] + duals[fits]
+                k = int(np.argmax(gains))
+                if gains[k] > best[w]:
+                    best[w], choice[w] = gains[k], fits[k]
+        if best[capacity] <= 1 + 1e-9:
+            return []
+        pattern = np.zeros(len(widths))
+        w = capacity
+        while w > 0:
+            if choice[w] < 0:
+                w -= 1
+            else:
+                pattern[choice[w]] += 1
+                w -= widths[choice[w]]
+        return [(1.0, pattern)]
+    
+    return pricing
+
+
+def cutting_stock(widths, demands, roll_width, **options):
+    """
+    Relaxation continue de la découpe de rouleaux : minimiser le nombre de
+    rouleaux de largeur `roll_width` pour couvrir `demands[i]` pièces de largeur
+    `widths[i]`. Motifs de départ : une seule largeur par rouleau ; les autres
+    viennent de knapsack_pricing. Le résultat de ColumnGeneration ajoute
+    `patterns` (motif de chaque variable de `solution`).
+    """
+    widths = np.asarray(widths, dtype=int)
+    if np.any(widths <= 0) or np.any(widths > roll_width):
+        raise ValueError('Largeurs de pièces invalides')
+    A = np.diag(roll_width // widths).astype(float)
+    result = ColumnGeneration(np.ones(len(widths)), A, demands, ['>='] * len(widths),
+                              knapsack_pricing(widths, roll_width), **options).solve()
+    result['patterns'] = [[int(v) for v in column] for column in A.T.tolist() + result['columns']]
+    return result
+
+
+class RowGeneration:
+    """
+    Génération de contraintes à la demande (minimiser c·x) pour les modèles
+    dont seule une petite partie d'une grande famille de contraintes est
+    active à l'optimum.
+    
+    Le problème (c, A, b, signs : lignes de départ, qui doivent le borner) est
+    résolu sur la forme _dual_form. À chaque optimum, `separation_callback(x)`
+    renvoie des contraintes {"coefficients": [...], "sign": "<=", "rhs": v}
+    (format de add_constraints des sessions) ; celles que x viole sont ajoutées
+    au tableau courant comme lignes d'écart (SimplexSolver._append_rows) et le
+    simplexe dual rétablit la réalisabilité. La génération s'arrête quand
+    aucune contrainte proposée n'est violée.
+    
+    `max_rows` plafonne le nombre de lignes du tableau : au-delà, les
+    contraintes ajoutées dont les variables d'écart sont toutes de base
+    (contraintes lâches) sont retirées (SimplexSolver._remove_rows) ; elles
+    reviennent si le rappel les propose de nouveau.
+    """
+    
+    def __init__(self, c, A, b, signs, separation_callback, max_rows=None, max_rounds=1000, epsilon=1e-9,
+                 **options):
+        self.c = np.array(c, dtype=float)
+        self.A = A
+        self.b = np.array(b, dtype=float)
+        self.signs = list(signs)
+        self.separation_callback = separation_callback
+        self.max_rows = max_rows
+        self.max_rounds = max_rounds
+        self.epsilon = epsilon
+        self.options = options
+    
+    def solve(self):
+        """
+        Résoudre ; le résultat ajoute rows (contraintes ajoutées encore dans le
+        modèle), rows_added, rows_purged, rounds (appels du rappel),
+        objective_values (valeur à chaque tour) et pivots
+        """
+        solver = SimplexSolver(self.c, self.A, self.b, self.signs, 'dual_simplex', False, history='off', **self.options)
+        A_std, b_rows = solver._dual_form()
+        tableau = solver._create_tableau(A_std, b_rows, np.concatenate([solver.c, np.zeros(len(b_rows))]))
+        solver.basis = np.array(solver.slack_vars)
+        result = solver._solve_from_basis(tableau, "Lignes de départ")
+        summary = {'rows': [], 'rows_added': 0, 'rows_purged': 0, 'rounds': 0}
+        if not result.get('success'):
+            return dict(result, pivots=solver.pivot_count, **summary)
+        
+        # Contraintes ajoutées ; owner[k] : contrainte de la k-ième colonne d'écart ajoutée
+        seed_width = tableau.shape[1] - 1
+        constraints, active, owner = [], set(), []
+        values = [float(-tableau[-1, -1])]
+        converged = False
+        while summary['rounds'] < self.max_rounds:
+            x = solver._extract_solution(tableau) * solver.col_scale
+            summary['rounds'] += 1
+            proposed = list(self.separation_callback(x.copy()))
+            violated = []
+            for row in proposed:
+                if row['sign'] not in ('<=', '>=', '='):
+                    raise ValueError(f'Signe de contrainte invalide: {row["sign"]}')
+                coefficients = np.asarray(row['coefficients'], dtype=float)
+                if coefficients.shape != (solver.n_vars,):
+                    raise ValueError(f'Contrainte générée: {solver.n_vars} coefficients attendus')
+                excess = coefficients @ x - row['rhs']
+                excess = {'<=': excess, '>=': -excess, '=': abs(excess)}[row['sign']]
+                if excess > self.epsilon * (1 + abs(row['rhs'])):
+                    violated.append({'coefficients': coefficients.tolist(), 'sign': row['sign'], 'rhs': float(row['rhs'])})
+            if not violated:
+                converged = True
+                break
+            
+            signs = np.array([row['sign'] for row in violated], dtype=object)
+            tableau = solver._append_rows(tableau, np.array([row['coefficients'] for row in violated]) * solver.col_scale,
+                                          [row['rhs'] for row in violated], signs)
+            # _append_rows : écarts des lignes <= et = puis des lignes >= et =
+            first = len(constraints)
+            owner += [first + i for i in np.flatnonzero(signs != '>=')] + [first + i for i in np.flatnonzero(signs != '<=')]
+            active.update(range(first, first + len(violated)))
+            constraints += violated
+            summary['rows_added'] += len(violated)
+            
+            status, _ = solver._dual_simplex(tableau, "Génération de lignes", len(solver.iterations))
+            if status != 'optimal':
+                message = ('Aucune solution réalisable trouvée' if status == 'infeasible'
+                           else 'Nombre maximum d\'itérations (1000) atteint')
+                return dict(summary, success=False, message=message, pivots=solver.pivot_count,
+                            rows=[constraints[i] for i in sorted(active)])
+            values.append(float(-tableau[-1, -1]))
+            
+            if self.max_rows is not None and tableau.shape[0] - 1 > self.max_rows:
+                tableau, owner, purged = self._purge(solver, tableau, seed_width, owner)
+                active -= purged
+                summary['rows_purged'] += len(purged)
+        
+        return dict(summary, **{
+            'success': True,
+            'solution': (solver._extract_solution(tableau) * solver.col_scale).tolist(),
+            'optimal_value': values[-1],
+            'rows': [constraints[i] for i in sorted(active)],
+            'objective_values': values,
+            'pivots': solver.pivot_count,
+            'iterations': solver.pivot_count,
+            'method': 'Génération de lignes',
+            'message': 'Solution optimale trouvée' if converged
+                       else f'Nombre maximum de tours ({self.max_rounds}) atteint',
+        })
+    
+    def _purge(self, solver, tableau, seed_width, owner):
+        """Retirer les contraintes ajoutées dont tous les écarts sont de base ; retourne (tableau, owner, retirées)"""
+        owner = np.array(owner)
+        row_of = {int(column): row for row, column in enumerate(solver.basis)}
+        basic = np.array([seed_width + k in row_of for k in range(len(owner))], dtype=bool)
+        slack = set(owner[basic].tolist()) - set(owner[~basic].tolist())
+        if not slack:
+            return tableau, owner.tolist(), set()
+        columns = np.flatnonzero(np.isin(owner, list(slack)))
+        tableau = solver._remove_rows(tableau, [row_of[seed_width + k] for k in columns])
+        return tableau, np.delete(owner, columns).tolist(), slack
+
+
+def solve_batch(c, A, b, signs, max_iterations=1000):
+    """
+    Résoudre en un seul lot k problèmes de mêmes dimensions et mêmes signes
+    (minimiser c·x), qui ne diffèrent que par c, A ou b.
+
+    c : (k, n) ou (n,), A : (k, m, n) ou (m, n), b : (k, m) ou (m,) ; une entrée
+    non empilée est partagée par tous les problèmes. Les tableaux sont empilés
+    dans un tableau (k, m+1, N+1) et la méthode à deux phases fait le choix du
+    pivot, le test du rapport et le pivot sur tout le lot avec NumPy ; les
+    problèmes terminés sont masqués.
+
+    Retourne une liste de k dictionnaires au format de /solve.
+    """
+    c = np.asarray(c, dtype=float)
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    m, n = A.shape[-2:]
+    k = max(c.shape[0] if c.ndim == 2 else 1,
+            A.shape[0] if A.ndim == 3 else 1,
+            b.shape[0] if b.ndim == 2 else 1)
+    if len(signs) != m or c.shape[-1] != n or b.shape[-1] != m:
+        raise ValueError('Dimensions incompatibles')
+    c = np.broadcast_to(c, (k, n))
+    b = np.broadcast_to(b, (k, m))
+
+    # Gérer les valeurs b négatives : la ligne et son signe sont inversés problème par problème
+    flip = np.where(b < 0, -1.0, 1.0)
+    A = A * flip[:, :, None]
+    b = b * flip
+    signs = np.asarray(signs, dtype=object)
+    is_le = (((signs == '<=')[None, :] & (flip > 0))
+             | ((signs == '>=')[None, :] & (flip < 0)))
+
+    # Disposition commune : une slack par inégalité, une artificielle par ligne
+    # qui en a besoin dans au moins un problème (elle reste hors base ailleurs)
+    slack_rows = np.where(signs != '=')[0]
+    artificial_rows = np.where((~is_le).any(axis=0))[0]
+    n_slack = len(slack_rows)
+    slack_cols = n + np.arange(n_slack)
+    artificial_cols = n + n_slack + np.arange(len(artificial_rows))
+    N = n + n_slack + len(artificial_rows)
+
+    T = np.zeros((k, m + 1, N + 1))
+    T[:, :m, :n] = A
+    T[:, slack_rows, slack_cols] = np.where(is_le[:, slack_rows], 1.0, -1.0)
+    T[:, artificial_rows, artificial_cols] = 1.0
+    T[:, :m, -1] = b
+
+    slack_of_row = np.full(m, -1)
+    slack_of_row[slack_rows] = slack_cols
+    artificial_of_row = np.full(m, -1)
+    artificial_of_row[artificial_rows] = artificial_cols
+    basis = np.where(is_le, slack_of_row, artificial_of_row)
+
+    # 0 : en cours / optimal, 1 : non borné, 2 : limite d'itérations, 3 : non réalisable
+    status = np.zeros(k, dtype=int)
+    iterations = np.zeros(k, dtype=int)
+    allowed = np.ones(N, dtype=bool)
+    phase1_values = np.zeros(k)
+
+    if len(artificial_rows):
+        # Phase 1 : Minimiser la somme des variables artificielles
+        cost = np.zeros((k, N))
+        cost[:, artificial_cols] = 1
+        _batch_phase(T, basis, cost, allowed, status, iterations, max_iterations)
+        phase1_values = -T[:, -1, -1]
+        status[(status == 0) & (phase1_values > 1e-6)] = 3
+
+        allowed[artificial_cols] = False
+        for p in np.where(status == 0)[0]:
+            _batch_drive_out_artificials(T[p], basis[p], allowed)
+
+    # Phase 2 : Résoudre le problème original
+    cost = np.zeros((k, N))
+    cost[:, :n] = c
+    _batch_phase(T, basis, cost, allowed, status, iterations, max_iterations)
+
+    results = []
+    for p in range(k):
+        if status[p] == 0:
+            x = np.zeros(N)
+            x[basis[p]] = T[p, :m, -1]
+            results.append({
+                'success': True,
+                'solution': x[:n].tolist(),
+                'optimal_value': float(-T[p, -1, -1]),
+                'iterations': int(iterations[p]),
+                'method': 'Deux Phases (lot)',
+                'message': 'Solution optimale trouvée'
+            })
+        elif status[p] == 1:
+            results.append({'success': False, 'message': 'Le problème est non borné'})
+        elif status[p] == 2:
+            results.append({
+                'success': False,
+                'message': f'Nombre maximum d\'itérations ({max_iterations}) atteint'
+            })
+        else:
+            results.append({
+                'success': False,
+                'message': f'Aucune solution réalisable trouvée. Somme des variables artificielles = {phase1_values[p]:.6f}'
+            })
+    return results
+
+
+def solve_multi_rhs(c, A, rhs, signs, chunks=1, parallel=False, **options):
+    """
+    Résoudre min c·x sous A x (signs) rhs[:, j] pour chaque colonne j de rhs
+    (m, k) : même c, A et signs, seuls les seconds membres changent.
+    
+    Les colonnes sont réparties en `chunks` blocs contigus ; chaque bloc
+    construit une fois sa forme standard et enchaîne ses seconds membres par
+    le simplexe dual (voir SimplexSolver.solve_multi_rhs). Avec `parallel`,
+    les blocs partent dans le pool de processus de /solve/batch. `options` est
+    passé à SimplexSolver (scaling, pricing, harris, bland_after).
+    
+    Retourne un dictionnaire de tableaux NumPy de longueur k ('solution' : (k, n)).
+    """
+    rhs = np.asarray(rhs, dtype=float)
+    if rhs.ndim == 1:
+        rhs = rhs[:, None]
+    blocks = [columns for columns in np.array_split(np.arange(rhs.shape[1]), max(1, int(chunks))) if columns.size]
+    jobs = [(c, A, rhs[:, columns], signs, options) for columns in blocks]
+    if parallel and len(jobs) > 1 and not _in_pool_worker():
+        parts = list(get_executor().map(_solve_rhs_block, *zip(*jobs)))
+    else:
+        parts = [_solve_rhs_block(*job) for job in jobs]
+    return {key: np.concatenate([part[key] for part in parts]) for key in parts[0]}
+
+
+def _solve_rhs_block(c, A, rhs, signs, options):
+    """Un bloc de solve_multi_rhs (fonction de module : exécutable dans le pool de processus)"""
+    solver = SimplexSolver(c, A, rhs[:, 0], signs, 'dual_simplex', False, history='off', **options)
+    return solver.solve_multi_rhs(rhs)
+
+
+def _batch_phase(T, basis, cost, allowed, status, iterations, max_iterations):
+    """
+    Une phase du simplexe sur le lot de tableaux T (k, m+1, N+1), en place.
+    La ligne objectif contient les coûts réduits et -Z en dernière colonne.
+    """
+    epsilon = 1e-8
+    m = basis.shape[1]
+
+    # Ligne objectif sous forme canonique : d = cost - c_B B^-1 A
+    T[:, -1, :-1] = cost
+    T[:, -1, -1] = 0
+    c_B = np.take_along_axis(cost, basis, axis=1)
+    T[:, -1, :] -= np.einsum('km,kmj->kj', c_B, T[:, :m, :])
+
+    active = status == 0
+    while active.any():
+        idx = np.where(active)[0]
+        sub = T[idx]
+        rows = np.arange(len(idx))
+
+        # Choix de la colonne du pivot (Dantzig) ; les problèmes optimaux sont masqués
+        reduced_costs = np.where(allowed, sub[:, -1, :-1], np.inf)
+        pivot_col = np.argmin(reduced_costs, axis=1)
+        running = reduced_costs[rows, pivot_col] < -epsilon
+        running &= iterations[idx] < max_iterations
+        status[idx[~running & (reduced_costs[rows, pivot_col] < -epsilon)]] = 2
+        active[idx[~running]] = False
+
+        # Test du rapport minimum sur tout le lot
+        col = sub[rows, :m, pivot_col]
+        rhs = sub[:, :m, -1]
+        ratios = np.full(col.shape, np.inf)
+        positive = col > epsilon
+        ratios[positive] = rhs[positive] / col[positive]
+        ratios[ratios < -epsilon] = np.inf
+        pivot_row = np.argmin(ratios, axis=1)
+        unbounded = running & (ratios[rows, pivot_row] == np.inf)
+        status[idx[unbounded]] = 1
+        active[idx[unbounded]] = False
+        running &= ~unbounded
+        if not running.any():
+            break
+
+        # Pivot de Gauss-Jordan (mise à jour de rang 1) sur les problèmes encore actifs
+        idx, sub = idx[running], sub[running]
+        pivot_row, pivot_col = pivot_row[running], pivot_col[running]
+        rows = np.arange(len(idx))
+        sub[rows, pivot_row, :] /= sub[rows, pivot_row, pivot_col][:, None]
+        factors = sub[rows, :, pivot_col]
+        factors[rows, pivot_row] = 0
+        sub -= factors[:, :, None] * sub[rows, pivot_row, :][:, None, :]
+        T[idx] = sub
+        basis[idx, pivot_row] = pivot_col
+        iterations[idx] += 1
+
+
+def _batch_drive_out_artificials(tableau, basis, allowed):
+    """Sortir de la base les variables artificielles nulles après la phase 1 (un problème)"""
+    epsilon = 1e-8
+    for r in range(len(basis)):
+        if allowed[basis[r]]:
+            continue
+        row = np.where(allowed, np.abs(tableau[r, :-1]), 0)
+        row[basis] = 0
+        if row.max() <= epsilon:
+            continue  # Ligne redondante : l'artificielle reste nulle
+        pivot_col = int(np.argmax(row))
+        tableau[r, :] /= tableau[r, pivot_col]
+        factors = tableau[:, pivot_col].copy()
+        factors[r] = 0
+        tableau -= np.outer(factors, tableau[r, :])
+        basis[r] = pivot_col
+
+
+def parse_constraint_matrix(A):
+    """
+    Convertir la matrice A reçue en JSON.
+
+    A peut être une liste de lignes (dense) ou un dictionnaire décrivant une
+    matrice creuse :
+    - {"format": "coo", "shape": [m, n], "row": [...], "col": [...], "data": [...]}
+    - {"format": "csr" ou "csc", "shape": [m, n], "data": [...], "indices": [...], "indptr": [...]}
+    """
+    if not isinstance(A, dict):
+        return np.array(A, dtype=float)
+
+    fmt = A.get('format', 'coo')
+    shape = tuple(A['shape'])
+    data = np.array(A['data'], dtype=float)
+    if fmt == 'coo':
+        return sp.coo_matrix((data, (A['row'], A['col'])), shape=shape).tocsc()
+    if fmt == 'csr':
+        return sp.csr_matrix((data, A['indices'], A['indptr']), shape=shape).tocsc()
+    if fmt == 'csc':
+        return sp.csc_matrix((data, A['indices'], A['indptr']), shape=shape)
+    raise ValueError(f'Format de matrice creuse inconnu: {fmt}')
+
+
+@app.route('/')
+def index():
+    return render_template('index.html')
+
+
+@app.route('/fonction')
+def fonction():
+    n_vars = request.args.get('variables', 1, type=int)
+    n_constraints = request.args.get('contraintes', 1, type=int)
+    method = request.args.get('method', 'big_m')
+    
+    return render_template('fonction.html',
+                         n_vars=n_vars,
                          n_constraints=n_constraints,
                          method=method)
 
@@ -415,9 +3003,13 @@ def resultat():
     return render_template('resultat.html')
 
 
-@app.route('/solve', methods=['POST'])
-def solve():
-    data = request.json
+def solve_problem(data):
+    """
+    Résoudre un problème au format JSON de /solve.
+    Retourne (résultat, code HTTP) ; les erreurs sont rapportées dans le résultat.
+    """
+    if not isinstance(data, dict):
+        return {'success': False, 'message': 'Données incomplètes'}, 400
     
     c = data.get('c', [])
     A = data.get('A', [])
@@ -425,16 +3017,20 @@ def solve():
     signs = data.get('signs', [])
     method = data.get('method', 'big_m')
     objective_type = data.get('objective_type', 'max')
+    # Pas d'historique par défaut : la mémoire reste bornée quel que soit le nombre de pivots
+    history = data.get('history', 'off')
     
     try:
         # Valider les entrées
         if not c or not A or not b or not signs:
-            return jsonify({'success': False, 'message': 'Données incomplètes'}), 400
+            return {'success': False, 'message': 'Données incomplètes'}, 400
         
         # Convertir en tableaux numpy
         c = np.array(c, dtype=float)
-        A = np.array(A, dtype=float)
+        A = parse_constraint_matrix(A)
         b = np.array(b, dtype=float)
+        # Copie : les signes des lignes de b < 0 sont inversés plus bas
+        signs = list(signs)
         
         # Déterminer si c'est une maximisation ou minimisation
         is_maximization = (objective_type == 'max')
@@ -447,17 +3043,51 @@ def solve():
         
         # Valider les dimensions
         if A.shape[0] != len(b) or A.shape[1] != len(c):
-            return jsonify({'success': False, 'message': 'Dimensions incompatibles'}), 400
+            return {'success': False, 'message': 'Dimensions incompatibles'}, 400
         
         # Valider les signes
         for sign in signs:
             if sign not in ['<=', '>=', '=']:
-                return jsonify({'success': False, 'message': f'Signe invalide: {sign}'}), 400
+                return {'success': False, 'message': f'Signe invalide: {sign}'}, 400
+        
+        # Variables entières ou binaires : séparation et évaluation (sans presolve)
+        integrality = data.get('integrality')
+        if integrality is not None and any(kind != 'continuous' for kind in integrality):
+            options = {key: data[key] for key in ('scaling', 'pricing', 'harris', 'bland_after') if key in data}
+            result = BranchAndBound(c, A, b, signs, integrality, node_selection=data.get('node_selection', 'best_bound'),
+                                    gap=data.get('mip_gap', 1e-6), max_nodes=data.get('max_nodes', 10000),
+                                    parallel=data.get('parallel', False), workers=data.get('workers'),
+                                    **options).solve()
+            if is_maximization:
+                for key in ('optimal_value', 'bound'):
+                    if result.get(key) is not None:
+                        result[key] = -result[key]
+            return result, 200
+        
+        # Presolve : true (par défaut) pour toutes les réductions, false pour aucune,
+        # ou un dictionnaire {réduction: booléen}. L'analyse de sensibilité porte
+        # sur la base du problème d'origine : pas de presolve avec "sensitivity"
+        sensitivity = data.get('sensitivity', False)
+        options = False if sensitivity else data.get('presolve', True)
+        presolve = None
+        if options:
+            presolve = Presolve(c, A, b, signs, options if isinstance(options, dict) else None)
+            c, A, b, signs = presolve.run()
+            result = presolve.trivial_result()
+            if result is not None:
+                if result.get('success') and is_maximization:
+                    result['optimal_value'] = -result['optimal_value']
+                return result, 200
         
         # Gérer les valeurs b négatives - nécessite inversion de l'inégalité
+        flipped = b < 0
+        if sp.issparse(A):
+            # Multiplier les lignes concernées par -1 sans densifier A
+            A = (sp.diags(np.where(b < 0, -1.0, 1.0)) @ A).tocsc()
         for i in range(len(b)):
             if b[i] < 0:
-                A[i] = -A[i]
+                if not sp.issparse(A):
+                    A[i] = -A[i]
                 b[i] = -b[i]
                 # Inverser le signe
                 if signs[i] == '<=':
@@ -466,24 +3096,453 @@ def solve():
                     signs[i] = '<='
                 # '=' reste '='
         
-        # Résoudre
-        solver = SimplexSolver(c.tolist(), A.tolist(), b.tolist(), signs, method, is_maximization)
+        # Démarrage à chaud : base renvoyée par une résolution précédente
+        basis = data.get('basis')
+        if basis is not None and presolve is not None:
+            basis = presolve.reduce_basis(basis)
         
-        if method == 'big_m':
-            result = solver.solve_big_m()
-        else:
-            result = solver.solve_two_phase()
+        # Résoudre
+        solver = SimplexSolver(c.tolist(), A if sp.issparse(A) else A.tolist(), b.tolist(), signs, method, is_maximization,
+                               history=history, crossover=data.get('crossover', True),
+                               scaling=data.get('scaling'), pricing=data.get('pricing', 'dantzig'),
+                               harris=data.get('harris', True), perturbation=data.get('perturbation', False),
+                               bland_after=data.get('bland_after', 50), basis=basis,
+                               crash=data.get('crash', True))
+        result = solver.solve()
+        if history != 'off':
+            result['history'] = solver.pivot_history
+        if presolve is not None:
+            result = presolve.postsolve(result)
+        if sensitivity and result.get('basis') is not None:
+            result['sensitivity'] = _original_sensitivity(solver.sensitivity(), flipped, is_maximization)
+        elif sensitivity and result.get('success'):
+            # highs, interior_point sans crossover : solution sans base du simplexe
+            result['sensitivity'] = {
+                'message': 'Analyse de sensibilité indisponible : elle demande une base du simplexe '
+                           f'(méthode {result.get("method", method)})'
+            }
         
         # Inverser la valeur optimale si c'était une MAXIMISATION (car on a minimisé -c)
         if result.get('success') and is_maximization:
             result['optimal_value'] = -result['optimal_value']
         
-        return jsonify(result)
+        return result, 200
+    
+    except ValueError as e:
+        return {'success': False, 'message': f'Erreur de valeur: {str(e)}'}, 400
+    except Exception as e:
+        return {'success': False, 'message': f'Erreur: {str(e)}'}, 400
+
+
+def _original_sensitivity(report, flipped, is_maximization):
+    """
+    Ramener l'analyse de sensibilité du solveur (minimisation, lignes de b < 0
+    multipliées par -1) au problème posé : une ligne inversée change le signe
+    de son prix dual et de son intervalle de b, une maximisation celui des prix
+    duaux, des coûts réduits et des intervalles de c.
+    """
+    def negate(interval):
+        low, high = interval
+        return [None if high is None else -high, None if low is None else -low]
+    
+    objective = -1.0 if is_maximization else 1.0
+    shadow_prices = [objective * (-y if flip else y) for y, flip in zip(report['shadow_prices'], flipped)]
+    rhs_ranges = [negate(interval) if flip else interval for interval, flip in zip(report['rhs_ranges'], flipped)]
+    reduced_costs = [objective * d for d in report['reduced_costs']]
+    cost_ranges = [negate(interval) for interval in report['cost_ranges']] if is_maximization else report['cost_ranges']
+    # + 0.0 : pas de -0.0 dans le JSON
+    return {
+        'shadow_prices': [y + 0.0 for y in shadow_prices],
+        'reduced_costs': [d + 0.0 for d in reduced_costs],
+        'rhs_ranges': rhs_ranges,
+        'cost_ranges': cost_ranges,
+    }
+
+
+@app.route('/solve', methods=['POST'])
+def solve():
+    result, status = solve_problem(request.json)
+    return jsonify(result), status
+
+
+def solve_parametric_problem(data):
+    """
+    Analyse paramétrique d'un problème au format de /solve, avec un bloc
+    "parametric": {"target": "b" ou "c", "direction": [...], "theta": [θmin, θmax]}
+    (voir SimplexSolver.parametric). Ni presolve ni choix de méthode : le
+    parcours se fait toujours sur le tableau du simplexe dual.
+    Retourne (résultat, code HTTP).
+    """
+    if not isinstance(data, dict) or not isinstance(data.get('parametric'), dict):
+        return {'success': False, 'message': 'Données incomplètes'}, 400
+    options = data['parametric']
+    try:
+        if not data.get('c') or not data.get('A') or not data.get('b') or not data.get('signs'):
+            return {'success': False, 'message': 'Données incomplètes'}, 400
+        c = np.array(data['c'], dtype=float)
+        A = parse_constraint_matrix(data['A'])
+        b = np.array(data['b'], dtype=float)
+        signs = list(data['signs'])
+        is_maximization = data.get('objective_type', 'max') == 'max'
+        target = options.get('target', 'b')
+        direction = np.array(options.get('direction', []), dtype=float)
+        if is_maximization:
+            # Le solveur minimise -c : la direction des coûts suit
+            c = -c
+            if target == 'c':
+                direction = -direction
+        if A.shape[0] != len(b) or A.shape[1] != len(c):
+            return {'success': False, 'message': 'Dimensions incompatibles'}, 400
+        for sign in signs:
+            if sign not in ['<=', '>=', '=']:
+                return {'success': False, 'message': f'Signe invalide: {sign}'}, 400
+        
+        solver = SimplexSolver(c, A, b, signs, 'dual_simplex', is_maximization, history='off',
+                               scaling=data.get('scaling'), harris=data.get('harris', True),
+                               bland_after=data.get('bland_after', 50))
+        result = solver.parametric(direction, target, options.get('theta', (0.0, 1.0)),
+                                   max_pivots=options.get('max_pivots', 1000))
+        result['pivots'] = solver.pivot_count
+        if result.get('success') and is_maximization:
+            for segment in result['segments']:
+                segment['value'] = [-value for value in segment['value']]
+                segment['slope'] = -segment['slope'] + 0.0
+            result['value_function'] = [[theta, -value] for theta, value in result['value_function']]
+        elif is_maximization and 'optimal_value' in result:
+            result['optimal_value'] = -result['optimal_value']
+        return result, 200
     
+    except ValueError as e:
+        return {'success': False, 'message': f'Erreur de valeur: {str(e)}'}, 400
+    except Exception as e:
+        return {'success': False, 'message': f'Erreur: {str(e)}'}, 400
+
+
+@app.route('/solve/parametric', methods=['POST'])
+def solve_parametric():
+    result, status = solve_parametric_problem(request.json)
+    return jsonify(result), status
+
+
+@app.route('/solve/multi_rhs', methods=['POST'])
+def solve_multi_rhs_endpoint():
+    """
+    Même problème que /solve pour plusieurs seconds membres : "b" est une
+    matrice m x k dont chaque colonne est un second membre (voir solve_multi_rhs).
+    "chunks" et "parallel" répartissent les colonnes entre les processus.
+    Les résultats sont des tableaux de longueur k (null pour un échec).
+    """
+    data = request.json
+    if not isinstance(data, dict) or not data.get('c') or not data.get('A') or not data.get('b') or not data.get('signs'):
+        return jsonify({'success': False, 'message': 'Données incomplètes'}), 400
+    try:
+        c = np.array(data['c'], dtype=float)
+        A = parse_constraint_matrix(data['A'])
+        rhs = np.array(data['b'], dtype=float)
+        signs = list(data['signs'])
+        is_maximization = data.get('objective_type', 'max') == 'max'
+        if rhs.ndim == 1:
+            rhs = rhs[:, None]
+        if rhs.ndim != 2 or A.shape[0] != rhs.shape[0] or A.shape[1] != len(c):
+            return jsonify({'success': False, 'message': 'Dimensions incompatibles'}), 400
+        for sign in signs:
+            if sign not in ['<=', '>=', '=']:
+                return jsonify({'success': False, 'message': f'Signe invalide: {sign}'}), 400
+        options = {key: data[key] for key in ('scaling', 'pricing', 'harris', 'bland_after') if key in data}
+        arrays = solve_multi_rhs(-c if is_maximization else c, A, rhs, signs, chunks=data.get('chunks', 1),
+                                 parallel=data.get('parallel', False), **options)
     except ValueError as e:
         return jsonify({'success': False, 'message': f'Erreur de valeur: {str(e)}'}), 400
     except Exception as e:
         return jsonify({'success': False, 'message': f'Erreur: {str(e)}'}), 400
+    
+    values = -arrays['optimal_value'] if is_maximization else arrays['optimal_value']
+    solved = arrays['success']
+    return jsonify({
+        'success': True,
+        'status': arrays['status'].tolist(),
+        'optimal_value': [float(value) if ok else None for value, ok in zip(values, solved)],
+        'solution': [row.tolist() if ok else None for row, ok in zip(arrays['solution'], solved)],
+        'pivots': arrays['pivots'].tolist(),
+        'method': 'Simplexe dual (seconds membres multiples)',
+        'message': f'{int(solved.sum())} second(s) membre(s) résolu(s) sur {len(solved)}',
+    }), 200
+
+
+def get_executor():
+    """
+    Pool de processus persistant, dimensionné au nombre de cœurs.
+    Créé à la première utilisation, donc dans chaque worker gunicorn après le fork.
+    """
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+    return _executor
+
+
+def _reset_executor():
+    """Abandonner un pool cassé (worker tué) : le prochain get_executor en crée un neuf"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def _in_pool_worker():
+    """
+    Vrai dans un processus du pool : le pool hérité du parent par le fork n'y
+    est pas utilisable (lui soumettre du travail bloque la requête), le
+    parallélisme interne (nœuds, blocs de seconds membres) y est désactivé.
+    """
+    return multiprocessing.parent_process() is not None
+
+
+@app.route('/solve/batch', methods=['POST'])
+def solve_batch_endpoint():
+    """
+    Résoudre une liste de problèmes (même schéma JSON que /solve) en parallèle.
+    
+    Le corps est une liste de problèmes ou {"problems": [...]}. Les résultats
+    sont renvoyés au fil de l'eau, dans l'ordre, une ligne JSON par problème
+    (application/x-ndjson) ; chaque ligne a sa propre erreur éventuelle.
+    """
+    data = request.json
+    problems = data.get('problems') if isinstance(data, dict) else data
+    if not isinstance(problems, list) or not problems:
+        return jsonify({'success': False, 'message': 'Données incomplètes'}), 400
+    
+    try:
+        futures = [get_executor().submit(solve_problem, problem) for problem in problems]
+    except BrokenProcessPool:
+        _reset_executor()
+        return jsonify({'success': False, 'message': 'Pool de processus interrompu, lot à renvoyer'}), 500
+    
+    def generate():
+        for index, future in enumerate(futures):
+            try:
+                result, status = future.result()
+            except BrokenProcessPool:
+                # Un worker est mort : le pool est recréé à la prochaine requête
+                _reset_executor()
+                result, status = {'success': False, 'message': 'Pool de processus interrompu'}, 500
+            except Exception as e:
+                result, status = {'success': False, 'message': f'Erreur: {str(e)}'}, 500
+            result['index'] = index
+            result['status'] = status
+            yield json.dumps(result) + '\n'
+    
+    return Response(generate(), mimetype='application/x-ndjson')
+
+
+class SolveSession:
+    """
+    Modèle conservé côté serveur entre deux résolutions : c, A, b, signs, les
+    options de /solve et la dernière base, qui sert de point de départ à la
+    résolution suivante (démarrage à chaud, voir SimplexSolver.solve_warm_start).
+    """
+    
+    def __init__(self, data):
+        self.c = np.array(data.get('c', []), dtype=float)
+        self.A = parse_constraint_matrix(data.get('A', []))
+        if sp.issparse(self.A):
+            self.A = self.A.tocsr()
+        self.b = np.array(data.get('b', []), dtype=float)
+        self.signs = list(data.get('signs', []))
+        self.options = {key: value for key, value in data.items() if key not in ('c', 'A', 'b', 'signs', 'basis')}
+        self.basis = data.get('basis')
+        self.lock = threading.Lock()
+        self.touch()
+    
+    def touch(self):
+        self.last_access = time.monotonic()
+    
+    @property
+    def nbytes(self):
+        A = self.A
+        size = A.data.nbytes + A.indices.nbytes + A.indptr.nbytes if sp.issparse(A) else A.nbytes
+        return size + self.c.nbytes + self.b.nbytes
+    
+    def problem(self):
+        """Problème au format JSON de /solve, avec la dernière base"""
+        if sp.issparse(self.A):
+            A = {'format': 'csr', 'shape': list(self.A.shape), 'data': self.A.data.tolist(),
+                 'indices': self.A.indices.tolist(), 'indptr': self.A.indptr.tolist()}
+        else:
+            A = self.A.tolist()
+        return dict(self.options, c=self.c.tolist(), A=A, b=self.b.tolist(), signs=list(self.signs),
+                    basis=self.basis)
+    
+    def solve(self):
+        result, status = solve_problem(self.problem())
+        if result.get('basis') is not None:
+            self.basis = result['basis']
+        return result, status
+    
+    def apply(self, delta):
+        """
+        Appliquer une modification partielle (PATCH) :
+        - "c", "b", "signs" : {indice: valeur} ou liste complète
+        - "A" : liste de [i, j, valeur]
+        - "remove_constraints" : indices des lignes à retirer
+        - "add_constraints" : [{"coefficients": [...], "sign": "<=", "rhs": v}, ...]
+        - "add_variables" : [{"cost": v, "coefficients": [...]}, ...]
+        Les modifications portent sur les indices d'avant retraits et ajouts.
+        """
+        m, n = self.A.shape
+        c, b, signs = self.c.copy(), self.b.copy(), list(self.signs)
+        A = self.A.tolil() if sp.issparse(self.A) else self.A.copy()
+        for name, target, size in (('c', c, n), ('b', b, m), ('signs', signs, m)):
+            values = delta.get(name)
+            if values is None:
+                continue
+            if not isinstance(values, dict):
+                values = dict(enumerate(values))
+                if len(values) != size:
+                    raise ValueError(f'{name}: {size} valeurs attendues')
+            for index, value in values.items():
+                index = int(index)
+                if not 0 <= index < size:
+                    raise ValueError(f'{name}: indice {index} hors limites')
+                target[index] = value
+        for i, j, value in delta.get('A', []):
+            if not (0 <= int(i) < m and 0 <= int(j) < n):
+                raise ValueError(f'A: indice ({i}, {j}) hors limites')
+            A[int(i), int(j)] = value
+        
+        statuses = dict(self.basis) if self.basis else {'variables': [], 'constraints': []}
+        constraints = list(statuses.get('constraints', []))
+        constraints += ['basic'] * (m - len(constraints))
+        
+        removed = sorted({int(i) for i in delta.get('remove_constraints', [])})
+        if any(not 0 <= i < m for i in removed):
+            raise ValueError('remove_constraints: indice hors limites')
+        kept = np.setdiff1d(np.arange(m), removed)
+        A = A[kept]
+        b = b[kept]
+        signs = [signs[i] for i in kept]
+        constraints = [constraints[i] for i in kept]
+        
+        added = delta.get('add_constraints', [])
+        if added:
+            rows = np.array([row['coefficients'] for row in added], dtype=float).reshape(len(added), n)
+            A = sp.vstack([A, sp.lil_matrix(rows)]).tolil() if sp.issparse(A) else np.vstack([A, rows])
+            b = np.append(b, [row['rhs'] for row in added])
+            signs += [row['sign'] for row in added]
+            constraints += ['basic'] * len(added)
+        
+        columns = delta.get('add_variables', [])
+        if columns:
+            block = np.array([column['coefficients'] for column in columns], dtype=float).reshape(len(columns), A.shape[0]).T
+            A = sp.hstack([A, sp.lil_matrix(block)]).tolil() if sp.issparse(A) else np.hstack([A, block])
+            c = np.append(c, [column['cost'] for column in columns])
+        
+        for sign in signs:
+            if sign not in ('<=', '>=', '='):
+                raise ValueError(f'Signe invalide: {sign}')
+        
+        self.c, self.b, self.signs = c, b, signs
+        self.A = A.tocsr() if sp.issparse(A) else A
+        if self.basis:
+            self.basis = {'variables': statuses.get('variables', []), 'constraints': constraints}
+
+
+def _purge_sessions():
+    """Retirer les sessions expirées, puis les plus anciennes tant que la mémoire dépasse la limite"""
+    now = time.monotonic()
+    for session_id in [sid for sid, session in _sessions.items() if now - session.last_access > SESSION_TTL]:
+        del _sessions[session_id]
+    total = sum(session.nbytes for session in _sessions.values())
+    while _sessions and total > SESSION_MEMORY_LIMIT:
+        _, session = _sessions.popitem(last=False)
+        total -= session.nbytes
+
+
+def _get_session(session_id):
+    with _sessions_lock:
+        _purge_sessions()
+        session = _sessions.get(session_id)
+        if session is not None:
+            session.touch()
+            _sessions.move_to_end(session_id)
+        return session
+
+
+def _session_response(session_id, result, status):
+    result['session_id'] = session_id
+    result['expires_in'] = SESSION_TTL
+    return jsonify(result), status
+
+
+@app.route('/sessions', methods=['POST'])
+def create_session():
+    """
+    Créer une session à partir d'un problème au format de /solve et le résoudre.
+    La session est gardée SESSION_TTL secondes après le dernier accès ; au-delà de
+    SESSION_MEMORY_LIMIT octets de modèles, les sessions les moins récentes sont retirées.
+    Les sessions vivent dans le processus : avec plusieurs workers, il faut
+    router une même session vers le même worker.
+    """
+    data = request.json
+    if not isinstance(data, dict):
+        return jsonify({'success': False, 'message': 'Données incomplètes'}), 400
+    try:
+        session = SolveSession(data)
+    except (ValueError, KeyError, TypeError) as e:
+        return jsonify({'success': False, 'message': f'Erreur de valeur: {str(e)}'}), 400
+    if session.nbytes > SESSION_MEMORY_LIMIT:
+        return jsonify({'success': False, 'message': 'Modèle trop volumineux pour une session'}), 413
+    
+    session_id = uuid.uuid4().hex
+    with session.lock:
+        result, status = session.solve()
+        if status != 200:
+            return jsonify(result), status
+        with _sessions_lock:
+            _sessions[session_id] = session
+            _purge_sessions()
+    return _session_response(session_id, result, 201)
+
+
+@app.route('/sessions/<session_id>', methods=['PATCH'])
+def patch_session(session_id):
+    """Modifier le modèle de la session (voir SolveSession.apply) et le résoudre depuis la dernière base"""
+    session = _get_session(session_id)
+    if session is None:
+        return jsonify({'success': False, 'message': 'Session inconnue ou expirée'}), 404
+    delta = request.json
+    if not isinstance(delta, dict):
+        return jsonify({'success': False, 'message': 'Données incomplètes'}), 400
+    with session.lock:
+        # Modèle rétabli si la modification est refusée (400) : la session reste utilisable
+        previous = (session.c, session.A, session.b, session.signs, session.basis)
+        try:
+            session.apply(delta)
+        except (ValueError, KeyError, TypeError, IndexError) as e:
+            return jsonify({'success': False, 'message': f'Erreur de valeur: {str(e)}'}), 400
+        result, status = session.solve()
+        if status == 400:
+            session.c, session.A, session.b, session.signs, session.basis = previous
+    return _session_response(session_id, result, status)
+
+
+@app.route('/sessions/<session_id>', methods=['GET'])
+def get_session(session_id):
+    """Modèle courant de la session"""
+    session = _get_session(session_id)
+    if session is None:
+        return jsonify({'success': False, 'message': 'Session inconnue ou expirée'}), 404
+    with session.lock:
+        problem = session.problem()
+    return _session_response(session_id, {'success': True, 'problem': problem}, 200)
+
+
+@app.route('/sessions/<session_id>', methods=['DELETE'])
+def delete_session(session_id):
+    with _sessions_lock:
+        session = _sessions.pop(session_id, None)
+    if session is None:
+        return jsonify({'success': False, 'message': 'Session inconnue ou expirée'}), 404
+    return jsonify({'success': True, 'session_id': session_id}), 200
 
 
 if __name__ == '__main__':
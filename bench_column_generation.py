@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Benchmark de la génération de colonnes sur la découpe de rouleaux :
+- problème complet : tous les motifs énumérés, résolus par SimplexSolver
+- génération à froid : à chaque tour, le maître restreint est reconstruit et
+  résolu (prix duaux par sensitivity)
+- cutting_stock : colonnes ajoutées au tableau courant, quelques pivots primaux
+"""
+
+import time
+import numpy as np
+from app import SimplexSolver, cutting_stock, knapsack_pricing
+
+
+def all_patterns(widths, roll_width):
+    patterns = [[]]
+    for width in widths:
+        patterns = [p + [k] for p in patterns for k in range(int(roll_width - np.dot(p, widths[:len(p)])) // width + 1)]
+    return np.array([p for p in patterns if any(p)], dtype=float).T
+
+
+def cold_generation(widths, demands, roll_width):
+    """Génération de colonnes qui reconstruit le maître à chaque tour"""
+    A = np.diag(roll_width // widths).astype(float)
+    pricing = knapsack_pricing(widths, roll_width)
+    pivots = 0
+    while True:
+        solver = SimplexSolver(np.ones(A.shape[1]), A, demands, ['>='] * len(widths), 'dual_simplex', False,
+                               history='off')
+        result = solver.solve()
+        pivots += result['pivots']
+        columns = pricing(np.array(solver.sensitivity()['shadow_prices']))
+        if not columns:
+            return result['optimal_value'], A.shape[1], pivots
+        A = np.hstack([A, np.array([column for _, column in columns]).T])
+
+
+print("=" * 104)
+print(f"{'pièces':>6} | {'motifs':>7} | {'complet (s)':>11} | {'à froid (s)':>11} | {'générées (s)':>12} | "
+      f"{'colonnes':>8} | {'pivots froid':>12} | {'pivots':>6} | {'écart':>7}")
+print("=" * 104)
+rng = np.random.default_rng(1)
+for n, roll_width in [(6, 100), (10, 120), (14, 150), (20, 200)]:
+    widths = rng.integers(roll_width // 12 + 1, roll_width // 3, n)
+    demands = rng.integers(10, 200, n).astype(float)
+
+    start = time.perf_counter()
+    full_value, count = None, None
+    # Au-delà, l'énumération des motifs explose
+    if n <= 10:
+        patterns = all_patterns(widths, roll_width)
+        count = patterns.shape[1]
+        full_value = SimplexSolver(np.ones(count), patterns, demands, ['>='] * n, 'dual_simplex', False,
+                                   history='off').solve()['optimal_value']
+    full_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    cold_value, _, cold_pivots = cold_generation(widths, demands, roll_width)
+    cold_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = cutting_stock(widths, demands, roll_width)
+    time_cg = time.perf_counter() - start
+
+    error = max(abs(result['optimal_value'] - value) for value in (cold_value, full_value) if value is not None)
+    print(f"{n:>6} | {count or '-':>7} | {f'{full_time:.3f}' if count else '-':>11} | {cold_time:11.3f} | "
+          f"{time_cg:12.3f} | {len(result['patterns']):8} | {cold_pivots:12} | {result['pivots']:6} | {error:7.1e}")
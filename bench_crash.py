@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Benchmark de la base de départ (crash) : planification avec capacités (<=)
+et demandes (>=, =) couvertes par de la sous-traitance (colonnes singletons).
+Compare le nombre de variables artificielles, les pivots de phase 1, les
+pivots totaux et le temps avec et sans crash.
+"""
+
+import time
+import numpy as np
+from app import SimplexSolver
+
+PHASE_1 = ("Phase 1 - Minimiser variables artificielles", "Phase 1 - Révisé")
+
+
+def model(products, resources, rng):
+    usage = rng.random((resources, products)) * (rng.random((resources, products)) < 0.3)
+    capacity = usage @ rng.random(products)
+    demand = rng.random(products)
+    A = np.block([[usage, np.zeros((resources, products))], [np.eye(products), np.eye(products)]])
+    b = np.concatenate([capacity, demand])
+    signs = ['<='] * resources + ['>='] * (products - products // 5) + ['='] * (products // 5)
+    c = np.concatenate([-rng.random(products), 1 + rng.random(products)])
+    return c, A, b, signs
+
+
+def timed(c, A, b, signs, method, crash):
+    start = time.perf_counter()
+    solver = SimplexSolver(c, A, b, signs, method, False, history='pivots', crash=crash)
+    result = solver.solve()
+    # "Phase 1 - Unique" : pas d'artificielle, c'est déjà l'optimisation de c
+    phase1 = sum(entry['phase'] in PHASE_1 for entry in solver.pivot_history)
+    return result, len(solver.artificial_vars), phase1, time.perf_counter() - start
+
+
+print("=" * 96)
+print(f"{'produits':>9} | {'méthode':>9} | {'crash':>5} | {'artificielles':>13} | {'pivots ph. 1':>12} | "
+      f"{'pivots':>6} | {'temps (s)':>9} | {'Z':>10}")
+print("=" * 96)
+rng = np.random.default_rng(0)
+for products in (50, 100, 200):
+    c, A, b, signs = model(products, products // 2, rng)
+    for method in ('two_phase', 'revised'):
+        for crash in (False, True):
+            result, artificials, phase1, elapsed = timed(c, A, b, signs, method, crash)
+            value = f"{result['optimal_value']:.4f}" if result['success'] else result['message'][:10]
+            print(f"{products:>9} | {method:>9} | {'oui' if crash else 'non':>5} | {artificials:>13} | {phase1:>12} | "
+                  f"{result['pivots']:>6} | {elapsed:9.3f} | {value:>10}")
+    print("-" * 96)
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Benchmark du simplexe dual sur des problèmes de minimisation de coûts à
+contraintes >= (type régime alimentaire / couverture) : itérations et temps
+contre le Grand M, les deux phases et le simplexe révisé.
+"""
+
+import time
+import numpy as np
+from app import SimplexSolver
+
+
+def covering_model(m, n, rng):
+    """Min c·x, A x >= b avec A, b, c >= 0 et quelques plafonds en <="""
+    A = rng.random((m, n)) * (rng.random((m, n)) < 0.5)
+    b = rng.random(m) * A.sum(axis=1) * 0.3
+    signs = ['>='] * m
+    caps = rng.random(n) < 0.1
+    A = np.vstack([A, np.eye(n)[caps]])
+    b = np.concatenate([b, np.full(caps.sum(), 10.0)])
+    signs += ['<='] * int(caps.sum())
+    return rng.random(n) + 0.1, A, b, signs
+
+
+print("=" * 78)
+print(f"{'m x n':>10} | {'méthode':>12} | {'itérations':>10} | {'temps (s)':>9} | {'Z':>14} | {'exact':>5}")
+print("=" * 78)
+rng = np.random.default_rng(0)
+for m, n in [(50, 40), (150, 120), (300, 250)]:
+    c, A, b, signs = covering_model(m, n, rng)
+    reference = SimplexSolver(c, A, b, signs, 'highs', False).solve()['optimal_value']
+    for method in ('big_m', 'two_phase', 'revised', 'dual_simplex'):
+        start = time.perf_counter()
+        result = SimplexSolver(c, A, b, signs, method, False, history='off').solve()
+        elapsed = time.perf_counter() - start
+        exact = result['success'] and abs(result['optimal_value'] - reference) < 1e-6 * max(1, abs(reference))
+        value = f"{result['optimal_value']:.6f}" if result['success'] else result['message'][:14]
+        print(f"{f'{m} x {n}':>10} | {method:>12} | {result.get('iterations', '-'):>10} | {elapsed:9.3f} | "
+              f"{value:>14} | {'oui' if exact else 'non':>5}")
+    print("-" * 78)
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Benchmark des seconds membres multiples : k vecteurs de demande autour d'une
+demande de référence (± 5 %), résolus un par un à froid (SimplexSolver) puis
+en une fois par solve_multi_rhs (forme standard unique, simplexe dual depuis
+la base précédente), en séquentiel puis en blocs parallèles.
+"""
+
+import os
+import time
+import numpy as np
+from app import SimplexSolver, solve_multi_rhs
+
+
+def model(m, n, k, rng):
+    A = rng.random((m, n))
+    x0 = rng.random(n)
+    signs = ['<='] * (m - m // 4) + ['>='] * (m // 4)
+    b = np.where(np.array(signs) == '<=', A @ x0 + 1, A @ x0 * 0.5)
+    return -rng.random(n), A, b[:, None] * rng.uniform(0.95, 1.05, (m, k)), signs
+
+
+print(f"Cœurs disponibles : {os.cpu_count()}")
+print("=" * 100)
+print(f"{'m x n':>10} | {'k':>5} | {'à froid (s)':>11} | {'multi-rhs (s)':>13} | {'parallèle (s)':>13} | "
+      f"{'pivots/col. froid':>17} | {'multi':>5} | {'écart max':>9}")
+print("=" * 100)
+rng = np.random.default_rng(0)
+for m, n, k in [(40, 60, 2000), (80, 120, 1000), (160, 240, 300)]:
+    c, A, rhs, signs = model(m, n, k, rng)
+    
+    start = time.perf_counter()
+    cold = [SimplexSolver(c, A, rhs[:, j], signs, 'dual_simplex', False, history='off').solve() for j in range(k)]
+    cold_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    result = solve_multi_rhs(c, A, rhs, signs)
+    multi_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    solve_multi_rhs(c, A, rhs, signs, chunks=os.cpu_count() or 1, parallel=True)
+    parallel_time = time.perf_counter() - start
+    
+    error = max(abs(r['optimal_value'] - value) for r, value in zip(cold, result['optimal_value']))
+    cold_pivots = np.mean([r['pivots'] for r in cold])
+    print(f"{f'{m} x {n}':>10} | {k:>5} | {cold_time:11.2f} | {multi_time:13.2f} | {parallel_time:13.2f} | "
+          f"{cold_pivots:17.1f} | {result['pivots'].mean():5.1f} | {error:9.1e}")
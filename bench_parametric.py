@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Benchmark de l'analyse paramétrique : capacité b + θ·d (et coûts c + θ·d) sur
+un modèle de planification, parcours exact contre des résolutions à froid en
+θ échantillonnés (l'ancienne pratique : appeler /solve pour chaque valeur).
+"""
+
+import time
+import numpy as np
+from app import SimplexSolver
+
+
+def model(m, n, rng):
+    A = rng.random((m, n))
+    x0 = rng.random(n)
+    signs = ['<='] * (m - m // 4) + ['>='] * (m // 4)
+    b = np.where(np.array(signs) == '<=', A @ x0 + 1, A @ x0 * 0.5)
+    return -rng.random(n), A, b, signs
+
+
+samples = 100
+print("=" * 92)
+print(f"{'m x n':>10} | {'cible':>5} | {'ruptures':>8} | {'pivots':>6} | {'paramétrique (s)':>16} | "
+      f"{f'{samples} à froid (s)':>15} | {'écart max':>9}")
+print("=" * 92)
+rng = np.random.default_rng(0)
+for m, n in [(30, 45), (60, 90), (120, 180)]:
+    c, A, b, signs = model(m, n, rng)
+    directions = {'b': np.where(rng.random(m) < 0.2, b, 0.0), 'c': -rng.random(n)}
+    for target, d in directions.items():
+        start = time.perf_counter()
+        solver = SimplexSolver(c, A, b, signs, 'dual_simplex', False, history='off')
+        result = solver.parametric(d, target, (0, 1))
+        exact = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        error = 0.0
+        for theta in np.linspace(0, result['theta'][1], samples):
+            cold = SimplexSolver(c + theta * d if target == 'c' else c, A, b + theta * d if target == 'b' else b,
+                                 signs, 'dual_simplex', False, history='off').solve()
+            segment = next(s for s in result['segments'] if s['theta'][0] - 1e-12 <= theta <= s['theta'][1] + 1e-12)
+            value = segment['value'][0] + (theta - segment['theta'][0]) * segment['slope']
+            error = max(error, abs(cold['optimal_value'] - value))
+        sampled = time.perf_counter() - start
+        print(f"{f'{m} x {n}':>10} | {target:>5} | {len(result['breakpoints']):>8} | {solver.pivot_count:>6} | "
+              f"{exact:16.3f} | {sampled:15.3f} | {error:9.1e}")
+    print("-" * 92)
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark du noyau de pivot de _solve_tableau : itérations par seconde
+avant (boucles Python) et après (_leaving_row, test du rapport NumPy avec Harris,
++ mise à jour de rang 1 BLAS), les noyaux qu'exécute le solveur.
+"""
+
+import time
+import numpy as np
+from app import SimplexSolver
+
+EPSILON = 1e-8
+
+
+def ratio_test_loop(tableau, pivot_col):
+    """Ancien test du rapport minimum (boucle Python)"""
+    col = tableau[:-1, pivot_col]
+    min_ratio = float('inf')
+    pivot_row = -1
+    for i in range(len(col)):
+        if col[i] > EPSILON:
+            ratio = tableau[i, -1] / col[i]
+            if ratio >= -EPSILON:
+                if ratio < min_ratio:
+                    min_ratio = ratio
+                    pivot_row = i
+    return pivot_row
+
+
+def pivot_loop(tableau, pivot_row, pivot_col):
+    """Ancien pivot de Gauss-Jordan (une ligne à la fois)"""
+    tableau[pivot_row, :] /= tableau[pivot_row, pivot_col]
+    for i in range(tableau.shape[0]):
+        if i != pivot_row:
+            factor = tableau[i, pivot_col]
+            tableau[i, :] -= factor * tableau[pivot_row, :]
+
+
+def random_tableau(m, n, rng):
+    tableau = np.empty((m + 1, n + 1))
+    tableau[:m, :n] = rng.random((m, n)) + 0.1
+    tableau[:m, n] = rng.random(m) * 10 + 1
+    tableau[m, :n] = -rng.random(n)
+    tableau[m, n] = 0
+    return tableau
+
+
+def run(tableau, ratio_test, pivot, n_pivots):
+    """Itérations par seconde sur n_pivots pivots (colonne : Dantzig)"""
+    start = time.perf_counter()
+    done = 0
+    for _ in range(n_pivots):
+        pivot_col = int(np.argmin(tableau[-1, :-1]))
+        pivot_row = ratio_test(tableau, pivot_col)
+        if pivot_row == -1:
+            break
+        pivot(tableau, pivot_row, pivot_col)
+        done += 1
+    return done / (time.perf_counter() - start)
+
+
+solver = SimplexSolver([0], [[0]], [0], ['<='])
+
+print("=" * 70)
+print(f"{'m x n':>14} | {'avant (it/s)':>14} | {'après (it/s)':>14} | {'accélération':>12}")
+print("=" * 70)
+for m, n in [(20, 40), (100, 200), (300, 600), (1000, 2000), (2000, 4000)]:
+    n_pivots = max(10, min(200, 200000 // m))
+    rng = np.random.default_rng(0)
+    base = random_tableau(m, n, rng)
+    before = run(base.copy(), ratio_test_loop, pivot_loop, n_pivots)
+    after = run(base.copy(),
+                lambda t, q: solver._leaving_row(t[:-1, q], t[:-1, -1], solver.basis, EPSILON),
+                solver._pivot, n_pivots)
+    print(f"{f'{m} x {n}':>14} | {before:14.1f} | {after:14.1f} | {after / before:11.1f}x")
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Benchmark des règles de prix (dantzig, devex, steepest_edge, partial) :
+nombre d'itérations et temps du simplexe révisé et de la méthode à deux phases.
+"""
+
+import time
+import numpy as np
+import scipy.sparse as sp
+from app import SimplexSolver, PRICING_RULES
+
+
+def random_model(m, n, rng, density=1.0, ge_fraction=0.0):
+    """
+    Modèle réalisable et borné (la dernière ligne, pleine et en <=, borne toutes
+    les variables) ; une partie des lignes en >= pour faire travailler la phase 1
+    """
+    A = rng.random((m, n)) * (rng.random((m, n)) < density)
+    A[-1] = rng.random(n) + 0.5
+    x0 = rng.random(n)
+    signs = np.where(rng.random(m) < ge_fraction, '>=', '<=')
+    signs[-1] = '<='
+    b = np.where(signs == '>=', A @ x0 * 0.5, A @ x0 + rng.random(m))
+    return -rng.random(n), A, b, signs.tolist()
+
+
+print("=" * 84)
+print(f"{'méthode':>9} | {'m x n':>15} | {'règle':>13} | {'itérations':>10} | {'temps (s)':>9} | {'Z':>14}")
+print("=" * 84)
+rng = np.random.default_rng(0)
+cases = [
+    ('two_phase', 100, 150, 1.0, 0.5, False),
+    ('two_phase', 200, 300, 1.0, 0.5, False),
+    ('revised', 200, 300, 1.0, 0.0, False),
+    ('revised', 400, 600, 1.0, 0.2, False),
+    ('revised', 600, 1200, 0.02, 0.2, True),
+]
+for method, m, n, density, ge_fraction, sparse in cases:
+    c, A, b, signs = random_model(m, n, rng, density, ge_fraction)
+    if sparse:
+        A = sp.csc_matrix(A)
+    label = f"{m} x {n}{' creux' if sparse else ''}"
+    for rule in PRICING_RULES:
+        start = time.perf_counter()
+        result = SimplexSolver(c, A, b, signs, method, False, history='off', pricing=rule).solve()
+        elapsed = time.perf_counter() - start
+        value = f"{result['optimal_value']:.6f}" if result['success'] else result['message'][:14]
+        print(f"{method:>9} | {label:>15} | {rule:>13} | {result.get('iterations', '-'):>10} | "
+              f"{elapsed:9.3f} | {value:>14}")
+    print("-" * 84)
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Benchmark de la génération de lignes : une famille de M contraintes <= sur
+n variables, dont peu sont actives à l'optimum. Comparaison entre le
+problème complet (SimplexSolver, simplexe dual) et RowGeneration depuis les
+bornes 0 <= x <= 10, sans plafond puis avec un plafond de lignes.
+"""
+
+import time
+import numpy as np
+from app import RowGeneration, SimplexSolver
+
+
+def separation(P, q, count=10):
+    def callback(x):
+        excess = P @ x - q
+        return [{'coefficients': P[i], 'sign': '<=', 'rhs': q[i]} for i in np.argsort(-excess)[:count] if excess[i] > 1e-9]
+    return callback
+
+
+print("=" * 104)
+print(f"{'M x n':>12} | {'complet (s)':>11} | {'lignes (s)':>10} | {'plafond (s)':>11} | {'ajoutées':>8} | "
+      f"{'retirées':>8} | {'pivots complet':>14} | {'pivots':>6} | {'écart':>7}")
+print("=" * 104)
+rng = np.random.default_rng(0)
+for M, n in [(1000, 10), (3000, 10), (3000, 30), (100000, 10)]:
+    P = rng.normal(size=(M, n))
+    q = P @ rng.random(n) + rng.random(M) + 0.1
+    c = -rng.random(n)
+    seed = (np.eye(n), np.full(n, 10.0), ['<='] * n)
+
+    full_time, full = None, None
+    # Au-delà, le tableau dense du problème complet ne tient plus en mémoire
+    if M <= 3000:
+        start = time.perf_counter()
+        full = SimplexSolver(c, np.vstack([P, seed[0]]), np.concatenate([q, seed[1]]), ['<='] * (M + n),
+                             'dual_simplex', False, history='off').solve()
+        full_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = RowGeneration(c, *seed, separation(P, q)).solve()
+    lazy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    capped = RowGeneration(c, *seed, separation(P, q), max_rows=3 * n).solve()
+    capped_time = time.perf_counter() - start
+
+    error = abs(result['optimal_value'] - capped['optimal_value'])
+    if full:
+        error = max(error, abs(result['optimal_value'] - full['optimal_value']))
+    print(f"{f'{M} x {n}':>12} | {f'{full_time:.3f}' if full else '-':>11} | {lazy_time:10.3f} | {capped_time:11.3f} | "
+          f"{result['rows_added']:8} | {capped['rows_purged']:8} | {full['pivots'] if full else '-':>14} | "
+          f"{result['pivots']:6} | {error:7.1e}")
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Benchmark de la mise à l'échelle sur des modèles mal conditionnés (coefficients
+de 1e-3 à 1e6) : nombre d'itérations, temps et exactitude sans mise à l'échelle,
+avec 'equilibrate' et avec 'geometric'. Les méthodes à tableau (Grand M, deux
+phases) sont celles dont les tolérances fixes (epsilon, M) souffrent le plus
+des écarts d'échelle ; un quart des lignes sont des >= (variables artificielles).
+"""
+
+import time
+import numpy as np
+from app import SimplexSolver
+
+
+def badly_scaled_model(m, n, rng):
+    """Modèle réalisable et borné dont lignes et colonnes ont des ordres de grandeur très différents"""
+    row_magnitude = 10.0 ** rng.integers(-3, 7, (m, 1))
+    col_magnitude = 10.0 ** rng.integers(-2, 3, (1, n))
+    A = rng.uniform(0.5, 5, (m, n)) * (rng.random((m, n)) < 0.6) * row_magnitude * col_magnitude
+    x0 = rng.random(n)
+    signs = ['<='] * (m - m // 4) + ['>='] * (m // 4)
+    # x0 réalise les <= (marge positive) et les >= (la moitié de A·x0)
+    b = np.where(np.array(signs) == '<=', A @ x0 + rng.random(m) * row_magnitude.ravel(), 0.5 * A @ x0)
+    c = -rng.random(n) / col_magnitude.ravel()
+    return c, A, b, signs
+
+
+print("=" * 101)
+print(f"{'méthode':>14} | {'m x n':>9} | {'itérations sans / equil. / géom.':>34} | "
+      f"{'temps (s) sans / equil. / géom.':>31} | {'exact':>5}")
+print("=" * 101)
+rng = np.random.default_rng(0)
+for m, n in [(20, 30), (50, 80), (100, 150)]:
+    c, A, b, signs = badly_scaled_model(m, n, rng)
+    reference = SimplexSolver(c, A, b, signs, 'highs', False).solve()['optimal_value']
+    for method in ('big_m', 'two_phase', 'revised', 'interior_point'):
+        iterations, times, exact = [], [], []
+        for scaling in (None, 'equilibrate', 'geometric'):
+            start = time.perf_counter()
+            result = SimplexSolver(c, A, b, signs, method, False, history='off', scaling=scaling).solve()
+            times.append(time.perf_counter() - start)
+            iterations.append(str(result.get('iterations', '-')))
+            exact.append(result['success'] and abs(result['optimal_value'] - reference) <= 1e-6 * max(1, abs(reference)))
+        print(f"{method:>14} | {f'{m} x {n}':>9} | {' / '.join(iterations):>34} | "
+              f"{' / '.join(f'{t:.3f}' for t in times):>31} | {'/'.join('o' if e else 'x' for e in exact):>5}")
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Benchmark de la transition phase 1 -> phase 2 sur des modèles riches en égalités :
+tableau complet copié en phase 2 (avant) contre tableau sans colonnes
+artificielles ni lignes redondantes (après).
+"""
+
+import time
+import numpy as np
+from app import SimplexSolver
+
+
+class FullTableauSolver(SimplexSolver):
+    """Ancien comportement : la phase 2 reçoit une copie du tableau complet de la phase 1"""
+
+    def _phase1_to_phase2(self, tableau):
+        return tableau.copy()
+
+
+def equality_model(m_eq, m_le, n, rng, redundant=0):
+    """Modèle réalisable : m_eq égalités (dont `redundant` lignes dupliquées) et m_le inégalités <="""
+    x0 = rng.random(n) * (rng.random(n) < 0.5)
+    A_eq = rng.random((m_eq - redundant, n))
+    A_eq = np.vstack([A_eq, A_eq[:redundant]])
+    A_le = rng.random((m_le, n))
+    A = np.vstack([A_eq, A_le])
+    b = np.concatenate([A_eq @ x0, A_le @ x0 + rng.random(m_le)])
+    signs = ['='] * m_eq + ['<='] * m_le
+    return rng.random(n) - 0.3, A, b, signs
+
+
+def timed(solver_class, c, A, b, signs, repeat):
+    shapes = []
+    best = np.inf
+    for _ in range(repeat):
+        solver = solver_class(c, A, b, signs, 'two_phase', False, history='off')
+        original = solver._solve_tableau
+
+        def record_shape(tableau, phase_name, **options):
+            shapes.append((phase_name, tableau.shape))
+            return original(tableau, phase_name, **options)
+
+        solver._solve_tableau = record_shape
+        start = time.perf_counter()
+        result = solver.solve()
+        best = min(best, time.perf_counter() - start)
+    phase2_shape = [shape for phase, shape in shapes if phase.startswith('Phase 2')][-1]
+    return result, best, phase2_shape
+
+
+print("=" * 100)
+print(f"{'m_eq + m_le x n':>18} | {'tableau phase 2 (avant)':>23} | {'(après)':>11} | "
+      f"{'avant (s)':>9} | {'après (s)':>9} | {'Z exact avant/après':>19}")
+print("=" * 100)
+rng = np.random.default_rng(0)
+for m_eq, m_le, n, redundant in [(40, 10, 60, 0), (80, 20, 120, 5), (160, 40, 240, 10), (200, 50, 300, 20)]:
+    c, A, b, signs = equality_model(m_eq, m_le, n, rng, redundant)
+    repeat = 3
+    before, t_before, shape_before = timed(FullTableauSolver, c, A, b, signs, repeat)
+    after, t_after, shape_after = timed(SimplexSolver, c, A, b, signs, repeat)
+    reference = SimplexSolver(c, A, b, signs, 'highs', False).solve()['optimal_value']
+    exact = [r['success'] and abs(r['optimal_value'] - reference) < 1e-6 for r in (before, after)]
+    print(f"{f'{m_eq} + {m_le} x {n}':>18} | {str(shape_before):>23} | {str(shape_after):>11} | "
+          f"{t_before:9.3f} | {t_after:9.3f} | {f'{exact[0]}/{exact[1]}':>19}")
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Benchmark du démarrage à chaud : re-résolution après une petite modification
+(un coefficient de b, de c ou de A) à froid puis à partir de la base optimale
+du modèle d'origine.
+"""
+
+import time
+import numpy as np
+from app import SimplexSolver
+
+
+def model(m, n, rng):
+    A = rng.random((m, n))
+    x0 = rng.random(n)
+    signs = ['<='] * (m - m // 4) + ['>='] * (m // 4)
+    b = np.where(np.array(signs) == '<=', A @ x0 + 1, A @ x0 * 0.5)
+    return -rng.random(n), A, b, signs
+
+
+def timed(c, A, b, signs, basis=None):
+    start = time.perf_counter()
+    solver = SimplexSolver(c, A, b, signs, 'two_phase', False, history='pivots', basis=basis)
+    result = solver.solve()
+    return result, len(solver.pivot_history), time.perf_counter() - start
+
+
+print("=" * 86)
+print(f"{'m x n':>10} | {'modification':>14} | {'pivots à froid':>14} | {'à chaud':>7} | "
+      f"{'temps froid (s)':>15} | {'chaud (s)':>9} | {'Z':>5}")
+print("=" * 86)
+rng = np.random.default_rng(0)
+for m, n in [(50, 75), (100, 150), (200, 300)]:
+    c, A, b, signs = model(m, n, rng)
+    basis = SimplexSolver(c, A, b, signs, 'two_phase', False, history='off').solve()['basis']
+    edits = {
+        'b[i] * 0.9': (c, A, b * np.where(np.arange(m) == rng.integers(m), 0.9, 1.0)),
+        'c[j] * 1.5': (c * np.where(np.arange(n) == rng.integers(n), 1.5, 1.0), A, b),
+        'a[i, j] + 0.5': (c, A + 0.5 * (np.arange(m)[:, None] == rng.integers(m)) * (np.arange(n) == rng.integers(n)), b),
+    }
+    for label, (c2, A2, b2) in edits.items():
+        cold, cold_pivots, cold_time = timed(c2, A2, b2, signs)
+        warm, warm_pivots, warm_time = timed(c2, A2, b2, signs, basis)
+        same = cold['success'] and warm['success'] and abs(cold['optimal_value'] - warm['optimal_value']) < 1e-6
+        print(f"{f'{m} x {n}':>10} | {label:>14} | {cold_pivots:>14} | {warm_pivots:>7} | "
+              f"{cold_time:15.3f} | {warm_time:9.3f} | {'=' if same else '≠':>5}")
+    print("-" * 86)
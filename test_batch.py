@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Test de solve_batch : plusieurs problèmes de même forme résolus en un seul lot"""
+
+import time
+import numpy as np
+from app import SimplexSolver, solve_batch
+
+print("=" * 70)
+print("RÉSOLUTION PAR LOT")
+print("=" * 70)
+
+# Min Z = c·x, x1 + 2x2 >= 6, 2x1 + x2 >= 5, x1 + x2 <= b3 (b3 varie)
+A = [[1, 2], [2, 1], [1, 1]]
+signs = ['>=', '>=', '<=']
+c = [[2, 3], [3, 2], [1, 1], [2, 3]]
+b = [[6, 5, 10], [6, 5, 10], [6, 5, 10], [6, 5, 1]]
+
+results = solve_batch(c, A, b, signs)
+expected = [9.6667, 8.6667, 3.6667, None]
+for p, (result, z) in enumerate(zip(results, expected)):
+    if z is None:
+        print(f"{'OK' if not result['success'] else 'XX'} - Problème {p}: {result['message']}")
+    else:
+        status = "OK" if result['success'] and abs(result['optimal_value'] - z) < 1e-3 else "XX"
+        print(f"{status} - Problème {p}: Z = {result.get('optimal_value', 0):.4f} (attendu {z}), "
+              f"solution = {np.round(result.get('solution', []), 4).tolist()}, {result.get('iterations')} pivots")
+
+# Problème non borné dans le lot : Min Z = -x1 - x2, x1 - x2 <= 1
+results = solve_batch([[-1, -1], [1, 1]], [[1, -1]], [1], ['<='])
+print(f"{'OK' if not results[0]['success'] and results[1]['success'] else 'XX'} - Non borné masqué: "
+      f"{results[0]['message']} / {results[1]['message']}")
+
+# Lot aléatoire : comparaison avec le simplexe révisé problème par problème
+print("\nLot aléatoire de 2000 problèmes 8 x 6")
+rng = np.random.default_rng(0)
+k, m, n = 2000, 8, 6
+signs = ['<='] * 6 + ['>='] * 2
+A = rng.random((k, m, n)) + 0.1
+b = np.concatenate([rng.random((k, 6)) * 10 + 5, rng.random((k, 2))], axis=1)
+c = rng.random((k, n)) - 0.5
+
+start = time.perf_counter()
+batch = solve_batch(c, A, b, signs)
+batch_time = time.perf_counter() - start
+
+start = time.perf_counter()
+single = [SimplexSolver(c[p], A[p], b[p], signs, 'revised', False, history='off').solve() for p in range(k)]
+single_time = time.perf_counter() - start
+
+agree = all(
+    r1['success'] == r2['success'] and (not r1['success'] or abs(r1['optimal_value'] - r2['optimal_value']) < 1e-6)
+    for r1, r2 in zip(batch, single)
+)
+print(f"{'OK' if agree else 'XX'} - Mêmes résultats que SimplexSolver('revised')")
+print(f"Lot: {batch_time:.3f} s, un par un: {single_time:.3f} s ({single_time / batch_time:.1f}x)")
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Test de l'endpoint /solve/batch (pool de processus, résultats en flux ordonné)"""
+
+import json
+import os
+from concurrent.futures.process import BrokenProcessPool
+from app import app, get_executor
+
+client = app.test_client()
+
+print("=" * 70)
+print("ENDPOINT /solve/batch")
+print("=" * 70)
+
+good = {'c': [2, 3], 'A': [[1, 2], [2, 1]], 'b': [6, 5], 'signs': ['>=', '>='],
+        'method': 'revised', 'objective_type': 'min'}
+problems = [
+    good,
+    {'c': [2, 3], 'A': [[1, 2]], 'b': [6, 5], 'signs': ['>=', '>=']},       # dimensions incompatibles
+    dict(good, signs=['>=', '=>']),                                           # signe invalide
+    {'c': [1, 1], 'A': [[1, -1]], 'b': [1], 'signs': ['<='],
+     'method': 'revised', 'objective_type': 'max'},                           # non borné
+    'pas un problème',
+    dict(good, b=[12, 10]),
+]
+
+response = client.post('/solve/batch', data=json.dumps({'problems': problems}),
+                       content_type='application/json')
+lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+print(f"HTTP {response.status_code}, {response.mimetype}, {len(lines)} résultats")
+print(f"{'OK' if [r['index'] for r in lines] == list(range(len(problems))) else 'XX'} - Résultats dans l'ordre")
+for r in lines:
+    print(f"  #{r['index']} [{r['status']}] success={r['success']} "
+          f"{r.get('optimal_value', '')} {r.get('message', '')}")
+
+expected = [True, False, False, False, False, True]
+print(f"{'OK' if [r['success'] for r in lines] == expected else 'XX'} - Une erreur n'interrompt pas le lot")
+print(f"{'OK' if abs(lines[5]['optimal_value'] - 2 * lines[0]['optimal_value']) < 1e-6 else 'XX'} - "
+      f"b doublé => Z doublé")
+
+# Liste directe (sans clé "problems") et lot vide
+response = client.post('/solve/batch', data=json.dumps([good]), content_type='application/json')
+print(f"{'OK' if response.status_code == 200 else 'XX'} - Liste directe acceptée")
+response = client.post('/solve/batch', data=json.dumps([]), content_type='application/json')
+print(f"{'OK' if response.status_code == 400 else 'XX'} - Lot vide refusé ({response.get_json()['message']})")
+
+# Worker tué : le pool est cassé, le lot suivant reçoit une 500 et le pool est recréé
+try:
+    get_executor().submit(os._exit, 1).result()
+except BrokenProcessPool:
+    pass
+response = client.post('/solve/batch', data=json.dumps([good]), content_type='application/json')
+print(f"{'OK' if response.status_code == 500 else 'XX'} - Pool cassé: HTTP {response.status_code} "
+      f"({response.get_json()['message']})")
+response = client.post('/solve/batch', data=json.dumps([good]), content_type='application/json')
+lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+print(f"{'OK' if response.status_code == 200 and lines[0]['success'] else 'XX'} - Lot suivant résolu par un nouveau pool")
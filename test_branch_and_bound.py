@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Test de la séparation et évaluation (variables entières et binaires)"""
+
+import json
+import os
+import threading
+import numpy as np
+from scipy.optimize import Bounds, LinearConstraint, milp
+
+from app import app, BranchAndBound
+
+print("=" * 70)
+print("BRANCH AND BOUND")
+print("=" * 70)
+
+client = app.test_client()
+# Max Z = 5x1 + 4x2 + 3x3 : relaxation fractionnaire, optimum entier Z = 13 en (2, 0, 1)
+data = {'c': [5, 4, 3], 'A': [[2, 3, 1], [4, 1, 2], [3, 4, 2]], 'b': [5, 11, 8], 'signs': ['<=', '<=', '<='],
+        'objective_type': 'max', 'integrality': ['integer', 'integer', 'integer']}
+result = client.post('/solve', json=dict(data, b=[5.5, 11, 8])).get_json()
+print(f"{'OK' if result['success'] and abs(result['optimal_value'] - 13) < 1e-9 and result['gap'] == 0 else 'XX'} - "
+      f"/solve: Z = {result['optimal_value']}, x = {result['solution']}, {result['nodes']} nœuds, écart {result['gap']}")
+
+# Sac à dos binaire : comparaison avec scipy.optimize.milp, deux sélections de nœuds
+rng = np.random.default_rng(3)
+n, m = 30, 8
+A = rng.integers(1, 30, (m, n)).astype(float)
+b = A.sum(axis=1) * 0.3
+c = -rng.integers(1, 40, n).astype(float)
+reference = milp(c, constraints=LinearConstraint(A, -np.inf, b), integrality=np.ones(n), bounds=Bounds(0, 1))
+for selection in BranchAndBound.NODE_SELECTIONS:
+    result = BranchAndBound(c, A, b, ['<='] * m, ['binary'] * n, node_selection=selection).solve()
+    ok = abs(result['optimal_value'] - reference.fun) < 1e-6 and result['gap'] == 0 and result['open_nodes'] == 0
+    print(f"{'OK' if ok else 'XX'} - Sac à dos ({selection}): Z = {result['optimal_value']:.1f}, {result['nodes']} nœuds, "
+          f"{result['pivots'] / result['nodes']:.1f} pivots par nœud")
+
+# Limite de nœuds : solution partielle avec écart, ou aucune solution
+result = BranchAndBound(c, A, b, ['<='] * m, ['binary'] * n, node_selection='depth_first', max_nodes=200).solve()
+print(f"{'OK' if result['success'] and result['gap'] > 0 and result['open_nodes'] > 0 else 'XX'} - "
+      f"200 nœuds en profondeur: {result['message']}, borne {result['bound']:.2f}")
+result = BranchAndBound(c, A, b, ['<='] * m, ['binary'] * n, gap=0.05).solve()
+print(f"{'OK' if result['gap'] <= 0.05 else 'XX'} - Écart toléré de 5 %: {result['nodes']} nœuds, écart {result['gap']:.4f}")
+
+# Problèmes mixtes aléatoires (>=, =, b < 0) contre milp
+checked = failures = 0
+for _ in range(80):
+    m, n = rng.integers(2, 6), rng.integers(2, 7)
+    A = np.vstack([rng.integers(-3, 8, (m, n)).astype(float), np.ones(n)])
+    b = np.append(rng.integers(-5, 30, m).astype(float), 25)
+    signs = list(rng.choice(['<=', '>=', '='], m, p=[.7, .2, .1])) + ['<=']
+    c = rng.integers(-9, 10, n).astype(float)
+    integrality = list(rng.choice(['continuous', 'integer', 'binary'], n, p=[.3, .5, .2]))
+    result = BranchAndBound(c, A, b, signs, integrality, parallel=True, workers=2).solve()
+    low = np.where(np.isin(signs, ['>=', '=']), b, -np.inf)
+    high = np.where(np.isin(signs, ['<=', '=']), b, np.inf)
+    reference = milp(c, constraints=LinearConstraint(A, low, high), integrality=np.array(integrality) != 'continuous',
+                     bounds=Bounds(0, np.where(np.array(integrality) == 'binary', 1, np.inf)))
+    checked += 1
+    if reference.status == 0:
+        failures += not result['success'] or abs(result['optimal_value'] - reference.fun) > 1e-5
+    else:
+        failures += result['success']
+print(f"{'OK' if failures == 0 else 'XX'} - {checked} problèmes mixtes contre milp (pool de processus), {failures} écart(s)")
+
+# Erreurs
+response = client.post('/solve', json=dict(data, integrality=['integer', 'real', 'integer']))
+print(f"{'OK' if response.status_code == 400 else 'XX'} - Type invalide: {response.get_json()['message']}")
+
+# Problèmes entiers avec "parallel" dans /solve/batch : les workers du pool ne
+# doivent pas soumettre leurs nœuds au pool hérité du parent (blocage)
+lines = []
+request = threading.Thread(daemon=True, target=lambda: lines.extend(
+    json.loads(line) for line in client.post('/solve/batch', json={'problems': [dict(data, b=[5.5, 11, 8], parallel=True, workers=2)] * 2})
+    .get_data(as_text=True).splitlines()))
+request.start()
+request.join(120)
+ok = not request.is_alive() and len(lines) == 2 and all(abs(r['optimal_value'] - 13) < 1e-9 for r in lines)
+print(f"{'OK' if ok else 'XX'} - /solve/batch avec parallel: {'bloqué' if request.is_alive() else [r.get('optimal_value') for r in lines]}")
+if request.is_alive():
+    os._exit(1)
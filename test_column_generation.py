@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Test de la génération de colonnes (rappel de prix, colonnes ajoutées au tableau courant)"""
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.optimize import linprog
+from app import ColumnGeneration, cutting_stock
+
+
+def all_patterns(widths, roll_width):
+    """Tous les motifs de découpe (colonnes du problème complet)"""
+    patterns = [[]]
+    for width in widths:
+        patterns = [p + [k] for p in patterns for k in range(int(roll_width - np.dot(p, widths[:len(p)])) // width + 1)]
+    return np.array([p for p in patterns if any(p)]).T
+
+
+print("=" * 70)
+print("GÉNÉRATION DE COLONNES")
+print("=" * 70)
+
+# Découpe classique : 4 largeurs, rouleaux de 100
+widths, demands = [45, 36, 31, 14], [97, 610, 395, 211]
+result = cutting_stock(widths, demands, 100)
+patterns = all_patterns(widths, 100)
+reference = linprog(np.ones(patterns.shape[1]), A_ub=-patterns, b_ub=-np.array(demands), method='highs')
+covered = np.array(result['patterns']).T @ np.array(result['solution'])
+ok = abs(result['optimal_value'] - reference.fun) < 1e-6 and np.all(covered >= np.array(demands) - 1e-6)
+print(f"{'OK' if ok else 'XX'} - Découpe: {result['optimal_value']:.2f} rouleaux, {len(result['patterns'])} motifs "
+      f"sur {patterns.shape[1]}, {result['rounds']} tours")
+values = result['objective_values']
+print(f"{'OK' if all(b <= a + 1e-9 for a, b in zip(values, values[1:])) else 'XX'} - Valeur du maître décroissante: "
+      f"{[round(v, 2) for v in values]}")
+
+# Découpes aléatoires contre le problème complet (avec et sans mise à l'échelle)
+rng = np.random.default_rng(0)
+failures = 0
+for _ in range(20):
+    roll_width = int(rng.integers(50, 150))
+    widths = rng.integers(roll_width // 10 + 1, roll_width // 2 + 1, rng.integers(3, 9))
+    demands = rng.integers(1, 100, len(widths))
+    patterns = all_patterns(widths, roll_width)
+    reference = linprog(np.ones(patterns.shape[1]), A_ub=-patterns, b_ub=-demands, method='highs')
+    for scaling in (None, 'geometric'):
+        result = cutting_stock(widths, demands, roll_width, scaling=scaling)
+        failures += not result['success'] or abs(result['optimal_value'] - reference.fun) > 1e-6
+print(f"{'OK' if failures == 0 else 'XX'} - 40 découpes aléatoires contre le problème complet, {failures} écart(s)")
+
+# Rappel générique : colonnes tirées d'un réservoir, contraintes <=, >= et =, A creuse
+failures = 0
+for _ in range(30):
+    m, n = 6, 60
+    pool = rng.integers(0, 5, (m, n)).astype(float)
+    costs = rng.integers(1, 20, n).astype(float)
+    signs = ['>='] * 3 + ['<='] * 2 + ['=']
+    b = pool[:, :m] @ np.full(m, 2.0)
+    # Colonnes de départ : les m premières, réalisables en x = 2
+    seed = sp.csr_matrix(pool[:, :m])
+
+    def pricing(duals):
+        reduced = costs - pool.T @ duals
+        best = np.argsort(reduced)[:3]
+        return [(costs[j], pool[:, j]) for j in best if reduced[j] < -1e-9]
+
+    result = ColumnGeneration(costs[:m], seed, b, signs, pricing).solve()
+    reference = linprog(costs, A_ub=np.vstack([-pool[:3], pool[3:5]]), b_ub=np.concatenate([-b[:3], b[3:5]]),
+                        A_eq=pool[5:], b_eq=b[5:], method='highs')
+    ok = result['success'] and abs(result['optimal_value'] - reference.fun) < 1e-6
+    # Prix duaux : coûts réduits >= 0 sur tout le réservoir à l'arrêt, y·b = Z (dualité forte)
+    ok = ok and np.all(costs - pool.T @ np.array(result['duals']) >= -1e-6)
+    ok = ok and abs(np.dot(result['duals'], b) - reference.fun) < 1e-6
+    failures += not ok
+print(f"{'OK' if failures == 0 else 'XX'} - 30 maîtres restreints (<=, >=, =) contre le problème complet, {failures} écart(s)")
+
+# Rappel qui ne propose que des colonnes sans intérêt : arrêt immédiat
+result = ColumnGeneration([1, 1], [[1, 0], [0, 1]], [3, 4], ['>=', '>='], lambda y: [(10.0, [1, 1])]).solve()
+print(f"{'OK' if result['rounds'] == 1 and not result['columns'] and result['optimal_value'] == 7 else 'XX'} - "
+      f"Colonne de coût réduit positif ignorée: {result['message']}")
+result = ColumnGeneration([1], [[1]], [-1], ['<='], lambda y: []).solve()
+print(f"{'OK' if not result['success'] else 'XX'} - Maître de départ non réalisable: {result['message']}")
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Test de la base de départ sans artificielles (crash)"""
+
+import numpy as np
+import scipy.sparse as sp
+from app import SimplexSolver, solve_problem
+
+print("=" * 70)
+print("CRASH : BASE DE DÉPART")
+print("=" * 70)
+
+# Production (lignes <=) et demandes (lignes >= / =) ; chaque demande a une
+# variable de sous-traitance qui n'apparaît que dans sa ligne (colonne singleton)
+rng = np.random.default_rng(0)
+products, resources = 30, 20
+usage = rng.random((resources, products))
+capacity = usage @ rng.random(products) * 1.5
+demand = rng.random(products) * 0.5
+A = np.block([[usage, np.zeros((resources, products))], [np.eye(products), np.eye(products)]])
+b = np.concatenate([capacity, demand])
+signs = ['<='] * resources + ['>='] * (products - 5) + ['='] * 5
+c = np.concatenate([rng.random(products), 5 + rng.random(products)])
+reference = SimplexSolver(c, A, b, signs, 'highs', False).solve()
+
+
+def phase1_pivots(solver):
+    return sum(entry['phase'] == "Phase 1 - Minimiser variables artificielles" for entry in solver.pivot_history)
+
+
+for method in ('two_phase', 'big_m', 'revised'):
+    cold = SimplexSolver(c, A, b, signs, method, False, history='pivots', crash=False)
+    cold_result = cold.solve()
+    crash = SimplexSolver(c, A, b, signs, method, False, history='pivots')
+    result = crash.solve()
+    ok = (result['success'] and abs(result['optimal_value'] - reference['optimal_value']) < 1e-6
+          and result['artificials_avoided'] == products and not crash.artificial_vars
+          and cold_result['artificials_avoided'] == 0 and result['pivots'] < cold_result['pivots'])
+    print(f"{'OK' if ok else 'XX'} - {method}: {result['artificials_avoided']} artificielles évitées, "
+          f"{result['pivots']} pivots contre {cold_result['pivots']}")
+
+# Matrice creuse : mêmes colonnes choisies
+solver = SimplexSolver(c, sp.csr_matrix(A), b, signs, 'two_phase', False)
+result = solver.solve()
+print(f"{'OK' if result['artificials_avoided'] == products and abs(result['optimal_value'] - reference['optimal_value']) < 1e-6 else 'XX'} - "
+      f"Matrice creuse: {result['artificials_avoided']} artificielles évitées")
+
+# Candidats refusés : coefficient négatif, écart d'une ligne <= rendu négatif
+# x1 - x2 >= 2 : x1 seul candidat (x2 a un coefficient négatif) mais x1 = 2 viole x1 + x3 <= 1
+# 2 x3 = 4 : x3 = 2 viole aussi x1 + x3 <= 1 -> artificielles gardées, problème non réalisable
+solver = SimplexSolver([1, 1, 1], [[1, -1, 0], [0, 0, 2], [1, 0, 1]], [2, 4, 1], ['>=', '=', '<='], 'two_phase', False)
+result = solver.solve()
+print(f"{'OK' if result['artificials_avoided'] == 0 and not result['success'] else 'XX'} - "
+      f"Candidats refusés: {result['artificials_avoided']} évitée, {result['message']}")
+
+# Crash partiel : x3 couvre 2 x3 + x4 = 4, x1 est refusé (x1 + x3 <= 3), x4 est dans deux lignes
+solver = SimplexSolver([1, 1, 1, 1], [[1, -1, 0, 1], [0, 0, 2, 1], [1, 0, 1, 0]], [2, 4, 3], ['>=', '=', '<='],
+                       'two_phase', False, history='pivots')
+result = solver.solve()
+print(f"{'OK' if result['artificials_avoided'] == 1 and abs(result['optimal_value'] - 3) < 1e-9 else 'XX'} - "
+      f"Crash partiel: {solver.crash_basis}, {phase1_pivots(solver)} pivot(s) de phase 1, "
+      f"Z = {result['optimal_value']}")
+
+# Ligne >= de second membre nul : la variable d'écart suffit
+solver = SimplexSolver([1, 2], [[1, -1], [1, 1]], [0, 4], ['>=', '>='], 'two_phase', False)
+result = solver.solve()
+print(f"{'OK' if result['artificials_avoided'] == 1 and abs(result['optimal_value'] - 4) < 1e-9 else 'XX'} - "
+      f"Écart d'une ligne >= 0: {solver.crash_basis}, Z = {result['optimal_value']}")
+
+# /solve : activé par défaut, "crash": false pour le désactiver
+data = {'c': c.tolist(), 'A': A.tolist(), 'b': b.tolist(), 'signs': signs, 'objective_type': 'min',
+        'method': 'two_phase', 'presolve': False}
+on, _ = solve_problem(data)
+off, _ = solve_problem(dict(data, crash=False))
+print(f"{'OK' if on['artificials_avoided'] == products and off['artificials_avoided'] == 0 and abs(on['optimal_value'] - off['optimal_value']) < 1e-9 else 'XX'} - "
+      f"/solve: {on['artificials_avoided']} évitées, {off['artificials_avoided']} avec crash=false")
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Test du traitement de la dégénérescence (Harris, perturbation, règle de Bland)"""
+
+import numpy as np
+from app import SimplexSolver, solve_problem
+
+print("=" * 70)
+print("DÉGÉNÉRESCENCE")
+print("=" * 70)
+
+# Exemple de Beale : le test du rapport classique avec la règle de Dantzig cycle
+c = [-0.75, 20, -0.5, 6]
+A = [[0.25, -8, -1, 9], [0.5, -12, -0.5, 3], [0, 0, 1, 0]]
+b = [0, 0, 1]
+signs = ['<=', '<=', '<=']
+
+print("\nExemple de Beale (optimum Z = -1.25)")
+for method in ('big_m', 'two_phase', 'revised'):
+    result = SimplexSolver(c, A, b, signs, method, False, history='off', harris=False, bland_after=None).solve()
+    print(f"{'OK' if not result['success'] else 'XX'} - {method} sans protection: {result['message']}")
+    for options in ({}, {'harris': False, 'bland_after': 5}, {'harris': False, 'bland_after': None, 'perturbation': True}):
+        if method == 'revised' and options.get('perturbation'):
+            continue  # Perturbation : méthodes à tableau seulement
+        result = SimplexSolver(c, A, b, signs, method, False, history='off', **options).solve()
+        ok = result['success'] and abs(result['optimal_value'] + 1.25) < 1e-9
+        print(f"{'OK' if ok else 'XX'} - {method} {options or 'par défaut'}: Z = {result.get('optimal_value')}, "
+              f"{result['degenerate_pivots']} pivots dégénérés, {result['bland_pivots']} pivots de Bland")
+
+# Z = 0 au départ n'est pas optimal hors de la phase 1
+print("\nMax Z = 3x1 + 2x2, x1 + x2 <= 4, 2x1 + x2 <= 5 (Z = 0 sur la base de départ)")
+for method in ('big_m', 'two_phase'):
+    result = SimplexSolver([-3, -2], [[1, 1], [2, 1]], [4, 5], signs[:2], method, False, history='off').solve()
+    print(f"{'OK' if abs(result['optimal_value'] + 9) < 1e-9 else 'XX'} - {method}: Z = {-result['optimal_value']}")
+
+# Modèle très dégénéré : les 60 contraintes passent toutes par le sommet x = (1, ..., 1)
+rng = np.random.default_rng(0)
+m, n = 60, 30
+A = rng.integers(1, 4, (m, n)).astype(float)
+b = A @ np.ones(n)
+c = -A[:n].sum(axis=0) * rng.random(n)
+signs = ['<='] * m
+reference = SimplexSolver(c, A, b, signs, 'highs', False).solve()['optimal_value']
+print("\nModèle dégénéré 60 x 30")
+for options in ({}, {'perturbation': True}, {'harris': False, 'bland_after': 10}):
+    result = SimplexSolver(c, A, b, signs, 'two_phase', False, history='off', **options).solve()
+    ok = result['success'] and abs(result['optimal_value'] - reference) < 1e-6
+    print(f"{'OK' if ok else 'XX'} - {options or 'par défaut'}: {result['iterations']} itérations, "
+          f"{result['degenerate_pivots']} pivots dégénérés")
+
+# /solve expose les compteurs
+result, _ = solve_problem({'c': [3, 2], 'A': [[1, 1], [2, 1]], 'b': [4, 5], 'signs': ['<=', '<='],
+                           'perturbation': True, 'presolve': False})
+print(f"\n{'OK' if abs(result['optimal_value'] - 9) < 1e-9 and 'degenerate_pivots' in result else 'XX'} - "
+      f"/solve: Z = {result['optimal_value']}, degenerate_pivots = {result['degenerate_pivots']}")
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""Test du simplexe dual (method='dual_simplex')"""
+
+from app import SimplexSolver, solve_problem
+
+print("=" * 70)
+print("SIMPLEXE DUAL")
+print("=" * 70)
+
+
+def check(label, c, A, b, signs, expected):
+    solver = SimplexSolver(c, A, b, signs, 'dual_simplex', False, history='pivots')
+    result = solver.solve()
+    if expected is None:
+        ok = not result['success']
+        detail = result['message']
+    else:
+        ok = result['success'] and abs(result['optimal_value'] - expected) < 1e-8
+        detail = f"Z = {result.get('optimal_value')}, x = {result.get('solution')}, {result.get('iterations')} itérations"
+    ok = ok and not solver.artificial_vars
+    print(f"{'OK' if ok else 'XX'} - {label}: {detail}")
+
+
+# Régime : min 0.6x1 + 0.35x2, 5x1 + 7x2 >= 8, 4x1 + 2x2 >= 15, 2x1 + x2 >= 3
+check("Régime (>= uniquement)", [0.6, 0.35], [[5, 7], [4, 2], [2, 1]], [8, 15, 3], ['>=', '>=', '>='], 2.25)
+
+# Mélange >=, <= et = : min 4x1 + 3x2, x1 + x2 >= 10, 2x1 + x2 >= 16, x1 <= 6, x1 - x2 = 2
+check("Mélange de signes", [4, 3], [[1, 1], [2, 1], [1, 0], [1, -1]], [10, 16, 6, 2], ['>=', '>=', '<=', '='], 36)
+
+# Coûts négatifs : la base des écarts n'est pas duale réalisable (coûts décalés puis primal)
+check("Coûts négatifs", [-3, -2], [[1, 1], [2, 1], [1, 0]], [4, 5, 1], ['<=', '<=', '>='], -9)
+
+# Non réalisable : x1 + x2 >= 5 et x1 + x2 <= 3
+check("Non réalisable", [1, 1], [[1, 1], [1, 1]], [5, 3], ['>=', '<='], None)
+
+# Non borné : coût négatif sans plafond
+check("Non borné", [-1, 1], [[1, 1]], [2], ['>='], None)
+
+# /solve
+result, _ = solve_problem({'c': [0.6, 0.35], 'A': [[5, 7], [4, 2], [2, 1]], 'b': [8, 15, 3],
+                           'signs': ['>=', '>=', '>='], 'objective_type': 'min', 'method': 'dual_simplex',
+                           'presolve': False})
+print(f"{'OK' if result['method'] == 'Simplexe Dual' and abs(result['optimal_value'] - 2.25) < 1e-8 else 'XX'} - "
+      f"/solve: Z = {result['optimal_value']}")
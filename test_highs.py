@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""Test du moteur HiGHS (scipy.optimize.linprog) et de la méthode 'auto'"""
+
+import json
+import numpy as np
+import scipy.sparse as sp
+from app import SimplexSolver, app
+
+print("=" * 70)
+print("HiGHS ET MÉTHODE AUTO")
+print("=" * 70)
+
+cases = [
+    ("Min Z = 2x1 + 3x2, x1 + 2x2 >= 6, 2x1 + x2 >= 5", [2, 3], [[1, 2], [2, 1]], [6, 5], ['>=', '>=']),
+    ("Min Z = x1 + x2, x1 + x2 = 5, x1 >= 2", [1, 1], [[1, 1], [1, 0]], [5, 2], ['=', '>=']),
+    ("Max Z = 3x1 + 2x2, x1 + x2 <= 4, 2x1 + x2 <= 5", [-3, -2], [[1, 1], [2, 1]], [4, 5], ['<=', '<=']),
+    ("Infaisable", [1, 1], [[1, 1], [1, 1]], [2, 5], ['<=', '>=']),
+    ("Non borné", [-1, -1], [[1, -1]], [1], ['<=']),
+]
+
+for name, c, A, b, signs in cases:
+    highs = SimplexSolver(c, A, b, signs, 'highs', False).solve()
+    revised = SimplexSolver(c, A, b, signs, 'revised', False).solve()
+    same = highs['success'] == revised['success'] and (
+        not highs['success'] or abs(highs['optimal_value'] - revised['optimal_value']) < 1e-8)
+    detail = f"Z = {highs['optimal_value']:.4f}" if highs['success'] else highs['message']
+    print(f"{'OK' if same else 'XX'} - {name}: {detail}")
+
+# Matrice creuse
+result = SimplexSolver([2, 3], sp.csr_matrix([[1, 2], [2, 1]]), [6, 5], ['>=', '>='], 'highs', False).solve()
+print(f"{'OK' if abs(result['optimal_value'] - 29 / 3) < 1e-8 else 'XX'} - Matrice creuse: Z = {result['optimal_value']:.4f}")
+
+# Méthode auto : petit problème -> tableau, gros problème -> HiGHS
+small = SimplexSolver([2, 3], [[1, 2], [2, 1]], [6, 5], ['>=', '>='], 'auto', False).solve()
+rng = np.random.default_rng(0)
+m, n = 200, 200
+A = rng.random((m, n))
+big = SimplexSolver(-rng.random(n), A, rng.random(m) * 10 + 1, ['<='] * m, 'auto', False).solve()
+print(f"{'OK' if small['method'] == 'Deux Phases' else 'XX'} - auto, 2 x 2: {small['method']}")
+print(f"{'OK' if big['method'] == 'HiGHS' else 'XX'} - auto, {m} x {n}: {big['method']}")
+
+# /solve avec method='highs' et b négatif (même inversion que les autres méthodes)
+client = app.test_client()
+data = {'c': [2, 3], 'A': [[1, 2], [-2, -1]], 'b': [6, -5], 'signs': ['>=', '<='],
+        'method': 'highs', 'objective_type': 'min'}
+result = client.post('/solve', data=json.dumps(data), content_type='application/json').get_json()
+print(f"{'OK' if abs(result.get('optimal_value', 0) - 29 / 3) < 1e-8 else 'XX'} - /solve: {result}")
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Test des modes d'historique (off / pivots / full) et de la reconstruction des tableaux"""
+
+import json
+import numpy as np
+from app import SimplexSolver, app
+
+print("=" * 70)
+print("HISTORIQUE DES ITÉRATIONS")
+print("=" * 70)
+
+# Min Z = 5x1 + 9x2 + 14x3, x1 >= 3, x2 >= 104, x3 >= 37
+c = [5, 9, 14]
+A = [[1, 0, 0], [0, 1, 0], [0, 0, 1]]
+b = [3, 104, 37]
+signs = ['>=', '>=', '>=']
+
+full = SimplexSolver(c, A, b, signs, 'two_phase', False, history='full')
+result_full = full.solve()
+pivots = SimplexSolver(c, A, b, signs, 'two_phase', False, history='pivots')
+result_pivots = pivots.solve()
+off = SimplexSolver(c, A, b, signs, 'two_phase', False, history='off')
+result_off = off.solve()
+
+print(f"{'OK' if result_full == result_pivots == result_off else 'XX'} - Même résultat dans les trois modes")
+print(f"Mode 'full'  : {len(full.tableau_history)} tableaux, {len(full.pivot_history)} pivots")
+print(f"Mode 'pivots': {len(pivots.tableau_history)} tableaux, {len(pivots.pivot_history)} pivots")
+print(f"Mode 'off'   : {len(off.tableau_history)} tableaux, {len(off.pivot_history)} pivots")
+print(f"{'OK' if not off.tableau_history and not off.pivot_history and not off.initial_tableaux else 'XX'} - Rien n'est conservé en mode 'off'")
+
+for p in pivots.pivot_history:
+    print(f"  {p['phase']} #{p['iteration']}: entrante x{p['entering'] + 1}, ligne {p['leaving_row']}, Z = {p['objective']:.4f}")
+
+# Chaque tableau du mode 'full' doit être reconstruit à l'identique depuis le journal
+identical = all(
+    np.array_equal(pivots.rebuild_tableau(entry['phase'], entry['iteration']), entry['tableau'])
+    for entry in full.tableau_history
+)
+print(f"{'OK' if identical else 'XX'} - Tableaux reconstruits identiques aux copies du mode 'full'")
+
+# Simplexe dual avec des coûts négatifs : les coûts réduits négatifs sont ramenés
+# à 0 avant les pivots duaux, le tableau initial rejoué doit être celui-là
+c_neg, A_neg = [-3, 2, -1], [[1, 1, 1], [2, -1, 0], [0, 1, 3]]
+b_neg, signs_neg = [6, 2, 3], ['<=', '>=', '>=']
+full = SimplexSolver(c_neg, A_neg, b_neg, signs_neg, 'dual_simplex', False, history='full')
+full.solve()
+pivots = SimplexSolver(c_neg, A_neg, b_neg, signs_neg, 'dual_simplex', False, history='pivots')
+pivots.solve()
+identical = len(full.tableau_history) > 0 and all(
+    np.array_equal(pivots.rebuild_tableau(entry['phase'], entry['iteration']), entry['tableau'])
+    for entry in full.tableau_history
+)
+print(f"{'OK' if identical else 'XX'} - Simplexe dual, coûts négatifs: {len(full.tableau_history)} tableaux reconstruits")
+
+# Mode invalide
+try:
+    SimplexSolver(c, A, b, signs, 'two_phase', False, history='partial')
+    print("XX - Mode invalide accepté")
+except ValueError as e:
+    print(f"OK - {e}")
+
+# /solve : pas d'historique par défaut, journal des pivots sur demande
+client = app.test_client()
+# Sans presolve ni crash : les bornes simples seraient absorbées avant le simplexe
+data = {'c': c, 'A': A, 'b': b, 'signs': signs, 'method': 'two_phase', 'objective_type': 'min', 'presolve': False,
+        'crash': False}
+result = client.post('/solve', data=json.dumps(data), content_type='application/json').get_json()
+print(f"{'OK' if 'history' not in result else 'XX'} - /solve sans historique par défaut")
+data['history'] = 'pivots'
+result = client.post('/solve', data=json.dumps(data), content_type='application/json').get_json()
+print(f"{'OK' if len(result.get('history', [])) > 0 else 'XX'} - /solve avec history='pivots': {len(result.get('history', []))} pivots")
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Test de la méthode du point intérieur (Mehrotra) avec et sans crossover"""
+
+import json
+import numpy as np
+from app import SimplexSolver, app
+
+print("=" * 70)
+print("POINT INTÉRIEUR (PRÉDICTEUR-CORRECTEUR DE MEHROTRA)")
+print("=" * 70)
+
+cases = [
+    ("Max Z = 3x1 + 2x2, x1 + x2 <= 4, 2x1 + x2 <= 5",
+     [-3, -2], [[1, 1], [2, 1]], [4, 5], ['<=', '<='], -9.0, [1, 3]),
+    ("Min Z = 2x1 + 3x2, x1 + 2x2 >= 6, 2x1 + x2 >= 5",
+     [2, 3], [[1, 2], [2, 1]], [6, 5], ['>=', '>='], 9.6667, [1.3333, 2.3333]),
+    ("Min Z = x1 + x2, x1 + x2 = 5, x1 >= 2 (optimum non unique)",
+     [1, 1], [[1, 1], [1, 0]], [5, 2], ['=', '>='], 5.0, None),
+    ("Min Z = x1 + x2 + x3, lignes égalité redondantes",
+     [1, 1, 1], [[1, 1, 0], [1, 1, 0], [0, 1, 1]], [2, 2, 3], ['=', '=', '='], 3.0, None),
+]
+
+for name, c, A, b, signs, expected, vertex in cases:
+    print(f"\n{name}")
+    for crossover in (False, True):
+        result = SimplexSolver(c, A, b, signs, 'interior_point', False, crossover=crossover).solve()
+        if not result['success']:
+            print(f"XX - crossover={crossover}: {result['message']}")
+            continue
+        ok = abs(result['optimal_value'] - expected) < 1e-4
+        if crossover and vertex is not None:
+            ok = ok and np.allclose(result['solution'], vertex, atol=1e-4)
+        print(f"{'OK' if ok else 'XX'} - crossover={crossover}: Z = {result['optimal_value']:.4f}, "
+              f"x = {np.round(result['solution'], 4).tolist()}, {result['iterations']} itérations, {result['method']}")
+
+# Un sommet : au plus m variables non nulles après crossover
+print("\nOptimum non unique : Min Z = x1 + x2 + x3, x1 + x2 + x3 = 3")
+inner = SimplexSolver([1, 1, 1], [[1, 1, 1]], [3], ['='], 'interior_point', False, crossover=False).solve()
+vertex = SimplexSolver([1, 1, 1], [[1, 1, 1]], [3], ['='], 'interior_point', False, crossover=True).solve()
+print(f"Sans crossover: x = {np.round(inner['solution'], 4).tolist()}")
+print(f"{'OK' if np.count_nonzero(np.round(vertex['solution'], 8)) == 1 else 'XX'} - "
+      f"Avec crossover: x = {np.round(vertex['solution'], 4).tolist()}")
+
+# Problèmes sans solution : le simplexe révisé donne le diagnostic
+print("\nInfaisable / non borné")
+result = SimplexSolver([1, 1], [[1, 1], [1, 1]], [2, 5], ['<=', '>='], 'interior_point', False).solve()
+print(f"{'OK' if not result['success'] else 'XX'} - {result['message']}")
+result = SimplexSolver([-1, -1], [[1, -1]], [1], ['<='], 'interior_point', False).solve()
+print(f"{'OK' if not result['success'] else 'XX'} - {result['message']}")
+
+# Problème plus grand : peu d'itérations
+print("\nProblème aléatoire 300 x 600")
+rng = np.random.default_rng(0)
+A = rng.random((300, 600))
+b = rng.random(300) * 10 + 1
+c = -rng.random(600)
+ipm = SimplexSolver(c, A, b, ['<='] * 300, 'interior_point', False, history='off').solve()
+revised = SimplexSolver(c, A, b, ['<='] * 300, 'revised', False, history='off').solve()
+print(f"{'OK' if abs(ipm['optimal_value'] - revised['optimal_value']) < 1e-6 else 'XX'} - "
+      f"Z = {ipm['optimal_value']:.6f} ({ipm['iterations']} itérations), révisé: {revised['optimal_value']:.6f}")
+
+# /solve avec method='interior_point'
+client = app.test_client()
+data = {'c': [3, 2], 'A': [[1, 1], [2, 1]], 'b': [4, 5], 'signs': ['<=', '<='],
+        'method': 'interior_point', 'objective_type': 'max'}
+result = client.post('/solve', data=json.dumps(data), content_type='application/json').get_json()
+print(f"{'OK' if abs(result.get('optimal_value', 0) - 9) < 1e-6 else 'XX'} - /solve: Z = {result.get('optimal_value')}, "
+      f"solution = {result.get('solution')}")
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Test de la résolution avec plusieurs seconds membres (solve_multi_rhs, /solve/multi_rhs)"""
+
+import numpy as np
+from app import app, SimplexSolver, solve_multi_rhs
+
+print("=" * 70)
+print("SECONDS MEMBRES MULTIPLES")
+print("=" * 70)
+
+# Petits problèmes aléatoires (>=, =, b < 0, non réalisables, non bornés) contre HiGHS
+rng = np.random.default_rng(0)
+checked = failures = 0
+statuses = set()
+for _ in range(40):
+    m, n = rng.integers(2, 7), rng.integers(2, 7)
+    A = rng.integers(-3, 6, (m, n)).astype(float)
+    c = rng.integers(-5, 6, n).astype(float)
+    signs = list(rng.choice(['<=', '>=', '='], m, p=[.6, .3, .1]))
+    rhs = rng.integers(-5, 20, (m, 20)).astype(float)
+    result = solve_multi_rhs(c, A, rhs, signs, chunks=int(rng.integers(1, 4)))
+    for j in range(rhs.shape[1]):
+        reference = SimplexSolver(c, A, rhs[:, j], signs, 'highs', False).solve()
+        checked += 1
+        statuses.add(result['status'][j])
+        if reference['success']:
+            failures += not result['success'][j] or abs(reference['optimal_value'] - result['optimal_value'][j]) > 1e-6
+        else:
+            failures += bool(result['success'][j])
+print(f"{'OK' if failures == 0 else 'XX'} - {checked} seconds membres contre HiGHS, {failures} écart(s), "
+      f"statuts {sorted(statuses)}")
+
+# Modèle de planification : la base précédente sert de départ, quelques pivots duaux par colonne
+m, n = 40, 60
+A = rng.random((m, n))
+x0 = rng.random(n)
+signs = ['<='] * 30 + ['>='] * 10
+b = np.where(np.array(signs) == '<=', A @ x0 + 1, A @ x0 * 0.5)
+rhs = b[:, None] * rng.uniform(0.95, 1.05, (m, 200))
+c = -rng.random(n)
+result = solve_multi_rhs(c, A, rhs, signs)
+cold = SimplexSolver(c, A, rhs[:, 1], signs, 'dual_simplex', False, history='off').solve()
+print(f"{'OK' if result['success'].all() and result['pivots'][1:].mean() < cold['pivots'] / 2 else 'XX'} - "
+      f"Planification: {result['pivots'][0]} pivots pour la 1re colonne, {result['pivots'][1:].mean():.1f} "
+      f"en moyenne ensuite (à froid: {cold['pivots']})")
+print(f"{'OK' if result['solution'].shape == (200, n) and result['optimal_value'].shape == (200,) else 'XX'} - "
+      f"Résultats en tableaux: solution {result['solution'].shape}, optimal_value {result['optimal_value'].shape}")
+
+# Blocs, en parallèle, mise à l'échelle : mêmes valeurs
+parallel = solve_multi_rhs(c, A, rhs, signs, chunks=4, parallel=True, scaling='geometric')
+print(f"{'OK' if np.allclose(parallel['optimal_value'], result['optimal_value'], atol=1e-9) else 'XX'} - "
+      f"4 blocs en parallèle, mise à l'échelle: mêmes valeurs optimales")
+
+# Endpoint : maximisation, colonne non réalisable au milieu
+client = app.test_client()
+response = client.post('/solve/multi_rhs', json={'c': [3, 2], 'A': [[1, 1], [2, 1]], 'b': [[4, 5, -1, 6], [5, 5, 5, 5]],
+                                                 'signs': ['<=', '<='], 'objective_type': 'max'})
+data = response.get_json()
+ok = data['optimal_value'] == [9.0, 10.0, None, 10.0] and data['status'][2] == 'infeasible' and data['solution'][0] == [1.0, 3.0]
+print(f"{'OK' if ok else 'XX'} - /solve/multi_rhs: {data['optimal_value']}, {data['status']}")
+response = client.post('/solve/multi_rhs', json={'c': [3, 2], 'A': [[1, 1], [2, 1]], 'b': [[4, 5]],
+                                                 'signs': ['<=', '<=']})
+print(f"{'OK' if response.status_code == 400 else 'XX'} - Matrice de seconds membres mal dimensionnée: "
+      f"{response.get_json()['message']}")
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Test de l'analyse paramétrique (b + θ·d et c + θ·d)"""
+
+import numpy as np
+from app import app, SimplexSolver
+
+print("=" * 70)
+print("ANALYSE PARAMÉTRIQUE")
+print("=" * 70)
+
+client = app.test_client()
+# Max Z = 3x1 + 2x2, x1 + x2 <= 4 + θ, 2x1 + x2 <= 5 : Z = 9 + θ jusqu'à θ = 1, puis 10
+problem = {'c': [3, 2], 'A': [[1, 1], [2, 1]], 'b': [4, 5], 'signs': ['<=', '<='], 'objective_type': 'max'}
+result = client.post('/solve/parametric', json=dict(problem, parametric={'target': 'b', 'direction': [1, 0],
+                                                                        'theta': [0, 10]})).get_json()
+ok = result['breakpoints'] == [1.0] and np.allclose(result['value_function'], [[0, 9], [1, 10], [10, 10]])
+print(f"{'OK' if ok else 'XX'} - Second membre: points de rupture {result['breakpoints']}, "
+      f"fonction valeur {result['value_function']}")
+print(f"{'OK' if [segment['slope'] for segment in result['segments']] == [1.0, 0.0] else 'XX'} - "
+      f"Pentes (prix dual de la contrainte 1 sur chaque segment): {[segment['slope'] for segment in result['segments']]}")
+
+# Coûts : Z = (3 + θ)·x1 + 2·x2, la solution passe de (1, 3) à (2.5, 0) en θ = 1
+result = client.post('/solve/parametric', json=dict(problem, parametric={'target': 'c', 'direction': [1, 0],
+                                                                        'theta': [0, 10]})).get_json()
+ok = (np.allclose(result['value_function'], [[0, 9], [1, 10], [10, 32.5]])
+      and result['segments'][1]['solution'][0] == [2.5, 0.0])
+print(f"{'OK' if ok else 'XX'} - Coûts: fonction valeur {result['value_function']}, "
+      f"solution {result['segments'][1]['solution'][0]} après la rupture")
+
+# Arrêt : plus de solution au-delà d'un point de rupture
+result = client.post('/solve/parametric', json=dict(problem, signs=['<=', '>='], b=[4, 2], parametric={
+    'target': 'b', 'direction': [-1, 0], 'theta': [0, 10]})).get_json()
+print(f"{'OK' if result['stopped'] == 'infeasible' and result['theta'][1] == 3.0 else 'XX'} - {result['message']}")
+
+# Comparaison avec des résolutions à froid en θ échantillonnés
+rng = np.random.default_rng(0)
+checked = failures = 0
+for _ in range(120):
+    m, n = rng.integers(2, 7), rng.integers(2, 7)
+    A = rng.integers(-3, 6, (m, n)).astype(float)
+    b = rng.integers(-5, 20, m).astype(float)
+    c = rng.integers(-5, 6, n).astype(float)
+    signs = list(rng.choice(['<=', '>=', '='], m, p=[.6, .3, .1]))
+    target = str(rng.choice(['b', 'c']))
+    d = rng.integers(-3, 4, m if target == 'b' else n).astype(float)
+    result = SimplexSolver(c, A, b, signs, 'dual_simplex', False, history='off').parametric(d, target, (0, 5))
+    if not result['success']:
+        continue
+    checked += 1
+    for theta in np.linspace(0, result['theta'][1], 11):
+        reference = SimplexSolver(c + theta * d if target == 'c' else c, A, b + theta * d if target == 'b' else b,
+                                  signs, 'highs', False).solve()
+        segment = next(s for s in result['segments'] if s['theta'][0] - 1e-12 <= theta <= s['theta'][1] + 1e-12)
+        value = segment['value'][0] + (theta - segment['theta'][0]) * segment['slope']
+        failures += not reference['success'] or abs(reference['optimal_value'] - value) > 1e-6 * (1 + abs(value))
+print(f"{'OK' if checked > 30 and failures == 0 else 'XX'} - Résolutions à froid: {checked} problèmes, {failures} écart(s)")
+
+# Erreurs
+response = client.post('/solve/parametric', json=dict(problem, parametric={'target': 'b', 'direction': [1]}))
+print(f"{'OK' if response.status_code == 400 else 'XX'} - Direction de mauvaise taille: {response.get_json()['message']}")
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""Test de la transition phase 1 -> phase 2 (colonnes artificielles et lignes redondantes retirées)"""
+
+import numpy as np
+from app import SimplexSolver
+
+print("=" * 70)
+print("TRANSITION PHASE 1 -> PHASE 2")
+print("=" * 70)
+
+
+def phase2_shape(solver):
+    """Forme du tableau reçu par la phase 2"""
+    shapes = []
+    original = solver._solve_tableau
+
+    def record(tableau, phase_name, **options):
+        shapes.append((phase_name, tableau.shape))
+        return original(tableau, phase_name, **options)
+
+    solver._solve_tableau = record
+    result = solver.solve()
+    return result, [shape for phase, shape in shapes if phase.startswith('Phase 2')]
+
+
+# Ligne redondante : x1 + x2 = 4 apparaît deux fois
+print("\nMin Z = x1 + 2x2, x1 + x2 = 4 (deux fois), x1 <= 3")
+solver = SimplexSolver([1, 2], [[1, 1], [1, 1], [1, 0]], [4, 4, 3], ['=', '=', '<='], 'two_phase', False)
+result, shapes = phase2_shape(solver)
+print(f"{'OK' if result['success'] and abs(result['optimal_value'] - 5) < 1e-8 else 'XX'} - "
+      f"Z = {result.get('optimal_value')}, solution = {result.get('solution')}")
+# 3 lignes + objectif, 2 variables + 1 slack + 2 artificielles + RHS au départ
+print(f"{'OK' if shapes == [(3, 4)] else 'XX'} - Tableau de phase 2: {shapes} (au lieu de (4, 6))")
+
+# Artificielle restée en base à zéro (b = 0) : elle doit sortir par un pivot dégénéré
+print("\nMin Z = x1 + 2x2, x1 - x2 = 0, x1 + x2 <= 4")
+# (sans crash, x1 remplacerait directement l'artificielle)
+solver = SimplexSolver([1, 2], [[1, -1], [1, 1]], [0, 4], ['=', '<='], 'two_phase', False, crash=False)
+result, shapes = phase2_shape(solver)
+print(f"{'OK' if result['success'] and abs(result['optimal_value']) < 1e-8 else 'XX'} - "
+      f"Z = {result.get('optimal_value')}, solution = {result.get('solution')}")
+print(f"{'OK' if shapes == [(3, 4)] else 'XX'} - Tableau de phase 2: {shapes}")
+print(f"{'OK' if not np.isin(solver.basis, solver.artificial_vars).any() else 'XX'} - Plus d'artificielle dans la base")
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Test du presolve / postsolve de /solve"""
+
+from app import solve_problem
+
+print("=" * 70)
+print("PRESOLVE / POSTSOLVE")
+print("=" * 70)
+
+
+def check(label, data, expected, counts=None):
+    """Comparer la réponse avec et sans presolve"""
+    reference, _ = solve_problem(dict(data, signs=list(data['signs']), presolve=False))
+    result, _ = solve_problem(dict(data, signs=list(data['signs'])))
+    if expected is None:
+        ok = not result['success'] and not reference['success']
+        value = result['message']
+    else:
+        ok = (result['success'] and abs(result['optimal_value'] - expected) < 1e-8
+              and abs(reference['optimal_value'] - expected) < 1e-8)
+        value = result.get('optimal_value')
+    if counts:
+        ok = ok and all(result['presolve'][name] == count for name, count in counts.items())
+    print(f"{'OK' if ok else 'XX'} - {label}: {value} {result.get('presolve')}")
+
+
+# Bornes simples, ligne vide et lignes dupliquées (2x1 + 2x2 <= 8 est x1 + x2 <= 4)
+check("Bornes et doublons", {
+    'c': [4, 3], 'A': [[1, 1], [2, 2], [0, 0], [1, 0], [0, 1]], 'b': [4, 8, 0, 1, 5],
+    'signs': ['<=', '<=', '<=', '>=', '<='], 'objective_type': 'max', 'method': 'revised'
+}, 16, {'empty_rows': 1, 'singleton_rows': 2, 'duplicate_rows': 1})
+
+# Variable fixée par une égalité à un seul coefficient
+check("Variable fixée", {
+    'c': [2, 1, 3], 'A': [[1, 1, 1], [0, 2, 0]], 'b': [10, 4],
+    'signs': ['>=', '='], 'objective_type': 'min', 'method': 'two_phase'
+}, 18, {'singleton_rows': 1, 'fixed_variables': 1})
+
+# Colonne dominée : x3 coûte et ne sert qu'à remplir une contrainte <=
+check("Colonne dominée", {
+    'c': [1, 1, 5], 'A': [[1, 1, 0], [1, -1, 1]], 'b': [6, 2],
+    'signs': ['>=', '<='], 'objective_type': 'min', 'method': 'revised'
+}, 6, {'dominated_columns': 1})
+
+# Tout est résolu par le presolve
+check("Problème entièrement réduit", {
+    'c': [3, 2], 'A': [[1, 0], [0, 1]], 'b': [2, 3],
+    'signs': ['<=', '='], 'objective_type': 'max'
+}, 12)
+
+# Non réalisable détecté sans simplexe : doublons contradictoires
+check("Doublons contradictoires", {
+    'c': [1, 1], 'A': [[1, 1], [-2, -2]], 'b': [5, -12],
+    'signs': ['<=', '<='], 'objective_type': 'min', 'method': 'revised'
+}, None)
+
+# Non borné : x2 augmente le profit sans jamais gêner (puis x1 <= 3 est fixée à sa borne)
+check("Colonne non bornée", {
+    'c': [1, 1], 'A': [[1, -1]], 'b': [3],
+    'signs': ['<='], 'objective_type': 'max', 'method': 'revised'
+}, None, {'dominated_columns': 2})
+
+# Colonne non bornée qui aide une contrainte : x3 la satisfait toujours, donc le
+# problème est réalisable et non borné (et non pas non réalisable)
+result, _ = solve_problem({
+    'c': [2, -1, -4], 'A': [[0, -3, 1]], 'b': [-2], 'signs': ['<='], 'objective_type': 'min', 'method': 'revised'
+})
+print(f"{'OK' if not result['success'] and 'non borné' in result['message'] else 'XX'} - "
+      f"Colonne non bornée et contrainte qu'elle satisfait: {result['message']}")
+
+# Toutes les colonnes retirées, empty_rows désactivée : chaque ligne restante est
+# vérifiée avec son signe (x = 1/3 par l'égalité, puis -x >= 9 impossible)
+result, _ = solve_problem({
+    'c': [0], 'A': [[3], [-1]], 'b': [1, 9], 'signs': ['=', '>='], 'objective_type': 'min',
+    'presolve': {'empty_rows': False}
+})
+print(f"{'OK' if not result['success'] and 'réalisable' in result['message'] else 'XX'} - "
+      f"Lignes restantes sans colonne (empty_rows désactivée): {result['message']}")
+
+# Réductions désactivables une par une
+result, _ = solve_problem({
+    'c': [4, 3], 'A': [[1, 1], [2, 2]], 'b': [4, 8], 'signs': ['<=', '<='],
+    'objective_type': 'max', 'method': 'revised', 'presolve': {'duplicate_rows': False}
+})
+print(f"{'OK' if result['presolve']['duplicate_rows'] == 0 and result['presolve']['rows'] == 2 else 'XX'} - "
+      f"duplicate_rows désactivée: {result['presolve']}")
+
+result, status = solve_problem({
+    'c': [1], 'A': [[1]], 'b': [1], 'signs': ['<='], 'presolve': {'inconnue': True}
+})
+print(f"{'OK' if status == 400 else 'XX'} - Réduction inconnue refusée: {result['message']}")
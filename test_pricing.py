@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Test des règles de prix (dantzig, devex, steepest_edge, partial)"""
+
+import numpy as np
+from app import SimplexSolver, PRICING_RULES, PartialPricing, solve_problem
+
+print("=" * 70)
+print("RÈGLES DE PRIX")
+print("=" * 70)
+
+# Min Z = -x1 - x2 - x3 ... avec un mélange de <=, >= et =
+rng = np.random.default_rng(0)
+m, n = 30, 40
+A = rng.random((m, n))
+x0 = rng.random(n)
+signs = ['<='] * 20 + ['>='] * 8 + ['='] * 2
+b = np.concatenate([A[:20] @ x0 + 1, A[20:28] @ x0 * 0.5, A[28:] @ x0])
+c = -rng.random(n)
+reference = SimplexSolver(c, A, b, signs, 'highs', False).solve()['optimal_value']
+
+for method in ('two_phase', 'big_m', 'revised'):
+    for rule in PRICING_RULES:
+        result = SimplexSolver(c, A, b, signs, method, False, history='off', pricing=rule).solve()
+        ok = result['success'] and abs(result['optimal_value'] - reference) < 1e-6
+        print(f"{'OK' if ok else 'XX'} - {method} / {rule}: Z = {result.get('optimal_value')}, "
+              f"{result.get('iterations')} itérations")
+
+# Plus forte pente : les poids mis à jour restent égaux à 1 + ||B^-1 a_j||²
+solver = SimplexSolver(c, A[:20], b[:20], signs[:20], 'revised', False, history='off', pricing='steepest_edge')
+errors = []
+original = solver._revised_pivot
+
+
+def checked_pivot(A_std, b_std, basis, factor, x_B, pivot_row, pivot_col, alpha):
+    original(A_std, b_std, basis, factor, x_B, pivot_row, pivot_col, alpha)
+    full = A_std.toarray()
+    exact = 1 + np.sum(np.linalg.solve(full[:, basis], full) ** 2, axis=0)
+    nonbasic = np.setdiff1d(np.arange(full.shape[1]), basis)
+    errors.append(np.max(np.abs(exact[nonbasic] - solver.pricing.weights[nonbasic]) / exact[nonbasic]))
+
+
+solver._revised_pivot = checked_pivot
+solver.solve()
+print(f"{'OK' if errors and max(errors) < 1e-10 else 'XX'} - Poids exacts après {len(errors)} pivots "
+      f"(écart relatif max {max(errors):.1e})")
+
+# Instance personnalisée et /solve
+result = SimplexSolver(c, A, b, signs, 'revised', False, history='off', pricing=PartialPricing(segments=3)).solve()
+print(f"{'OK' if abs(result['optimal_value'] - reference) < 1e-6 else 'XX'} - PartialPricing(segments=3)")
+data = {'c': [3, 2], 'A': [[1, 1], [2, 1]], 'b': [4, 5], 'signs': ['<=', '<='], 'method': 'revised'}
+result, _ = solve_problem(dict(data, pricing='devex'))
+print(f"{'OK' if abs(result['optimal_value'] - 9) < 1e-9 else 'XX'} - /solve avec pricing='devex': Z = {result['optimal_value']}")
+result, status = solve_problem(dict(data, pricing='bland'))
+print(f"{'OK' if status == 400 else 'XX'} - Règle inconnue refusée: {result['message']}")
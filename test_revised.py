@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Test du simplexe révisé (method='revised') contre les méthodes du tableau"""
+
+import numpy as np
+from app import SimplexSolver
+
+print("=" * 70)
+print("SIMPLEXE RÉVISÉ")
+print("=" * 70)
+
+cases = [
+    # (nom, c, A, b, signs, is_max, valeur attendue de Z)
+    ("Max Z = 3x1 + 2x2, x1 + x2 <= 4, 2x1 + x2 <= 5",
+     [3, 2], [[1, 1], [2, 1]], [4, 5], ['<=', '<='], True, 9.0),
+    ("Min Z = 2x1 + 3x2, x1 + 2x2 >= 6, 2x1 + x2 >= 5",
+     [2, 3], [[1, 2], [2, 1]], [6, 5], ['>=', '>='], False, 9.6667),
+    ("Min Z = x1 + x2, x1 + x2 = 5, x1 >= 2",
+     [1, 1], [[1, 1], [1, 0]], [5, 2], ['=', '>='], False, 5.0),
+    ("Min Z = 5x1 + 9x2 + 14x3, x1 >= 3, x2 >= 104, x3 >= 37",
+     [5, 9, 14], [[1, 0, 0], [0, 1, 0], [0, 0, 1]], [3, 104, 37], ['>=', '>=', '>='], False, 1469.0),
+]
+
+for name, c, A, b, signs, is_max, expected in cases:
+    c_to_use = [-ci for ci in c] if is_max else c
+    solver = SimplexSolver(c_to_use, A, b, signs, 'revised', is_max)
+    result = solver.solve()
+    print(f"\n{name}")
+    if not result['success']:
+        print(f"XX - Erreur: {result['message']}")
+        continue
+    z = -result['optimal_value'] if is_max else result['optimal_value']
+    status = "OK" if abs(z - expected) < 1e-3 else "XX"
+    print(f"{status} - Z = {z:.4f} (attendu {expected}), solution = {np.round(result['solution'], 4).tolist()}, "
+          f"{result['iterations']} itérations")
+
+# Problème infaisable
+print("\nInfaisable: x1 + x2 <= 2, x1 + x2 >= 5")
+result = SimplexSolver([1, 1], [[1, 1], [1, 1]], [2, 5], ['<=', '>='], 'revised', False).solve()
+print(f"{'OK' if not result['success'] else 'XX'} - {result['message']}")
+
+# Problème non borné
+print("\nNon borné: Max Z = x1 + x2, x1 - x2 <= 1")
+result = SimplexSolver([-1, -1], [[1, -1]], [1], ['<='], 'revised', True).solve()
+print(f"{'OK' if not result['success'] else 'XX'} - {result['message']}")
+
+# Problème plus grand avec refactorisation (plus de 50 pivots)
+print("\nProblème aléatoire 100 x 100 avec >= (refactorisation de la base)")
+rng = np.random.default_rng(0)
+A = rng.random((100, 100))
+b = rng.random(100) * 10 + 1
+c = rng.random(100)
+result = SimplexSolver(c, A, b, ['>='] * 100, 'revised', False).solve()
+x = np.array(result['solution'])
+feasible = np.all(A @ x >= b - 1e-6) and np.all(x >= -1e-9)
+print(f"{'OK' if result['success'] and feasible else 'XX'} - Z = {result.get('optimal_value', 0):.6f}, "
+      f"{result.get('iterations')} itérations, réalisable = {feasible}")
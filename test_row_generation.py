@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Test de la génération de contraintes à la demande (rappel de séparation)"""
+
+import numpy as np
+from scipy.optimize import linprog
+from app import RowGeneration
+
+print("=" * 70)
+print("GÉNÉRATION DE LIGNES")
+print("=" * 70)
+
+
+def family(P, q, kinds, count=5):
+    """Rappel de séparation : les `count` contraintes les plus violées de la famille"""
+    def separation(x):
+        lhs = P @ x
+        excess = np.where(kinds == '<=', lhs - q, np.where(kinds == '>=', q - lhs, np.abs(lhs - q)))
+        return [{'coefficients': P[i], 'sign': kinds[i], 'rhs': q[i]} for i in np.argsort(-excess)[:count]
+                if excess[i] > 1e-9]
+    return separation
+
+
+# Grande famille de <= (2000 lignes, 8 variables), départ : 0 <= x <= 10
+rng = np.random.default_rng(0)
+n, M = 8, 2000
+P = rng.normal(size=(M, n))
+q = P @ rng.random(n) + rng.random(M) + 0.1
+c = -rng.random(n)
+kinds = np.array(['<='] * M, dtype=object)
+reference = linprog(c, A_ub=np.vstack([P, np.eye(n)]), b_ub=np.concatenate([q, np.full(n, 10.0)]), method='highs')
+result = RowGeneration(c, np.eye(n), np.full(n, 10.0), ['<='] * n, family(P, q, kinds)).solve()
+x = np.array(result['solution'])
+ok = abs(result['optimal_value'] - reference.fun) < 1e-6 and np.all(P @ x <= q + 1e-6)
+print(f"{'OK' if ok else 'XX'} - {M} contraintes: Z = {result['optimal_value']:.6f}, {result['rows_added']} ajoutées "
+      f"en {result['rounds']} tours, {result['pivots']} pivots")
+values = result['objective_values']
+print(f"{'OK' if all(b >= a - 1e-9 for a, b in zip(values, values[1:])) else 'XX'} - Valeur croissante à chaque tour")
+
+# Plafond de lignes : les contraintes lâches sont retirées
+result = RowGeneration(c, np.eye(n), np.full(n, 10.0), ['<='] * n, family(P, q, kinds), max_rows=n + 6).solve()
+ok = (abs(result['optimal_value'] - reference.fun) < 1e-6 and result['rows_purged'] > 0
+      and len(result['rows']) == result['rows_added'] - result['rows_purged'])
+print(f"{'OK' if ok else 'XX'} - Plafond de {n + 6} lignes: {result['rows_purged']} retirées, "
+      f"{len(result['rows'])} gardées, même optimum")
+
+# Familles mixtes (<=, >=, =), plafond et mise à l'échelle, contre le problème complet
+failures = 0
+for trial in range(40):
+    n, M = 6, 300
+    P = rng.integers(-3, 6, (M, n)).astype(float)
+    lhs = P @ (rng.random(n) * 3)
+    kinds = rng.choice(np.array(['<=', '>=', '='], dtype=object), M, p=[.45, .45, .1])
+    q = np.where(kinds == '<=', lhs + rng.random(M), np.where(kinds == '>=', lhs - rng.random(M), lhs))
+    c = rng.normal(size=n)
+    equal = kinds == '='
+    reference = linprog(c, A_ub=np.vstack([P[kinds == '<='], -P[kinds == '>='], np.eye(n)]),
+                        b_ub=np.concatenate([q[kinds == '<='], -q[kinds == '>='], np.full(n, 10.0)]),
+                        A_eq=P[equal] if equal.any() else None, b_eq=q[equal] if equal.any() else None, method='highs')
+    result = RowGeneration(c, np.eye(n), np.full(n, 10.0), ['<='] * n, family(P, q, kinds, 3), max_rows=n + 6,
+                           scaling='geometric' if trial % 2 else None).solve()
+    if reference.status == 0:
+        failures += not result['success'] or abs(result['optimal_value'] - reference.fun) > 1e-6
+    else:
+        failures += result['success']
+print(f"{'OK' if failures == 0 else 'XX'} - 40 familles mixtes contre le problème complet, {failures} écart(s)")
+
+# Contrainte générée impossible à satisfaire
+result = RowGeneration([1, 1], np.eye(2), [1, 1], ['<='] * 2,
+                       lambda x: [{'coefficients': [1, 1], 'sign': '>=', 'rhs': 3}]).solve()
+print(f"{'OK' if not result['success'] else 'XX'} - Contrainte violée impossible: {result['message']}")
+try:
+    RowGeneration([1, 1], np.eye(2), [1, 1], ['<='] * 2,
+                  lambda x: [{'coefficients': [1, 1], 'sign': '<', 'rhs': 1}]).solve()
+    print("XX - Signe invalide accepté")
+except ValueError as error:
+    print(f"OK - Signe invalide: {error}")
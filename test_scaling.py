@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""Test de la mise à l'échelle (equilibrate / geometric) et du retour à l'échelle d'origine"""
+
+import numpy as np
+import scipy.sparse as sp
+from app import SimplexSolver, solve_problem
+
+print("=" * 70)
+print("MISE À L'ÉCHELLE")
+print("=" * 70)
+
+# Max Z = 3x1 + 2x2 avec des lignes d'ordres de grandeur très différents
+c = [3, 2]
+A = [[1e-3, 1e-3], [2e6, 1e6]]
+b = [4e-3, 5e6]
+signs = ['<=', '<=']
+
+for method in ('revised', 'interior_point', 'highs'):
+    for scaling in ('equilibrate', 'geometric'):
+        solver = SimplexSolver([-v for v in c], A, b, signs, method, False, history='off', scaling=scaling)
+        result = solver.solve()
+        ok = (result['success'] and abs(result['optimal_value'] + 9) < 1e-7
+              and np.allclose(result['solution'], [1, 3]))
+        print(f"{'OK' if ok else 'XX'} - {method} / {scaling}: Z = {-result['optimal_value']}, x = {result['solution']}")
+
+# Facteurs en puissances de 2 : A mise à l'échelle puis ramenée est exactement A
+solver = SimplexSolver(c, A, b, signs, 'revised', False, scaling='geometric')
+powers = np.log2(np.concatenate([solver.row_scale, solver.col_scale]))
+restored = solver.A / solver.row_scale[:, None] / solver.col_scale
+print(f"{'OK' if np.all(powers == np.round(powers)) and np.array_equal(restored, np.array(A)) else 'XX'} - "
+      f"Facteurs puissances de 2, retour exact: lignes {solver.row_scale}, colonnes {solver.col_scale}")
+
+# Matrice creuse : même résultat, A reste creuse
+solver = SimplexSolver([-3, -2], sp.csr_matrix(A), b, signs, 'revised', False, history='off', scaling='equilibrate')
+result = solver.solve()
+print(f"{'OK' if sp.issparse(solver.A) and abs(result['optimal_value'] + 9) < 1e-7 else 'XX'} - "
+      f"Matrice creuse: Z = {-result['optimal_value']}")
+
+# /solve
+result, _ = solve_problem({'c': c, 'A': A, 'b': b, 'signs': signs, 'method': 'revised', 'scaling': 'geometric'})
+print(f"{'OK' if result['success'] and abs(result['optimal_value'] - 9) < 1e-7 else 'XX'} - "
+      f"/solve avec scaling: Z = {result.get('optimal_value')}")
+result, status = solve_problem({'c': c, 'A': A, 'b': b, 'signs': signs, 'scaling': 'max'})
+print(f"{'OK' if status == 400 else 'XX'} - Mise à l'échelle inconnue refusée: {result['message']}")
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Test de l'analyse de sensibilité (prix duaux, coûts réduits, intervalles)"""
+
+import numpy as np
+from app import SimplexSolver, solve_problem
+
+print("=" * 70)
+print("ANALYSE DE SENSIBILITÉ")
+print("=" * 70)
+
+# Max Z = 3x1 + 2x2, x1 + x2 <= 4, 2x1 + x2 <= 5 : x = (1, 3), Z = 9
+data = {'c': [3, 2], 'A': [[1, 1], [2, 1]], 'b': [4, 5], 'signs': ['<=', '<='], 'objective_type': 'max',
+        'sensitivity': True}
+result, _ = solve_problem(data)
+report = result['sensitivity']
+expected = {'shadow_prices': [1, 1], 'reduced_costs': [0, 0],
+            'rhs_ranges': [[2.5, 5], [4, 8]], 'cost_ranges': [[2, 4], [1.5, 3]]}
+for key, values in expected.items():
+    ok = np.allclose(np.array(report[key], dtype=float), values)
+    print(f"{'OK' if ok else 'XX'} - {key}: {report[key]}")
+
+# Variable hors base : coût réduit et intervalle ouvert vers le haut (min) / bas (max)
+data = {'c': [3, 2, 1], 'A': [[1, 1, 1], [2, 1, 1]], 'b': [4, 5], 'signs': ['<=', '<='], 'objective_type': 'max',
+        'sensitivity': True}
+report = solve_problem(data)[0]['sensitivity']
+print(f"{'OK' if abs(report['reduced_costs'][2] + 1) < 1e-9 and report['cost_ranges'][2][0] is None and abs(report['cost_ranges'][2][1] - 2) < 1e-9 else 'XX'} - "
+      f"x3 hors base: coût réduit {report['reduced_costs'][2]}, c3 dans {report['cost_ranges'][2]}")
+
+# Vérification par différences finies sur des problèmes aléatoires (>=, =, b < 0, min et max)
+rng = np.random.default_rng(0)
+checked = failures = 0
+for _ in range(100):
+    m, n = rng.integers(2, 7), rng.integers(2, 7)
+    A = rng.integers(-3, 6, (m, n)).astype(float)
+    b = rng.integers(-5, 20, m).astype(float)
+    c = rng.integers(-5, 6, n).astype(float)
+    signs = list(rng.choice(['<=', '>=', '='], m, p=[.6, .3, .1]))
+    data = {'c': c.tolist(), 'A': A.tolist(), 'b': b.tolist(), 'signs': signs, 'sensitivity': True,
+            'objective_type': str(rng.choice(['min', 'max'])),
+            'method': str(rng.choice(['two_phase', 'big_m', 'revised', 'dual_simplex']))}
+    result, _ = solve_problem(data)
+    if not result.get('success'):
+        continue
+    checked += 1
+    report, z, x = result['sensitivity'], result['optimal_value'], np.array(result['solution'])
+    # Au milieu de chaque intervalle : Z suit le prix dual (b) ou la solution ne change pas (c)
+    for i, (low, high) in enumerate(report['rhs_ranges']):
+        for end in (low, high):
+            if end is not None and abs(end - b[i]) > 1e-9:
+                moved = b.copy()
+                moved[i] = (b[i] + end) / 2
+                other, _ = solve_problem(dict(data, b=moved.tolist(), method='highs', sensitivity=False))
+                failures += abs(other['optimal_value'] - z - report['shadow_prices'][i] * (moved[i] - b[i])) > 1e-6
+    for j, (low, high) in enumerate(report['cost_ranges']):
+        for end in (low, high):
+            if end is not None and abs(end - c[j]) > 1e-9:
+                moved = c.copy()
+                moved[j] = (c[j] + end) / 2
+                other, _ = solve_problem(dict(data, c=moved.tolist(), method='highs', sensitivity=False))
+                failures += abs(other['optimal_value'] - moved @ x) > 1e-6
+print(f"{'OK' if checked > 30 and failures == 0 else 'XX'} - Différences finies: {checked} problèmes, {failures} écart(s)")
+
+# Grand M terminé avec une variable artificielle en base à 0 : même analyse que
+# les autres méthodes, vérifiée par différences finies
+data = {'c': [2, 3, 1, 2, 5], 'A': [[0, 3, 1, 4, 0], [5, 5, 0, 4, 2], [5, 3, 5, 0, 3], [4, 0, 4, 5, 5], [3, 2, 5, 2, 1]],
+        'b': [9, 8, 4, 1, 8], 'signs': ['<=', '<=', '<=', '>=', '='], 'objective_type': 'min', 'method': 'big_m',
+        'sensitivity': True}
+result, _ = solve_problem(data)
+report, b = result['sensitivity'], np.array(data['b'], dtype=float)
+reference = solve_problem(dict(data, method='two_phase'))[0]['sensitivity']
+ok = np.allclose(report['reduced_costs'], [3, 3.4, 0, 0, 6.4]) and np.allclose(report['shadow_prices'], reference['shadow_prices'])
+for i, (low, high) in enumerate(report['rhs_ranges']):
+    for end in (low, b[i] + 10 if high is None else high):
+        if end is not None and abs(end - b[i]) > 1e-9:
+            moved = b.copy()
+            moved[i] = (b[i] + end) / 2
+            other, _ = solve_problem(dict(data, b=moved.tolist(), sensitivity=False))
+            ok = ok and abs(other['optimal_value'] - result['optimal_value']
+                            - report['shadow_prices'][i] * (moved[i] - b[i])) < 1e-6
+print(f"{'OK' if ok else 'XX'} - Grand M, artificielle en base à 0: coûts réduits {np.round(report['reduced_costs'], 6).tolist()}, "
+      f"prix duaux {np.round(report['shadow_prices'], 6).tolist()}")
+
+# Mise à l'échelle : valeurs ramenées aux données d'origine
+c = rng.random(8)
+A = rng.random((6, 8)) * 10.0 ** rng.integers(-2, 3, (6, 8))
+b = rng.random(6) * 10
+signs = ['<='] * 4 + ['>=', '=']
+plain = SimplexSolver(c, A, b, signs, 'two_phase', False)
+scaled = SimplexSolver(c, A, b, signs, 'two_phase', False, scaling='geometric')
+if plain.solve()['success'] and scaled.solve()['success']:
+    ok = np.allclose(plain.sensitivity()['shadow_prices'], scaled.sensitivity()['shadow_prices'], atol=1e-8)
+    print(f"{'OK' if ok else 'XX'} - Mise à l'échelle: mêmes prix duaux")
+else:
+    print("XX - Mise à l'échelle: problème non résolu")
+
+# Sans "sensitivity" : pas de bloc ; sans base (HiGHS, point intérieur sans crossover) : message
+data = {'c': [3, 2], 'A': [[1, 1], [2, 1]], 'b': [4, 5], 'signs': ['<=', '<='], 'objective_type': 'max'}
+print(f"{'OK' if 'sensitivity' not in solve_problem(data)[0] else 'XX'} - Pas de bloc par défaut")
+for options in ({'method': 'highs'}, {'method': 'interior_point', 'crossover': False}):
+    report = solve_problem(dict(data, sensitivity=True, **options))[0].get('sensitivity', {})
+    print(f"{'OK' if list(report) == ['message'] else 'XX'} - {options['method']}: {report.get('message')}")
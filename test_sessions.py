@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Test des sessions de résolution (/sessions)"""
+
+import numpy as np
+import app as simplex
+from app import app
+
+print("=" * 70)
+print("SESSIONS")
+print("=" * 70)
+
+client = app.test_client()
+rng = np.random.default_rng(0)
+m, n = 40, 60
+A = rng.random((m, n))
+x0 = rng.random(n)
+b = A @ x0 + 1
+c = rng.random(n)
+model = {'c': c.tolist(), 'A': A.tolist(), 'b': b.tolist(), 'signs': ['<='] * m,
+         'objective_type': 'max', 'method': 'two_phase'}
+
+
+def reference(c, A, b, signs):
+    result, _ = simplex.solve_problem({'c': list(c), 'A': np.asarray(A).tolist(), 'b': list(b),
+                                       'signs': signs, 'objective_type': 'max', 'method': 'highs'})
+    return result['optimal_value']
+
+
+response = client.post('/sessions', json=model)
+created = response.get_json()
+session_id = created['session_id']
+print(f"{'OK' if response.status_code == 201 and created['success'] else 'XX'} - "
+      f"Session créée: {created['pivots']} pivots à froid, Z = {created['optimal_value']:.6f}")
+
+
+def patch(label, delta, expected):
+    response = client.patch(f'/sessions/{session_id}', json=delta)
+    result = response.get_json()
+    ok = (response.status_code == 200 and abs(result['optimal_value'] - expected) < 1e-6
+          and result['pivots'] < created['pivots'] / 2)
+    print(f"{'OK' if ok else 'XX'} - {label}: {result['pivots']} pivots, Z = {result['optimal_value']:.6f}")
+    return result
+
+
+# Second membre, coûts et coefficients modifiés
+b[:5] *= 0.9
+patch("Second membre (indices)", {'b': {str(i): b[i] for i in range(5)}}, reference(c, A, b, ['<='] * m))
+c[3] += 0.1
+patch("Coût (indice)", {'c': {'3': c[3]}}, reference(c, A, b, ['<='] * m))
+A[2, 7] += 0.3
+patch("Coefficient A[2, 7]", {'A': [[2, 7, A[2, 7]]]}, reference(c, A, b, ['<='] * m))
+
+# Contrainte ajoutée puis retirée, variable ajoutée
+row = np.ones(n)
+A2, b2 = np.vstack([A, row]), np.append(b, 0.9 * row @ x0)
+patch("Contrainte ajoutée", {'add_constraints': [{'coefficients': row.tolist(), 'sign': '<=', 'rhs': b2[-1]}]},
+      reference(c, A2, b2, ['<='] * (m + 1)))
+patch("Contrainte retirée", {'remove_constraints': [m]}, reference(c, A, b, ['<='] * m))
+column = rng.random(m)
+patch("Variable ajoutée", {'add_variables': [{'cost': 0.8, 'coefficients': column.tolist()}]},
+      reference(np.append(c, 0.8), np.hstack([A, column[:, None]]), b, ['<='] * m))
+
+response = client.get(f'/sessions/{session_id}')
+problem = response.get_json()['problem']
+print(f"{'OK' if len(problem['c']) == n + 1 and len(problem['A']) == m and problem['basis'] else 'XX'} - "
+      f"GET: modèle courant {len(problem['A'])}x{len(problem['c'])} avec sa base")
+
+# Erreurs
+response = client.patch(f'/sessions/{session_id}', json={'b': {str(m + 5): 1}})
+print(f"{'OK' if response.status_code == 400 else 'XX'} - Indice hors limites refusé: {response.get_json()['message']}")
+# Modification refusée : la session garde son modèle et accepte la suivante
+response = client.patch(f'/sessions/{session_id}', json={'signs': {'0': '<>'}})
+signs = client.get(f'/sessions/{session_id}').get_json()['problem']['signs']
+print(f"{'OK' if response.status_code == 400 and signs == ['<='] * m else 'XX'} - "
+      f"Signe invalide refusé sans modifier la session: {response.get_json()['message']}")
+patch("Modification après un refus", {'b': {'0': b[0]}},
+      reference(np.append(c, 0.8), np.hstack([A, column[:, None]]), b, ['<='] * m))
+response = client.delete(f'/sessions/{session_id}')
+print(f"{'OK' if response.status_code == 200 else 'XX'} - Session supprimée")
+response = client.patch(f'/sessions/{session_id}', json={'c': [1] * n})
+print(f"{'OK' if response.status_code == 404 else 'XX'} - Session inconnue: {response.status_code}")
+
+# Matrice creuse
+sparse = {'c': [3, 2], 'A': {'format': 'coo', 'shape': [2, 2], 'row': [0, 0, 1, 1], 'col': [0, 1, 0, 1],
+                             'data': [1, 1, 2, 1]}, 'b': [4, 5], 'signs': ['<=', '<='], 'objective_type': 'max'}
+session_id = client.post('/sessions', json=sparse).get_json()['session_id']
+result = client.patch(f'/sessions/{session_id}', json={'b': [4, 6]}).get_json()
+print(f"{'OK' if abs(result['optimal_value'] - 10) < 1e-9 else 'XX'} - "
+      f"Session creuse: Z = {result['optimal_value']}, {result['pivots']} pivots")
+
+# Durée de vie et limite mémoire
+ttl = simplex.SESSION_TTL
+simplex.SESSION_TTL = -1
+response = client.get(f'/sessions/{session_id}')
+simplex.SESSION_TTL = ttl
+print(f"{'OK' if response.status_code == 404 else 'XX'} - Session expirée retirée")
+
+limit = simplex.SESSION_MEMORY_LIMIT
+simplex.SESSION_MEMORY_LIMIT = A.nbytes + 2000
+first = client.post('/sessions', json=model).get_json()['session_id']
+second = client.post('/sessions', json=model).get_json()['session_id']
+evicted = client.get(f'/sessions/{first}').status_code
+kept = client.get(f'/sessions/{second}').status_code
+simplex.SESSION_MEMORY_LIMIT = 1000
+too_large = client.post('/sessions', json=model).status_code
+simplex.SESSION_MEMORY_LIMIT = limit
+print(f"{'OK' if (evicted, kept, too_large) == (404, 200, 413) else 'XX'} - "
+      f"Limite mémoire: plus ancienne retirée ({evicted}), récente gardée ({kept}), modèle trop gros ({too_large})")
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Test des matrices creuses (CSR/CSC/COO) pour SimplexSolver et /solve"""
+
+import json
+import numpy as np
+import scipy.sparse as sp
+from app import SimplexSolver, StandardFormMatrix, app
+
+print("=" * 70)
+print("MATRICES CREUSES")
+print("=" * 70)
+
+# Min Z = 2x1 + 3x2, x1 + 2x2 >= 6, 2x1 + x2 >= 5, x1 <= 10  ->  Z = 9.6667
+c = [2, 3]
+A = [[1, 2], [2, 1], [1, 0]]
+b = [6, 5, 10]
+signs = ['>=', '>=', '<=']
+
+for fmt in ['csr', 'csc', 'coo']:
+    A_sparse = sp.coo_matrix(A).asformat(fmt)
+    result = SimplexSolver(c, A_sparse, b, signs, 'revised', False).solve()
+    status = "OK" if result['success'] and abs(result['optimal_value'] - 9.6667) < 1e-3 else "XX"
+    print(f"{status} - {fmt}: Z = {result.get('optimal_value', 0):.4f}, solution = {np.round(result.get('solution', []), 4).tolist()}")
+
+# Les méthodes du tableau acceptent aussi une matrice creuse (même résultat qu'en dense)
+result_sparse = SimplexSolver(c, sp.csr_matrix(A), b, signs, 'two_phase', False).solve()
+result_dense = SimplexSolver(c, A, b, signs, 'two_phase', False).solve()
+print(f"{'OK' if result_sparse == result_dense else 'XX'} - two_phase (csr) identique au dense")
+
+# Forme standard implicite : mêmes colonnes que convert_to_standard_form
+solver = SimplexSolver(c, sp.csr_matrix(A), b, signs, 'revised', False)
+A_dense, _ = solver.convert_to_standard_form()
+A_implicit, _ = solver.implicit_standard_form()
+print(f"{'OK' if np.allclose(A_dense, A_implicit.toarray()) else 'XX'} - Forme standard implicite identique")
+
+# Envoi JSON au format COO, avec un b négatif (inversion de la ligne)
+client = app.test_client()
+coo = sp.coo_matrix([[1, 2], [-2, -1], [1, 0]])
+data = {
+    'c': c,
+    'A': {'format': 'coo', 'shape': list(coo.shape),
+          'row': coo.row.tolist(), 'col': coo.col.tolist(), 'data': coo.data.tolist()},
+    'b': [6, -5, 10],
+    'signs': ['>=', '<=', '<='],
+    'method': 'revised',
+    'objective_type': 'min'
+}
+response = client.post('/solve', data=json.dumps(data), content_type='application/json')
+result = response.get_json()
+print(f"{'OK' if result.get('success') and abs(result['optimal_value'] - 9.6667) < 1e-3 else 'XX'} - "
+      f"/solve COO: HTTP {response.status_code}, Z = {result.get('optimal_value')}")
+
+csr = sp.csr_matrix(A)
+data['A'] = {'format': 'csr', 'shape': list(csr.shape),
+             'data': csr.data.tolist(), 'indices': csr.indices.tolist(), 'indptr': csr.indptr.tolist()}
+data['b'] = b
+data['signs'] = signs
+result = client.post('/solve', data=json.dumps(data), content_type='application/json').get_json()
+print(f"{'OK' if result.get('success') and abs(result['optimal_value'] - 9.6667) < 1e-3 else 'XX'} - "
+      f"/solve CSR: Z = {result.get('optimal_value')}")
+
+# Problème creux plus grand (densité 3 %)
+print("\nProblème creux 300 x 600, densité 3 %")
+rng = np.random.default_rng(0)
+A = sp.random(300, 600, density=0.03, random_state=1, format='csr')
+b = rng.random(300) * 10 + 1
+c = -rng.random(600)
+result = SimplexSolver(c, A, b, ['<='] * 300, 'revised', False).solve()
+x = np.array(result['solution'])
+feasible = np.all(A @ x <= b + 1e-6) and np.all(x >= -1e-9)
+print(f"{'OK' if result['success'] and feasible else 'XX'} - Z = {result.get('optimal_value', 0):.6f}, "
+      f"{result.get('iterations')} itérations, réalisable = {feasible}")
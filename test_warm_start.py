@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Test du démarrage à chaud (export_basis / basis=...)"""
+
+import json
+import numpy as np
+from app import SimplexSolver, solve_problem
+
+print("=" * 70)
+print("DÉMARRAGE À CHAUD")
+print("=" * 70)
+
+rng = np.random.default_rng(0)
+m, n = 40, 60
+A = rng.random((m, n))
+x0 = rng.random(n)
+signs = ['<='] * 30 + ['>='] * 10
+b = np.concatenate([A[:30] @ x0 + 1, A[30:] @ x0 * 0.5])
+c = -rng.random(n)
+
+cold = SimplexSolver(c, A, b, signs, 'two_phase', False, history='off').solve()
+basis = json.loads(json.dumps(cold['basis']))
+print(f"{'OK' if len(basis['variables']) == n and len(basis['constraints']) == m else 'XX'} - "
+      f"Base exportée (JSON): {basis['variables'].count('basic')} variables de base, "
+      f"{basis['constraints'].count('at_lower')} contraintes serrées")
+
+
+def resolve(label, c, A, b, signs, expected_phase):
+    reference = SimplexSolver(c, A, b, signs, 'highs', False).solve()
+    cold = SimplexSolver(c, A, b, signs, 'two_phase', False, history='off').solve()
+    solver = SimplexSolver(c, A, b, signs, 'two_phase', False, history='pivots', basis=basis)
+    warm = solver.solve()
+    phases = sorted({entry['phase'] for entry in solver.pivot_history})
+    ok = (warm['success'] and abs(warm['optimal_value'] - reference['optimal_value']) < 1e-6
+          and len(solver.pivot_history) < cold['iterations'] / 2 and phases in ([], [expected_phase]))
+    print(f"{'OK' if ok else 'XX'} - {label}: {len(solver.pivot_history)} pivots à chaud contre "
+          f"{cold['iterations']} itérations à froid, {phases or 'aucun pivot'}")
+
+
+# Second membre modifié : la base reste duale réalisable -> simplexe dual
+b2 = b.copy()
+b2 *= np.random.default_rng(1).uniform(0.9, 1.1, m)
+resolve("Second membre modifié", c, A, b2, signs, "Démarrage à chaud")
+
+# Coûts modifiés : la base reste réalisable -> simplexe primal
+c2 = c.copy()
+c2[:10] *= 1.5
+resolve("Coûts modifiés", c2, A, b, signs, "Démarrage à chaud - Primal")
+
+# Nouvelle contrainte : statut 'basic' par défaut, coupée par le simplexe dual
+A3 = np.vstack([A, np.ones(n)])
+b3 = np.append(b, 0.97 * np.ones(n) @ np.array(cold['solution']))
+resolve("Contrainte ajoutée", c, A3, b3, signs + ['<='], "Démarrage à chaud")
+
+# Même base sur d'autres moteurs
+for method in ('big_m', 'revised', 'dual_simplex'):
+    result = SimplexSolver(c, A, b, signs, method, False, history='off', basis=basis).solve()
+    # Une seule itération : le test d'optimalité, sans pivot
+    print(f"{'OK' if result['iterations'] == 1 and abs(result['optimal_value'] - cold['optimal_value']) < 1e-9 else 'XX'} - "
+          f"{method}: base optimale réutilisée telle quelle ({result['iterations']} itération)")
+
+# Base singulière ou incomplète : réparée par des écarts
+result = SimplexSolver(c, A, b, signs, 'two_phase', False, history='off',
+                       basis={'variables': ['basic'] * n, 'constraints': []}).solve()
+print(f"{'OK' if abs(result['optimal_value'] - cold['optimal_value']) < 1e-6 else 'XX'} - "
+      f"Base réparée ({n} variables 'basic' pour {m} lignes): Z = {result['optimal_value']:.6f}")
+
+# /solve : la base renvoyée sert au problème modifié
+data = {'c': [3, 2], 'A': [[1, 1], [2, 1]], 'b': [4, 5], 'signs': ['<=', '<=']}
+first, _ = solve_problem(data)
+second, _ = solve_problem(dict(data, b=[4, 6], basis=first['basis']))
+print(f"{'OK' if abs(second['optimal_value'] - 10) < 1e-9 and second['iterations'] <= 1 else 'XX'} - "
+      f"/solve avec basis: Z = {second['optimal_value']}, {second['iterations']} itération")
+result, status = solve_problem(dict(data, basis={'variables': ['free', 'basic']}))
+print(f"{'OK' if status == 400 else 'XX'} - Statut inconnu refusé: {result['message']}")